@@ -3,36 +3,60 @@
 
 import os
 import argparse
+import copy
+import csv
+import functools
+import importlib.util
+import inspect
+import io
+import itertools
+import queue
 import sys
+import threading
 import time
 import logging
 from logging import config
 import subprocess
 import json
-import pandas as pd
+import hashlib
 import requests
-import gzip
 import re
-import xml.etree.ElementTree as ET
+import uuid
+try:
+    # lxml parses considerably faster, fall back to
+    # standard library if it is not installed
+    from lxml import etree as ET
+except ImportError:  # pragma: no cover
+    import xml.etree.ElementTree as ET
+try:
+    # ISA-L (via isal package) inflates considerably faster,
+    # fall back to standard library if it is not installed
+    from isal import isal_zlib as zlib
+except ImportError:  # pragma: no cover
+    import zlib
+try:
+    # orjson serializes large CX documents considerably
+    # faster than the standard library json module
+    import orjson
+except ImportError:  # pragma: no cover
+    orjson = None
+from requests.adapters import HTTPAdapter
 from requests.exceptions import HTTPError
+from requests.exceptions import RequestException
+from urllib3.util.retry import Retry
 
 
+from contextlib import contextmanager
 from datetime import datetime
+from concurrent.futures import as_completed
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures import ThreadPoolExecutor
 
-from ftpretty import ftpretty
-from biothings_client import get_client
-import ndexutil.tsv.tsv2nicecx2 as t2n
 
-import networkx as nx
-from ndex2.client import Ndex2
-import ndex2
 from ndexncipidloader.exceptions import NDExNciPidLoaderError
 from ndexutil.config import NDExUtilConfig
-from ndexutil.cytoscape import Py4CytoscapeWrapper
-from ndexutil.cytoscape import DEFAULT_CYREST_API
-from ndexutil.ndex import NDExExtraUtils
 from ndexncipidloader.network import NetworkEdgeFactory
-from ndexncipidloader.network import NetworkNodeFactory
+from ndexncipidloader.network import NetworkNode
 import ndexncipidloader
 
 logger = logging.getLogger(__name__)
@@ -59,22 +83,116 @@ DIRECTED_INTERACTIONS = ["controls-state-change-of",
                          "used-to-produce"
                          ]
 
+_DIRECTED_SET = frozenset(DIRECTED_INTERACTIONS)
+"""
+:py:const:`DIRECTED_INTERACTIONS` as a set for fast membership tests
+"""
+
 CONTROL_INTERACTIONS = ["controls-state-change-of",
                         "controls-transport-of",
                         "controls-phosphorylation-of",
                         "controls-expression-of"
                         ]
 
+_CONTROL_SET = frozenset(CONTROL_INTERACTIONS)
+"""
+:py:const:`CONTROL_INTERACTIONS` as a set for fast membership tests
+"""
+
+CONTROLS_STATE_CHANGE_OF = 'controls-state-change-of'
+"""
+Interaction type that can be subsumed by a
+:py:const:`CONTROL_INTERACTIONS` edge between the same nodes
+"""
+
+NEIGHBOR_OF = 'neighbor-of'
+"""
+Interaction type of edges removed by
+:py:class:`RedundantEdgeAdjudicator`
+"""
+
+ENERGY_SPRING_LAYOUT_MIN_NODES = 200
+"""
+Networks with at least this many nodes are laid out with
+the energy based (L-BFGS) variant of :py:func:`networkx.drawing.spring_layout`
+if the installed networkx and scipy support it
+"""
+
 COMMON_CHEMICALS = ["GDP", "GTP", "ATP", "ADP", "calcium(2+)"]
 
+UNIPROT_TIMEOUT = (3, 10)
+"""
+Connect and read timeout in seconds for uniprot queries
+"""
+
+UNIPROT_GENE_NAME_RE = re.compile('^GN.*Name=([^ ;]*)')
+"""
+Matches gene name line in uniprot text result capturing
+the gene name
+"""
+
+DEFAULT_CYREST_API = 'http://localhost:1234/v1'
+"""
+URL of CyREST API for a locally running Cytoscape, same as
+:py:const:`ndexutil.cytoscape.DEFAULT_CYREST_API` which is not
+imported here since :py:mod:`ndexutil.cytoscape` loads
+py4cytoscape, pandas, networkx and ndex2
+"""
+
 DEFAULT_FTP_HOST = 'ftp.ndexbio.org'
 DEFAULT_FTP_DIR = 'NCI_PID_BIOPAX_2016-06-08-PC2v8-API'
 DEFAULT_FTP_USER = 'anonymous'
 DEFAULT_FTP_PASS = 'anonymous'
 FTP_SUBDIR = 'ftp'
+
+DEFAULT_FTP_POOL_SIZE = 4
+"""
+Default number of FTP connections used to download files
+"""
+GUNZIP_BUFFER_SIZE = 1 << 20
+"""
+Size in bytes of write buffer for files gunzipped as they
+are downloaded
+"""
+PARTIAL_DOWNLOAD_SUFFIX = '.part'
+"""
+Suffix of file a download is written to until it completes
+"""
+CHECKSUM_SUFFIX = '.sha256'
+"""
+Suffix of file holding SHA-256 digest of a downloaded file
+"""
 ICONURL_ATTRIB = '__iconurl'
 ICON_URL = 'http://search.ndexbio.org/static/media/ndex-logo.04d7bf44.svg'
 
+UNIPROT_PREFIX = 'uniprot:'
+"""
+Prefix of uniprot identifiers in node represents
+"""
+
+_MISS = object()
+"""
+Sentinel used to tell a missing cache entry from
+a cached value of ``None``
+"""
+
+_CHEBI_NAME_PREFIX = 'CHEBI'
+"""
+Prefix of node names that :py:class:`CHEBINodeNameReplacer`
+replaces with :py:const:`PARTICIPANT_NAME`
+"""
+
+_CHEBI_PREFIX = 'chebi:CHEBI'
+"""
+Prefix of node represents values that have a redundant chebi:
+"""
+
+_CHEBI_CUT = len('chebi:')
+"""
+Number of characters to strip from start of node represents
+that start with :py:const:`_CHEBI_PREFIX`
+"""
+
 PARTICIPANT_NAME = 'PARTICIPANT_NAME'
 """
 Participant name node attribute
@@ -206,6 +324,24 @@ def _parse_arguments(desc, args):
     parser.add_argument('--genesymbol',
                         help='Use alternate gene symbol mapping file',
                         default=get_gene_symbol_mapping())
+    parser.add_argument('--genesymbolcache', default=None,
+                        help='Path to JSON file used to cache gene symbol '
+                             'lookups across runs. If unset, no cache is '
+                             'saved')
+    parser.add_argument('--biothingscache', default=None,
+                        help='Path to requests-cache database used to '
+                             'cache mygene.info queries across runs. '
+                             'Requires requests-cache package. '
+                             'If unset, queries are not cached')
+    parser.add_argument('--clearbiothingscache', action='store_true',
+                        help='If set, clears cache set via '
+                             '--biothingscache before running')
+    parser.add_argument('--layoutcache', default=None,
+                        help='Directory used to cache layouts computed '
+                             'by Cytoscape across runs. A network whose '
+                             'nodes and edges did not change reuses its '
+                             'cached layout. If unset, layouts are not '
+                             'cached')
     parser.add_argument('--loadplan', help='Use alternate load plan file',
                         default=get_load_plan())
     parser.add_argument('--iconurl',
@@ -267,6 +403,25 @@ def _parse_arguments(desc, args):
                         help='FTP directory to download owl or sif files '
                              'from. Ignored if --skipdownload flag set ',
                         default=DEFAULT_FTP_DIR)
+    parser.add_argument('--numworkers', type=int, default=1,
+                        help='Number of processes used to build networks '
+                             'from sif files. If --layout is run in '
+                             'Cytoscape networks are still saved to '
+                             'NDEx one at a time, otherwise each process '
+                             'also saves its networks. Gene symbol lookups '
+                             'done by these processes are not saved to '
+                             '--genesymbolcache')
+    parser.add_argument('--ftppoolsize', type=int,
+                        default=DEFAULT_FTP_POOL_SIZE,
+                        help='Number of FTP connections to use to '
+                             'download files in parallel. '
+                             'Ignored if --skipdownload flag set ')
+    parser.add_argument('--ftpmaxpoolsize', type=int, default=None,
+                        help='If set and larger then --ftppoolsize, '
+                             'number of parallel FTP downloads starts at '
+                             '--ftppoolsize and is raised or lowered, up '
+                             'to this value, based on measured download '
+                             'rate. Ignored if --skipdownload flag set')
     parser.add_argument('sifdir',
                         help='Directory containing .sif files to parse. '
                              'Under this directory OWL files '
@@ -282,7 +437,10 @@ def _parse_arguments(desc, args):
                              'Cytoscape can be used. If "-" is passed in '
                              'force-directed from Cytoscape will '
                              'be used. If no Cytoscape is available, '
-                             '"spring" from networkx is supported')
+                             '"spring" from networkx is supported. '
+                             '"forceatlas2" runs ForceAtlas2 with '
+                             'Barnes-Hut approximation, which is faster '
+                             'on large networks (requires fa2 package)')
     parser.add_argument('--cyresturl',
                         default=DEFAULT_CYREST_API,
                         help='URL of CyREST API. Default value '
@@ -322,20 +480,72 @@ def _setup_logging(args):
                               disable_existing_loggers=False)
 
 
+def _setup_biothings_caching(bclient, cache_db, clear=False):
+    """
+    Enables caching of queries made by biothings client
+    'bclient' in 'cache_db' database. Caching requires
+    requests-cache package and if it is not installed
+    a warning is logged and queries are not cached
+
+    :param bclient: biothings client
+    :param cache_db: path to cache database
+    :type cache_db: string
+    :param clear: if ``True`` clear any existing entries in cache
+    :type clear: bool
+    :return: True if caching was enabled otherwise False
+    :rtype: bool
+    """
+    cache_dir = os.path.dirname(os.path.abspath(cache_db))
+    if not os.path.isdir(cache_dir):
+        os.makedirs(cache_dir, mode=0o755)
+    try:
+        bclient.set_caching(cache_db=cache_db, verbose=False)
+    except Exception as e:
+        logger.warning('Unable to enable caching of mygene.info '
+                       'queries: ' + str(e))
+        return False
+    if clear is True:
+        logger.info('Clearing mygene.info query cache: ' + cache_db)
+        bclient.clear_cache()
+    return True
+
+
+def _get_gene_client(bclient):
+    """
+    Gets **bclient** creating a biothings gene client if
+    **bclient** is ``None``. Lets :py:class:`GeneFamilyFromOwlExtractor`
+    and :py:class:`GeneSymbolSearcher` only import
+    :py:mod:`biothings_client` when they first query
+
+    :param bclient: biothings client or ``None``
+    :return: biothings client
+    """
+    if bclient is None:
+        from biothings_client import get_client
+        return get_client('gene')
+    return bclient
+
+
 class GeneFamilyFromOwlExtractor(object):
     """
     Extracts genes for gene families from owl files
     """
     def __init__(self,
-                 bclient=get_client('gene')):
+                 bclient=None):
         """
         Constructor
+
+        :param bclient: biothings client to query, if ``None``
+                        a gene client is created when first needed
         """
         self._ns = {'bp': 'http://www.biopax.org/release/biopax-level3.owl#',
                     'rdf': 'http://www.w3.org/1999/02/22-rdf-syntax-ns#',
                     'owl': 'http://www.w3.org/2002/07/owl#',
                     'base': 'http://pathwaycommons.org/pc2/'}
+        self._rdf_resource = '{' + self._ns['rdf'] + '}resource'
+        self._rdf_id = '{' + self._ns['rdf'] + '}ID'
         self._bclient = bclient
+        self._sym_cache = {}
 
     def _get_members_of_protein(self, proteinref):
         """
@@ -347,44 +557,131 @@ class GeneFamilyFromOwlExtractor(object):
         """
         res = []
         for memphys in proteinref.findall('bp:memberPhysicalEntity', self._ns):
-            res.append(memphys.attrib['{' + self._ns['rdf'] + '}resource'].replace('#', '', 1))
+            res.append(memphys.attrib[self._rdf_resource].replace('#', '', 1))
         return res
 
-    def _get_uniprot_url_for_protein(self, root, protein_id):
+    def _get_uniprot_urls_for_protein(self, protein):
         """
-        Gets uniprot url from entityReference element in a Protein element matching
-        'protein_id' passed in
-        :param root: root of xml document
-        :type root: :py:class:`xml.etree.ElementTree.Element`
-        :param protein_id: id of protein
-        :type protein_id: string
-        :return: list of protein ids
+        Gets uniprot urls from entityReference elements of
+        Protein element passed in
+        :param protein: Protein element
+        :type protein: :py:class:`xml.etree.ElementTree.Element`
+        :return: list of uniprot urls
         :rtype: list
         """
         res = []
-        for eref in root.findall(".//bp:Protein[@rdf:ID='" + protein_id + "']/bp:entityReference", self._ns):
-            res.append(eref.attrib['{' + self._ns['rdf'] + '}resource'])
+        for eref in protein.findall('bp:entityReference', self._ns):
+            res.append(eref.attrib[self._rdf_resource])
         return res
 
     def _replace_uniprot_with_gene_symbols(self, uniproturls):
         """
+        Looks up gene symbol for each unique uniprot id in
+        **uniproturls**
 
         :param uniproturls: list of uniprot urls
         :type uniproturls: list
-        :return: list of gene symbols
-        :rtype: string
+        :return: sorted list of gene symbols
+        :rtype: list
         """
         newlist = []
-        for entry in uniproturls:
-            idonly = re.sub('^.*\/', '', entry)
-            result = self._bclient.query(idonly, fields='symbol')
-            if result is None:
-                logger.error('result is None when querying: ' + idonly)
+        ids = sorted(set([entry.rsplit('/', 1)[-1]
+                          for entry in uniproturls]))
+        if len(ids) == 0:
+            return newlist
+
+        # query ids not seen before in one batch keeping first hit
+        # for each id. Ids without a hit are cached as None so they
+        # are not queried again
+        pending = [idonly for idonly in ids
+                   if idonly not in self._sym_cache]
+        if pending:
+            self._bclient = _get_gene_client(self._bclient)
+            results = self._bclient.querymany(pending,
+                                              scopes='uniprot',
+                                              fields='symbol',
+                                              returnall=False,
+                                              verbose=False)
+            symbol_map = {}
+            if results is not None:
+                for hit in results:
+                    query = hit.get('query')
+                    if query in symbol_map or hit.get('symbol') is None:
+                        continue
+                    symbol_map[query] = hit['symbol']
+            for idonly in pending:
+                self._sym_cache[idonly] = symbol_map.get(idonly)
+
+        for idonly in ids:
+            symbol = self._sym_cache[idonly]
+            if symbol is None:
+                logger.error('No symbol found when querying: ' + idonly)
                 continue
-            newlist.append(result['hits'][0]['symbol'])
+            newlist.append(symbol)
         newlist.sort()
         return newlist
 
+    def get_family_uniprot_urls(self, xmlstream):
+        """
+        Reads 'xmlstream' and extracts uniprot urls of members of all
+        gene families by looking for proteins with ' family' in name.
+        This method only parses the document and does not query
+        for gene symbols.
+
+        :param xmlstream: filename or file object
+        :return: list of tuples (family name, list of uniprot urls) in
+                 order the families appear in document. Duplicate
+                 families are omitted
+        :rtype: list
+        """
+        protein_tag = '{' + self._ns['bp'] + '}Protein'
+        uniprot_urls = {}
+        families = []
+        depth = 0
+        root = None
+
+        # stream document clearing and removing each top level
+        # element once processed so the full tree is never
+        # held in memory
+        for event, elem in ET.iterparse(xmlstream, events=('start', 'end')):
+            if event == 'start':
+                if root is None:
+                    root = elem
+                depth += 1
+                continue
+            depth -= 1
+            if elem.tag == protein_tag:
+                protein_id = elem.attrib.get(self._rdf_id)
+                if protein_id is not None:
+                    uniprot_urls.setdefault(protein_id, []).\
+                        extend(self._get_uniprot_urls_for_protein(elem))
+                if depth == 1:
+                    family_name = next((d.text for d in
+                                        elem.findall('bp:displayName',
+                                                     self._ns)
+                                        if d.text and ' family' in d.text),
+                                       None)
+                    if family_name is not None:
+                        families.append((family_name,
+                                         self._get_members_of_protein(elem)))
+            if depth == 1:
+                elem.clear()
+                root.remove(elem)
+
+        # members can be defined after the family so resolve
+        # them once the whole document has been read
+        res = []
+        seen_families = set()
+        for family_name, member_ids in families:
+            if family_name in seen_families:
+                continue
+            seen_families.add(family_name)
+            uniproturls = []
+            for pid in member_ids:
+                uniproturls.extend(uniprot_urls.get(pid, []))
+            res.append((family_name, uniproturls))
+        return res
+
     def extract_gene_family_mapping(self, xmlstream):
         """
         Reads 'xmlstream' and extracts all gene families by looking for
@@ -394,42 +691,59 @@ class GeneFamilyFromOwlExtractor(object):
         :return: dictionary where key is family name and value is list of gene symbols
         :rtype: dict
         """
-        tree = ET.parse(xmlstream)
-        root = tree.getroot()
+        return self._get_gene_map(self.get_family_uniprot_urls(xmlstream))
+
+    def _get_gene_map(self, family_uniprot_urls):
+        """
+        Converts output of :py:func:`get_family_uniprot_urls` to
+        a dict of family name => list of gene symbols
+
+        :param family_uniprot_urls: list of tuples
+                                    (family name, list of uniprot urls)
+        :type family_uniprot_urls: list
+        :return: dictionary where key is family name and value is list of gene symbols
+        :rtype: dict
+        """
         gene_map = {}
-        for proteinref in root.findall('bp:Protein', self._ns):
-            found_family = False
-            for dispName in proteinref.findall('bp:displayName', self._ns):
-                if ' family' in dispName.text:
-                    found_family = True
-            if found_family is True:
-                if dispName.text in gene_map:
-                    continue
-                uniproturls = []
-                for pid in self._get_members_of_protein(proteinref):
-                    uniproturls.extend(self._get_uniprot_url_for_protein(root, pid))
-                gene_map[dispName.text] = self._replace_uniprot_with_gene_symbols(uniproturls)
+        for family_name, uniproturls in family_uniprot_urls:
+            gene_map[family_name] = self._replace_uniprot_with_gene_symbols(uniproturls)
         return gene_map
 
-    def get_gene_family_mapping_as_string(self, owldir):
+    def get_gene_family_mapping_as_string(self, owldir, max_workers=None):
         """
         Given a directory 'owldir' load every .owl file which is
         an xml document and extract genes in protein families
         (protein families have family in name)
 
+        If there is more than one .owl file, the files are parsed in
+        parallel by a process pool. Gene symbol queries are still
+        made from this process.
+
         :param owldir: directory with .owl files
         :type owldir: string
+        :param max_workers: maximum number of processes used to parse
+                            .owl files. If ``None`` number of processors
+                            on machine is used
+        :type max_workers: int
         :return: string in format below for each protein family:
                  "<protein family": "<comma delimited list of genes",
         :rtype: string
         """
-        finalstr = ''
         family_dict = {}
-        for entry in os.listdir(owldir):
-            if not entry.endswith('.owl'):
-                continue
-            fp = os.path.join(owldir, entry)
-            res = self.extract_gene_family_mapping(fp)
+        with os.scandir(owldir) as it:
+            owlfiles = [entry.path for entry in it
+                        if entry.name.endswith('.owl') and entry.is_file()]
+
+        if len(owlfiles) > 1:
+            with ProcessPoolExecutor(max_workers=max_workers) as executor:
+                parsed_files = list(executor.map(_get_family_uniprot_urls,
+                                                 owlfiles))
+        else:
+            parsed_files = [self.get_family_uniprot_urls(fp)
+                            for fp in owlfiles]
+
+        for parsed_file in parsed_files:
+            res = self._get_gene_map(parsed_file)
             for dent in res.keys():
                 if dent in family_dict:
                     if family_dict[dent] != res[dent]:
@@ -438,13 +752,23 @@ class GeneFamilyFromOwlExtractor(object):
                                      str(res[dent]))
                     continue
                 family_dict[dent] = res[dent]
-        if len(family_dict) > 0:
-            family_list = list(family_dict.keys())
-            family_list.sort()
-            for e in family_list:
-                finalstr += '"' + e + '": "' + ','.join(family_dict[e]) +\
-                            '",\n'
-        return finalstr
+        return ''.join(['"' + e + '": "' + ','.join(family_dict[e]) + '",\n'
+                        for e in sorted(family_dict)])
+
+
+def _get_family_uniprot_urls(owlfile):
+    """
+    Calls :py:func:`GeneFamilyFromOwlExtractor.get_family_uniprot_urls`
+    on **owlfile**. Defined at module level so it can be run
+    in a separate process
+
+    :param owlfile: path to owl file
+    :type owlfile: string
+    :return: list of tuples (family name, list of uniprot urls)
+    :rtype: list
+    """
+    extractor = GeneFamilyFromOwlExtractor(bclient=None)
+    return extractor.get_family_uniprot_urls(owlfile)
 
 
 class GeneSymbolSearcher(object):
@@ -453,12 +777,156 @@ class GeneSymbolSearcher(object):
     """
 
     def __init__(self,
-                 bclient=get_client('gene')):
+                 bclient=None,
+                 session=None,
+                 cache_path=None):
         """
         Constructor
+
+        :param bclient: biothings client to query, if ``None``
+                        a gene client is created when first needed
+        :param session: session used to query uniprot, if ``None``
+                        a :py:class:`requests.Session` with connection
+                        pooling and retries is created
+        :type session: :py:class:`requests.Session`
+        :param cache_path: Path to JSON file used to persist symbol
+                           lookups across runs. If file exists it is
+                           loaded. If ``None`` no cache is persisted
+        :type cache_path: string
         """
         self._cache = {}
+        self._new_symbols = {}
+        self._cache_path = cache_path
+        self._load_cache()
         self._bclient = bclient
+        if session is None:
+            session = self._create_session()
+        self._session = session
+
+    def __getstate__(self):
+        """
+        Gets state to pickle when this object is sent to a worker
+        process. The biothings client cannot be pickled and is left
+        out along with the session. The cache is left out too since
+        it is loaded again from cache_path set in constructor
+
+        :return: state
+        :rtype: dict
+        """
+        state = self.__dict__.copy()
+        state['_bclient'] = None
+        state['_session'] = None
+        state['_cache'] = {}
+        state['_new_symbols'] = {}
+        return state
+
+    def __setstate__(self, state):
+        """
+        Restores state from :py:func:`__getstate__` creating
+        a new session and loading the cache
+
+        :param state: state
+        :type state: dict
+        :return: None
+        """
+        self.__dict__.update(state)
+        self._session = self._create_session()
+        self._load_cache()
+
+    def _create_session(self):
+        """
+        Creates session with connection pooling and
+        retries used to query uniprot
+
+        :return: session
+        :rtype: :py:class:`requests.Session`
+        """
+        session = requests.Session()
+        retry = Retry(total=3, backoff_factor=0.3,
+                      status_forcelist=(500, 502, 503, 504))
+        adapter = HTTPAdapter(pool_connections=4, pool_maxsize=16,
+                              max_retries=retry)
+        session.mount('https://', adapter)
+        return session
+
+    def _load_cache(self):
+        """
+        Loads cache from JSON file set via cache_path in constructor
+        if that file exists
+
+        :return: None
+        """
+        if self._cache_path is None or\
+                not os.path.isfile(self._cache_path):
+            return
+        try:
+            with open(self._cache_path, 'r') as f:
+                self._cache = json.load(f)
+            logger.debug('Loaded ' + str(len(self._cache)) +
+                         ' symbols from cache: ' + self._cache_path)
+        except ValueError as ve:
+            logger.error('Unable to parse gene symbol cache file ' +
+                         self._cache_path + ' : ' + str(ve))
+
+    def _add_to_cache(self, val, symbol):
+        """
+        Caches **symbol** for **val** also keeping it for
+        :py:func:`pop_new_symbols`
+
+        :param val: id symbol was looked up for
+        :type val: string
+        :param symbol: gene symbol or empty string if none was found
+        :type symbol: string
+        :return: None
+        """
+        self._cache[val] = symbol
+        self._new_symbols[val] = symbol
+
+    def pop_new_symbols(self):
+        """
+        Gets symbols cached since this object was created, or
+        since this method was last called. Used to send symbols
+        looked up in a worker process back to the main process
+
+        :return: symbols as {id: symbol}
+        :rtype: dict
+        """
+        new_symbols = self._new_symbols
+        self._new_symbols = {}
+        return new_symbols
+
+    def add_symbols(self, symbols):
+        """
+        Adds **symbols**, as returned by :py:func:`pop_new_symbols`
+        on a copy of this object in a worker process, to the cache
+        so they are written out by :py:func:`save_cache`
+
+        :param symbols: symbols as {id: symbol}
+        :type symbols: dict
+        :return: None
+        """
+        if symbols is None:
+            return
+        self._cache.update(symbols)
+
+    def save_cache(self):
+        """
+        Writes cache to JSON file set via cache_path in
+        constructor. The file is first written to a temporary
+        file and then renamed so an interrupted write does not
+        corrupt an existing cache.
+
+        :return: None
+        """
+        if self._cache_path is None:
+            return
+        cache_dir = os.path.dirname(os.path.abspath(self._cache_path))
+        if not os.path.isdir(cache_dir):
+            os.makedirs(cache_dir, mode=0o755)
+        tmp_cache = self._cache_path + '.tmp'
+        with open(tmp_cache, 'w') as f:
+            json.dump(self._cache, f)
+        os.replace(tmp_cache, self._cache_path)
 
     def _query_mygene(self, val):
         """
@@ -471,6 +939,7 @@ class GeneSymbolSearcher(object):
         :rtype: string
         """
         try:
+            self._bclient = _get_gene_client(self._bclient)
             res = self._bclient.query(val)
             if res is None:
                 logger.debug('Got None back from query for: ' + val)
@@ -497,17 +966,62 @@ class GeneSymbolSearcher(object):
         :param val:
         :return:
         """
-        res = requests.get('https://www.uniprot.org/uniprot/' +
-                           val.upper() + '.txt')
-        for entry in res.text.split('\n'):
-            if entry.startswith('GN'):
-                if 'Name' in entry:
-                    return re.sub(';.*', '',
-                                  re.sub(' .*', '',
-                                         re.sub('^GN.*Name=',
-                                                '', entry)))
+        try:
+            res = self._session.get('https://www.uniprot.org/uniprot/' +
+                                    val.upper() + '.txt',
+                                    timeout=UNIPROT_TIMEOUT)
+        except RequestException as e:
+            logger.error('Caught exception querying uniprot for: ' +
+                         val + ' : ' + str(e))
+            return None
+        for entry in res.text.splitlines():
+            m = UNIPROT_GENE_NAME_RE.match(entry)
+            if m is not None:
+                return m.group(1)
         return None
 
+    def prefetch_symbols(self, vals):
+        """
+        Queries biothings_client in batch for all uniprot ids in 'vals'
+        that are not already cached, storing any symbols found in the
+        cache so subsequent :py:func:`get_symbol` calls avoid a
+        query per id. Ids without a hit are left uncached so
+        :py:func:`get_symbol` can still fall back to other lookups
+
+        :param vals: uniprot ids to query
+        :type vals: list
+        :return: None
+        """
+        if vals is None:
+            return
+        pending = set([v for v in vals if v is not None and
+                       v not in self._cache])
+        if len(pending) == 0:
+            return
+        try:
+            self._bclient = _get_gene_client(self._bclient)
+            res = self._bclient.querymany(list(pending),
+                                          scopes='uniprot',
+                                          fields='symbol',
+                                          returnall=False,
+                                          verbose=False)
+        except RequestException as e:
+            logger.error('Caught exception running batch query: ' + str(e))
+            return
+        if res is None:
+            return
+        for hit in res:
+            query = hit.get('query')
+            if query is None or query in self._cache:
+                continue
+            sym_name = hit.get('symbol')
+            if sym_name is None:
+                continue
+            self._add_to_cache(query, sym_name.upper())
+        logger.debug('Batch query found symbols for ' +
+                     str(len([v for v in pending if v in self._cache])) +
+                     ' of ' + str(len(pending)) + ' ids')
+
     def get_symbol(self, val):
         """
         Queries biothings_client with 'val' to find
@@ -532,17 +1046,17 @@ class GeneSymbolSearcher(object):
         if sym_name is None or sym_name == '':
             res = self._query_uniprot(val)
             if res is not None:
-                self._cache[val] = res
+                self._add_to_cache(val, res)
                 return res
             sym_name = ''
-        self._cache[val] = sym_name
+        self._add_to_cache(val, sym_name)
         return sym_name
 
 
 class NetworkAttributesFromTSVFactory(object):
     """
     Factory to create NetworkAttributes object
-    from TSV file using Pandas
+    from TSV file
     """
 
     def __init__(self, tsvfile, delim='\t',
@@ -560,34 +1074,90 @@ class NetworkAttributesFromTSVFactory(object):
         self._cname_key = cname_key
 
     def get_network_attributes_obj(self):
+        """
+        Gets :py:class:`NetworkAttributes` object built from TSV file
+        passed in constructor. The parsed result is cached by file
+        path and modification time so repeated calls do not
+        reparse an unchanged file.
+
+        :return: network attributes or ``None`` if TSV file is ``None``
+        :rtype: :py:class:`NetworkAttributes`
+        """
         if self._tsvfile is None:
             logger.error('TSV file is None')
             return None
 
-        df = pd.read_csv(self._tsvfile, sep=self._delim)
-        net_attr = NetworkAttributes()
-        for id, row in enumerate(df[self._name_key]):
-            net_attr.add_author_entry(str(row),
-                                      str(df[self._curated_key][id]))
-            net_attr.add_reviewers_entry(str(row),
-                                         str(df[self._reviewed_key][id]))
-            net_attr.add_labels_entry(str(row),
-                                      str(df[self._pid_key][id]))
-
-            # some network names only match in the corrected pathway column
-            if df[self._cname_key][id] is not None:
-                cnameval = str(df[self._cname_key][id])
-                if cnameval != '' and cnameval != 'nan':
-                    net_attr.add_author_entry(cnameval,
-                                              str(df[self._curated_key][id]))
-                    net_attr.add_reviewers_entry(cnameval,
-                                                 str(df[self._reviewed_key][id]))
-                    net_attr.add_labels_entry(cnameval,
-                                              str(df[self._pid_key][id]))
+        tsvfile = os.path.abspath(self._tsvfile)
+        net_attr = _get_cached_network_attributes(tsvfile,
+                                                  os.path.getmtime(tsvfile),
+                                                  self._delim, self._pid_key,
+                                                  self._name_key,
+                                                  self._cname_key,
+                                                  self._reviewed_key,
+                                                  self._curated_key)
+        return copy.deepcopy(net_attr)
+
+    def _parse_tsvfile(self):
+        """
+        Parses TSV file passed in constructor
+
+        :return: network attributes
+        :rtype: :py:class:`NetworkAttributes`
+        """
+        entries = []
+        with open(self._tsvfile, 'r', newline='') as f:
+            reader = csv.reader(f, delimiter=self._delim)
+            header = next(reader)
+
+            # resolve column positions once instead of building
+            # a dict for every row
+            name_idx, cname_idx, curated_idx, reviewed_idx, pid_idx = \
+                [header.index(key) for key in (self._name_key,
+                                               self._cname_key,
+                                               self._curated_key,
+                                               self._reviewed_key,
+                                               self._pid_key)]
+            min_len = max(name_idx, cname_idx, curated_idx,
+                          reviewed_idx, pid_idx) + 1
+            for row in reader:
+                if len(row) < min_len:
+                    row = row + [''] * (min_len - len(row))
+                entry = (row[curated_idx], row[reviewed_idx], row[pid_idx])
+                entries.append((row[name_idx],) + entry)
+
+                # some network names only match in the corrected
+                # pathway column
+                cnameval = row[cname_idx]
+                if cnameval != '':
+                    entries.append((cnameval,) + entry)
 
+        net_attr = NetworkAttributes()
+        net_attr.add_entries(entries)
         return net_attr
 
 
+@functools.lru_cache(maxsize=8)
+def _get_cached_network_attributes(tsvfile, mtime, delim, pid_key,
+                                   name_key, cname_key, reviewed_key,
+                                   curated_key):
+    """
+    Parses network attributes TSV file via
+    :py:class:`NetworkAttributesFromTSVFactory` caching the result.
+    The **mtime** argument is not used other than as part of
+    the cache key so a modified file is parsed again.
+
+    :return: network attributes
+    :rtype: :py:class:`NetworkAttributes`
+    """
+    fac = NetworkAttributesFromTSVFactory(tsvfile, delim=delim,
+                                          pid_key=pid_key,
+                                          name_key=name_key,
+                                          cname_key=cname_key,
+                                          reviewed_key=reviewed_key,
+                                          curated_key=curated_key)
+    return fac._parse_tsvfile()
+
+
 class NetworkAttributes(object):
     """
     Contains database of additional network attributes
@@ -601,7 +1171,9 @@ class NetworkAttributes(object):
         """
         Constructor
         """
-        self._db = {}
+        self._labels = {}
+        self._authors = {}
+        self._reviewers = {}
 
     def add_labels_entry(self, name, val):
         """
@@ -610,9 +1182,7 @@ class NetworkAttributes(object):
         :param val:
         :return:
         """
-        if name not in self._db:
-            self._db[name] = {}
-        self._db[name][NetworkAttributes.LABELS] = val
+        self._labels[name] = val
 
     def add_author_entry(self, name, val):
         """
@@ -621,9 +1191,7 @@ class NetworkAttributes(object):
         :param val:
         :return:
         """
-        if name not in self._db:
-            self._db[name] = {}
-        self._db[name][NetworkAttributes.AUTHOR] = val
+        self._authors[name] = val
 
     def add_reviewers_entry(self, name, val):
         """
@@ -632,9 +1200,23 @@ class NetworkAttributes(object):
         :param val:
         :return:
         """
-        if name not in self._db:
-            self._db[name] = {}
-        self._db[name][NetworkAttributes.REVIEWERS] = val
+        self._reviewers[name] = val
+
+    def add_entries(self, entries):
+        """
+        Adds author, reviewers, and labels for many networks at
+        once. Later entries replace earlier entries with the same
+        network name.
+
+        :param entries: (network name, author, reviewers, labels) tuples
+        :type entries: list
+        """
+        if not entries:
+            return
+        names, authors, reviewers, labels = zip(*entries)
+        self._authors.update(zip(names, authors))
+        self._reviewers.update(zip(names, reviewers))
+        self._labels.update(zip(names, labels))
 
     def get_labels(self, name):
         """
@@ -642,9 +1224,7 @@ class NetworkAttributes(object):
         :param name:
         :return:
         """
-        if name not in self._db:
-            return None
-        return self._db[name].get(NetworkAttributes.LABELS)
+        return self._labels.get(name)
 
     def get_author(self, name):
         """
@@ -652,9 +1232,7 @@ class NetworkAttributes(object):
         :param name:
         :return:
         """
-        if name not in self._db:
-            return None
-        return self._db[name].get(NetworkAttributes.AUTHOR)
+        return self._authors.get(name)
 
     def get_reviewers(self, name):
         """
@@ -662,9 +1240,7 @@ class NetworkAttributes(object):
         :param name:
         :return:
         """
-        if name not in self._db:
-            return None
-        return self._db[name].get(NetworkAttributes.REVIEWERS)
+        return self._reviewers.get(name)
 
 
 class NetworkIssueReport(object):
@@ -708,11 +1284,7 @@ class NetworkIssueReport(object):
         :type issue_list: list
         :return: None
         """
-        if issue_list is None:
-            return
-        if len(issue_list) is 0:
-            return
-        if description is None:
+        if not issue_list or description is None:
             return
         self._issuemap[description] = issue_list
 
@@ -733,12 +1305,119 @@ class NetworkIssueReport(object):
                    key + '\n'
             for entry in self._issuemap[key]:
                 res += '\t\t' + entry + '\n'
-        if len(res) is 0:
+        if not res:
             return ''
 
         return str(self._networkname) + '\n' + res
 
 
+def _write_cx_to_file(cx, cx_file):
+    """
+    Writes 'cx' as JSON to 'cx_file' using orjson if it is
+    installed otherwise the standard library json module.
+
+    The document is serialized in one call rather than with
+    :py:func:`json.dump` which only uses the C accelerated
+    encoder when everything is encoded at once
+
+    :param cx: CX network
+    :type cx: list
+    :param cx_file: path to write to
+    :type cx_file: string
+    :return: None
+    """
+    if orjson is not None:
+        with open(cx_file, 'wb') as f:
+            f.write(orjson.dumps(cx))
+        return
+    with open(cx_file, 'w') as f:
+        f.write(json.dumps(cx))
+
+
+def _index_node_attribute(network, attr_name):
+    """
+    Scans node attributes of 'network' once building a dict
+    of node id to value of 'attr_name' node attribute. If
+    a node has 'attr_name' more than once the first value is
+    used, matching
+    :py:func:`~ndex2.nice_cx_network.NiceCXNetwork.get_node_attribute`
+
+    :param network: network to scan
+    :type network: :py:class:`~ndex2.nice_cx_network.NiceCXNetwork`
+    :param attr_name: name of node attribute
+    :type attr_name: string
+    :return: {node id: attribute value} for nodes with attribute
+    :rtype: dict
+    """
+    res = {}
+    for nodeid, attr_list in network.nodeAttributes.items():
+        for attr in attr_list:
+            if attr.get('n') == attr_name:
+                res[nodeid] = attr.get('v')
+                break
+    return res
+
+
+def _build_node_edge_index(network):
+    """
+    Iterates through all edges in 'network' building
+    a dict of node id to set of ids of edges where that
+    node is the source or target
+
+    :param network: Network to get edges from
+    :type network: :py:class:`~ndex2.nice_cx_network.NiceCXNetwork`
+    :return: {node id: set of edge ids}
+    :rtype: dict
+    """
+    index = {}
+    for edge_id, edge in network.get_edges():
+        index.setdefault(edge['s'], set()).add(edge_id)
+        index.setdefault(edge['t'], set()).add(edge_id)
+    return index
+
+
+@functools.lru_cache(maxsize=4)
+def _get_cached_gene_symbol_map(genesymbol, mtime):
+    """
+    Loads gene symbol mapping JSON file caching the result
+    so updators using the same file share one parsed copy.
+    The cache key is the absolute path of the file plus its
+    modification time, **mtime**, so a file that is modified
+    is loaded again.
+
+    .. note::
+
+        The returned dict is shared and must not be modified
+
+    :param genesymbol: path to gene symbol mapping JSON file
+    :type genesymbol: string
+    :param mtime: modification time of 'genesymbol'
+    :type mtime: float
+    :return: gene symbol mapping
+    :rtype: dict
+    """
+    with open(genesymbol, 'r') as f:
+        return json.load(f)
+
+
+def _load_gene_symbol_map(genesymbol):
+    """
+    Gets gene symbol mapping from **genesymbol** JSON file, set
+    via --genesymbol flag, via :py:func:`_get_cached_gene_symbol_map`
+
+    .. note::
+
+        The returned dict is shared and must not be modified
+
+    :param genesymbol: path to gene symbol mapping JSON file
+    :type genesymbol: string
+    :return: gene symbol mapping
+    :rtype: dict
+    """
+    return _get_cached_gene_symbol_map(os.path.abspath(genesymbol),
+                                       os.path.getmtime(genesymbol))
+
+
 class NetworkUpdator(object):
     """
     Base class for classes that update
@@ -765,6 +1444,176 @@ class NetworkUpdator(object):
         """
         raise NotImplementedError('subclasses should implement')
 
+    def update_with_report(self, network, report):
+        """
+        Runs :py:func:`update` on **network** adding any
+        issues to **report** under :py:func:`get_description`
+
+        :param network: network to update
+        :type network: :py:class:`~ndex2.nice_cx_network.NiceCXNetwork`
+        :param report: report to add issues to
+        :type report: :py:class:`NetworkIssueReport`
+        :return: None
+        """
+        report.addissues(self.get_description(), self.update(network))
+
+    def pop_new_symbols(self):
+        """
+        Gets gene symbols looked up since this method was last
+        called, so symbols looked up in a worker process can be
+        passed to :py:func:`add_symbols` in the main process.
+        Updators that look up symbols should override this
+
+        :return: symbols as {id: symbol} or ``None``
+        :rtype: dict
+        """
+        return None
+
+    def add_symbols(self, symbols):
+        """
+        Adds gene symbols returned by :py:func:`pop_new_symbols`.
+        Updators that look up symbols should override this
+
+        :param symbols: symbols as {id: symbol}
+        :type symbols: dict
+        :return: None
+        """
+        pass
+
+
+class NodeUpdator(NetworkUpdator):
+    """
+    Base class for updators that only look at one node
+    at a time. Several of these can be run in a single
+    pass over the nodes via :py:class:`FusedNodeUpdator`
+    """
+    def __init__(self):
+        """
+        Constructor
+        """
+        super(NodeUpdator, self).__init__()
+
+    def begin_update(self, network):
+        """
+        Invoked once before :py:func:`update_node` is called
+        on the nodes of **network**. Default does nothing
+
+        :param network: network about to be updated
+        :type network: :py:class:`~ndex2.nice_cx_network.NiceCXNetwork`
+        :return: list of issues as strings encountered or None
+        :rtype: list
+        """
+        return None
+
+    def update_node(self, network, nodeid, node):
+        """
+        Subclasses should implement
+
+        :param network: network being updated
+        :type network: :py:class:`~ndex2.nice_cx_network.NiceCXNetwork`
+        :param nodeid: id of node
+        :type nodeid: int
+        :param node: node
+        :type node: dict
+        :return: list of issues as strings encountered or None
+        :rtype: list
+        """
+        raise NotImplementedError('subclasses should implement')
+
+    def update(self, network):
+        """
+        Calls :py:func:`begin_update` and then
+        :py:func:`update_node` on every node in **network**
+
+        :param network: network to update
+        :type network: :py:class:`~ndex2.nice_cx_network.NiceCXNetwork`
+        :return: list of issues as strings encountered
+        :rtype: list
+        """
+        issues = list(self.begin_update(network) or [])
+        for nodeid, node in network.get_nodes():
+            node_issues = self.update_node(network, nodeid, node)
+            if node_issues:
+                issues.extend(node_issues)
+        return issues
+
+
+class FusedNodeUpdator(NetworkUpdator):
+    """
+    Runs several :py:class:`NodeUpdator` objects in one
+    pass over the nodes of a network. Each node is handed
+    to the updators in the order given so the result is the
+    same as running the updators one after another
+    """
+    def __init__(self, updators):
+        """
+        Constructor
+
+        :param updators: updators to run, in order
+        :type updators: list(:py:class:`NodeUpdator`)
+        """
+        super(FusedNodeUpdator, self).__init__()
+        self._updators = updators
+
+    def get_description(self):
+        """
+        Gets description
+        :return:
+        """
+        return 'Runs in one pass over nodes: ' +\
+               ', '.join([u.get_description() for u in self._updators])
+
+    def _update_all(self, network):
+        """
+        Runs all the updators over the nodes of **network**
+
+        :param network: network to update
+        :type network: :py:class:`~ndex2.nice_cx_network.NiceCXNetwork`
+        :return: list of issues for each updator in same
+                 order as updators passed to constructor
+        :rtype: list
+        """
+        issue_lists = [list(u.begin_update(network) or [])
+                       for u in self._updators]
+        pairs = list(zip([u.update_node for u in self._updators],
+                         issue_lists))
+        for nodeid, node in network.get_nodes():
+            for update_node, issues in pairs:
+                node_issues = update_node(network, nodeid, node)
+                if node_issues:
+                    issues.extend(node_issues)
+        return issue_lists
+
+    def update(self, network):
+        """
+        Runs all the updators over the nodes of **network**
+
+        :param network: network to update
+        :type network: :py:class:`~ndex2.nice_cx_network.NiceCXNetwork`
+        :return: list of issues as strings encountered
+        :rtype: list
+        """
+        issues = []
+        for issue_list in self._update_all(network):
+            issues.extend(issue_list)
+        return issues
+
+    def update_with_report(self, network, report):
+        """
+        Runs all the updators over the nodes of **network**
+        adding the issues of each updator to **report**
+        under that updator's description
+
+        :param network: network to update
+        :type network: :py:class:`~ndex2.nice_cx_network.NiceCXNetwork`
+        :param report: report to add issues to
+        :type report: :py:class:`NetworkIssueReport`
+        :return: None
+        """
+        for updator, issues in zip(self._updators,
+                                   self._update_all(network)):
+            report.addissues(updator.get_description(), issues)
+
 
 class UniProtToGeneSymbolUpdater(NetworkUpdator):
     """
@@ -775,13 +1624,34 @@ class UniProtToGeneSymbolUpdater(NetworkUpdator):
     def __init__(self,
                  searcher=GeneSymbolSearcher()):
         """
-        Constructor
+        Constructor
+
+        :param searcher: gene symbol searcher object used by
+                         :py:func:`~update` method.
+        :type searcher: :py:class:`GeneSymbolSearcher`
+        """
+        self._searcher = searcher
+
+    def pop_new_symbols(self):
+        """
+        Gets symbols looked up by searcher passed in constructor
+        via :py:func:`GeneSymbolSearcher.pop_new_symbols`
+
+        :return: symbols as {id: symbol}
+        :rtype: dict
+        """
+        return self._searcher.pop_new_symbols()
+
+    def add_symbols(self, symbols):
+        """
+        Adds **symbols** to searcher passed in constructor
+        via :py:func:`GeneSymbolSearcher.add_symbols`
 
-        :param searcher: gene symbol searcher object used by
-                         :py:func:`~update` method.
-        :type searcher: :py:class:`GeneSymbolSearcher`
+        :param symbols: symbols as {id: symbol}
+        :type symbols: dict
+        :return: None
         """
-        self._searcher = searcher
+        self._searcher.add_symbols(symbols)
 
     def get_description(self):
         """
@@ -808,35 +1678,52 @@ class UniProtToGeneSymbolUpdater(NetworkUpdator):
         if network is None:
             return None
 
+        # find nodes whose name is the uniprot id in represents
+        # computing the prefixed lower case name once per node
+        candidates = []
+        debug_on = logger.isEnabledFor(logging.DEBUG)
+        for nodeid, node in network.get_nodes():
+            represents = node.get('r')
+            if debug_on:
+                logger.debug('represents is: ' + str(represents))
+            if represents is None:
+                candidates.append((nodeid, node, None))
+                continue
+            if UNIPROT_PREFIX + node.get('n').lower() in represents.lower():
+                candidates.append((nodeid, node, represents))
+
+        # query symbols for all uniprot nodes in one batch
+        self._searcher.prefetch_symbols([node['n'] for nodeid, node,
+                                         represents in candidates
+                                         if represents is not None])
+
         counter = 0
         issues = []
-        for nodeid, node in network.get_nodes():
+        for nodeid, node, represents in candidates:
             name = node.get('n')
-            represents = node.get('r')
-            logger.debug('represents is: ' + str(represents))
             if represents is None:
                 issues.append('For node with id (' + str(nodeid) +
                               ') and name (' +
                               name + ') no represents value found')
                 continue
-            if 'uniprot:' + name.lower() in represents.lower():
-                # uniprot id is the node name
-                # use the lookup tool to try to
-                # find a gene symbol that can be used
-                symbol = self._searcher.get_symbol(name)
-                if symbol is not None and symbol != '':
-                    logger.info('On network: ' + str(network.get_name()) +
-                                 ' Replacing: ' + node['n'] +
-                                 ' with ' + symbol)
-                    node['n'] = symbol
-                    counter = counter + 1
-                else:
-                    issues.append('For node with id (' + str(nodeid) +
-                                  ') No symbol found to replace node name (' +
-                                  name + ') and represents (' +
-                                  represents + ')')
-                    logger.info('On network: ' + str(network.get_name()) +
-                                   ' No replacement found for ' + name)
+
+            # uniprot id is the node name
+            # use the lookup tool to try to
+            # find a gene symbol that can be used
+            symbol = self._searcher.get_symbol(name)
+            if symbol is not None and symbol != '':
+                logger.info('On network: ' + str(network.get_name()) +
+                            ' Replacing: ' + node['n'] +
+                            ' with ' + symbol)
+                node['n'] = symbol
+                counter = counter + 1
+            else:
+                issues.append('For node with id (' + str(nodeid) +
+                              ') No symbol found to replace node name (' +
+                              name + ') and represents (' +
+                              represents + ')')
+                logger.info('On network: ' + str(network.get_name()) +
+                            ' No replacement found for ' + name)
         if counter > 0:
             logger.debug('On network: ' + str(network.get_name()) +
                          ' updated ' + str(counter) +
@@ -883,15 +1770,11 @@ class DirectedEdgeSetter(NetworkUpdator):
         if network is None:
             return ['Network is None']
 
+        set_attr = network.set_edge_attribute
+        directed = _DIRECTED_SET
         for k, v in network.get_edges():
-            if v['i'] in DIRECTED_INTERACTIONS:
-                network.set_edge_attribute(k,
-                                           DirectedEdgeSetter.DIRECTED_ATTRIB,
-                                           True, type='boolean')
-            else:
-                network.set_edge_attribute(k,
-                                           DirectedEdgeSetter.DIRECTED_ATTRIB,
-                                           False, type='boolean')
+            set_attr(k, DirectedEdgeSetter.DIRECTED_ATTRIB,
+                     v['i'] in directed, type='boolean')
         return []
 
 
@@ -933,23 +1816,24 @@ class EmptyCitationAttributeUpdator(NetworkUpdator):
         if network is None:
             return ['Network is None']
         citation = EmptyCitationAttributeUpdator.CITATION
-        for k, v in network.get_edges():
-            edge_attr = network.get_edge_attribute(k,
-                                                   citation)
-            if edge_attr == (None, None):
-                network.set_edge_attribute(k, citation, values=[],
-                                           type='list_of_string')
-                continue
 
-            new_list = []
-            for entry in edge_attr['v']:
-                if entry == '' or entry.strip() == 'pubmed:':
+        # update citation attributes in place with a single scan
+        # of the edge attributes instead of a lookup per edge
+        edges_with_citation = set()
+        for edge_id, attr_list in network.edgeAttributes.items():
+            for attr in attr_list:
+                if attr['n'] != citation:
                     continue
-                new_list.append(entry)
+                attr['v'] = [entry for entry in attr['v']
+                             if entry != '' and
+                             entry.strip() != 'pubmed:']
+                attr['d'] = 'list_of_string'
+                edges_with_citation.add(edge_id)
 
-            network.remove_edge_attribute(k, citation)
-            network.set_edge_attribute(k, citation, values=new_list,
-                                       type='list_of_string')
+        for k, v in network.get_edges():
+            if k not in edges_with_citation:
+                network.set_edge_attribute(k, citation, values=[],
+                                           type='list_of_string')
         return []
 
 
@@ -959,7 +1843,6 @@ class RedundantEdgeAdjudicator(NetworkUpdator):
     described in :py:func:`~RedundantEdgeAdjudicator.update`
     """
     CITATION = 'citation'
-    _edge_map = {}
 
     def __init__(self):
         """
@@ -967,6 +1850,7 @@ class RedundantEdgeAdjudicator(NetworkUpdator):
 
         """
         super(RedundantEdgeAdjudicator, self).__init__()
+        self._edge_map = {}
 
     def get_description(self):
         """
@@ -977,7 +1861,10 @@ class RedundantEdgeAdjudicator(NetworkUpdator):
 
     def _remove_edge(self, network, edgeid):
         """
-        Removes edge and its attributes
+        Removes edge and its attributes.
+        Like :py:func:`_remove_node` this digs into internals
+        of :py:class:`~ndex2.nice_cx_network.NiceCXNetwork` to
+        avoid removing each edge attribute one at a time
 
         :param network: network with edge
         :type network: :py:class:`~ndex2.nice_cx_network.NiceCXNetwork`
@@ -985,14 +1872,29 @@ class RedundantEdgeAdjudicator(NetworkUpdator):
         :type edgeid: int
         :return: None
         """
-        network.remove_edge(edgeid)
+        network.edges.pop(edgeid, None)
+        network.edgeAttributes.pop(edgeid, None)
 
-        # remove edge attributes for deleted edge
-        net_attrs = network.get_edge_attributes(edgeid)
-        if net_attrs is None:
-            return
-        for net_attr in net_attrs:
-            network.remove_edge_attribute(edgeid, net_attr['n'])
+    def _remove_edges(self, network, edge_ids):
+        """
+        Removes edges with ids in 'edge_ids' along with their
+        attributes in one batch. See :py:func:`_remove_edge`
+
+        :param network: network with edges
+        :type network: :py:class:`~ndex2.nice_cx_network.NiceCXNetwork`
+        :param edge_ids: ids of edges to remove
+        :type edge_ids: iterable
+        :return: number of edges removed
+        :rtype: int
+        """
+        edges = network.edges
+        edge_attrs = network.edgeAttributes
+        removed = 0
+        for edge_id in edge_ids:
+            if edges.pop(edge_id, None) is not None:
+                removed += 1
+            edge_attrs.pop(edge_id, None)
+        return removed
 
     def _remove_node(self, network, nodeid):
         """
@@ -1008,23 +1910,50 @@ class RedundantEdgeAdjudicator(NetworkUpdator):
         :type nodeid: int
         :return: None
         """
-        network.remove_node(nodeid)
-        network.nodeAttributes.pop(nodeid)
+        network.nodes.pop(nodeid, None)
+        network.nodeAttributes.pop(nodeid, None)
+
+    def _build_node_edge_index(self, network):
+        """
+        Iterates through all edges in 'network' building
+        a dict of node id to set of ids of edges where that
+        node is the source or target
+
+        :param network: Network to get edges from
+        :type network: :py:class:`~ndex2.nice_cx_network.NiceCXNetwork`
+        :return: {node id: set of edge ids}
+        :rtype: dict
+        """
+        return _build_node_edge_index(network)
 
-    def _remove_node_edges(self, network, node_id):
-        edges_to_remove = set()
+    def _remove_node_edges(self, network, node_id, index=None):
+        """
+        Removes all edges where 'node_id' is the source or target
 
-        for edge_id, edge in network.get_edges():
-            source_nodeid = edge["s"]
-            if source_nodeid == node_id:
-                edges_to_remove.add(edge_id)
-                continue
-            target_node_id = edge["t"]
-            if target_node_id == node_id:
-                edges_to_remove.add(edge_id)
+        :param network: network with edges
+        :type network: :py:class:`~ndex2.nice_cx_network.NiceCXNetwork`
+        :param node_id: id of node
+        :type node_id: int
+        :param index: index from :py:func:`_build_node_edge_index`
+                      which is updated as edges are removed. Pass
+                      this in when removing edges for many nodes.
+                      If ``None`` index is built from 'network'
+        :type index: dict
+        :return: None
+        """
+        if index is None:
+            index = self._build_node_edge_index(network)
 
+        edges_to_remove = index.pop(node_id, ())
         for edge_id in edges_to_remove:
-            self._remove_edge(network, edge_id)
+            edge = network.get_edge(edge_id)
+            if edge is not None:
+                # drop edge from other node's entry as well
+                other_id = edge['t'] if edge['s'] == node_id else edge['s']
+                other_edges = index.get(other_id)
+                if other_edges is not None:
+                    other_edges.discard(edge_id)
+        self._remove_edges(network, edges_to_remove)
 
     def _make_key(self, node_id1, node_id2):
         """
@@ -1038,6 +1967,45 @@ class RedundantEdgeAdjudicator(NetworkUpdator):
         """
         return ("%s_%s" % (node_id1, node_id2))
 
+    def _build_pair_index(self, network):
+        """
+        Iterates through all edges in 'network' and
+        builds up a dict of following structure:
+
+        {'edgesourceid_edgetargetid': [<edge object ie CX dict {}>]}
+
+        While doing so the keys whose edges include a
+        :py:const:`CONTROLS_STATE_CHANGE_OF` edge and at least two
+        :py:const:`CONTROL_INTERACTIONS` edges (the
+        :py:const:`CONTROLS_STATE_CHANGE_OF` edge itself counts as one)
+        are tracked since only those can have subsumed edges.
+
+        :param network: Network to get edges from
+        :type: network: :py:class:`~ndex2.nice_cx_network.NiceCXNetwork`
+        :return: (edge map dict, set of candidate keys)
+        :rtype: tuple
+        """
+        edge_map = {}
+        control_counts = {}
+        csc_keys = set()
+        for edge_id, edge_object in network.get_edges():
+            edge_map_key = self._make_key(edge_object['s'],
+                                          edge_object['t'])
+            list_of_edges = edge_map.get(edge_map_key)
+            if list_of_edges is None:
+                edge_map[edge_map_key] = [edge_object]
+            else:
+                list_of_edges.append(edge_object)
+            interaction = edge_object['i']
+            if interaction in _CONTROL_SET:
+                control_counts[edge_map_key] =\
+                    control_counts.get(edge_map_key, 0) + 1
+                if interaction == CONTROLS_STATE_CHANGE_OF:
+                    csc_keys.add(edge_map_key)
+        candidate_keys = set([key for key in csc_keys
+                              if control_counts[key] > 1])
+        return edge_map, candidate_keys
+
     def _make_new_edge_map(self, network):
         """
         Iterates through all edges in 'network' and
@@ -1052,22 +2020,12 @@ class RedundantEdgeAdjudicator(NetworkUpdator):
         :type: network: :py:class:`~ndex2.nice_cx_network.NiceCXNetwork`
         :return: None
         """
-        edge_map={}
-        for edge_id, edge_object in network.get_edges():
-            source_nodeid = edge_object['s']
-            target_nodeid = edge_object['t']
-            edge_map_key = self._make_key(source_nodeid, target_nodeid)
-            if not edge_map_key in edge_map:
-                edge_map[edge_map_key] = [edge_object]
-            else:
-                list_of_edges = edge_map[edge_map_key]
-                list_of_edges.append(edge_object)
-        self._edge_map = edge_map
+        self._edge_map = self._build_pair_index(network)[0]
 
     def _get_edges_between_two_nodes(self, node_id1, node_id2):
         return self._edge_map.get(self._make_key(node_id1, node_id2))
 
-    def _subsumes(self, edge1, edge2, higher_priority_edges=CONTROL_INTERACTIONS):
+    def _subsumes(self, edge1, edge2, higher_priority_edges=_CONTROL_SET):
         """
         If 'edge1' is in 'higher_priority_edges' list and 'edge2' interaction type
         defined by edge2['i'] is 'controls-state-change-of this method
@@ -1076,8 +2034,8 @@ class RedundantEdgeAdjudicator(NetworkUpdator):
         :type edge1: dict
         :param edge2: edge dict in CX format {'@id': #, 'i': 'neigh', 's': #, 't': #}
         :type edge2: dict
-        :param higher_priority_edges: list of edge interactions as string
-        :type higher_priority_edges: list
+        :param higher_priority_edges: edge interactions as string
+        :type higher_priority_edges: frozenset
         :return: True if edge1 can "subsume" edge2 otherwise False
         :type bool
         """
@@ -1086,20 +2044,38 @@ class RedundantEdgeAdjudicator(NetworkUpdator):
         return False
 
     def _remove_redundant_from_pair(self, network, edges):
-        for current_edge in edges:
-            current_edge_id = current_edge['@id']
-            for comparison_edge in edges:
-                comparison_edge_id = comparison_edge['@id']
-                if comparison_edge_id != current_edge_id:
-                    if self._subsumes(current_edge, comparison_edge):
-                        self._remove_edge(network, comparison_edge_id)
+        """
+        Removes edges in 'edges' subsumed by another edge
+        in 'edges' as defined by :py:func:`_subsumes`
+
+        :param network: network with edges
+        :type network: :py:class:`~ndex2.nice_cx_network.NiceCXNetwork`
+        :param edges: edges between the same source and target node
+        :type edges: list
+        :return: number of edges removed
+        :rtype: int
+        """
+        priority_edges = [e for e in edges if e['i'] in _CONTROL_SET]
+
+        # a controls-state-change-of edge is itself a priority edge
+        # so it is only subsumed if there is at least one other
+        # priority edge, in which case every such edge is subsumed
+        if len(priority_edges) < 2:
+            return 0
+        return self._remove_edges(network,
+                                  [e['@id'] for e in priority_edges
+                                   if e['i'] == CONTROLS_STATE_CHANGE_OF])
 
     def _remove_if_redundant(self, network):
-        self._make_new_edge_map(network)
+        self._edge_map, candidate_keys = self._build_pair_index(network)
         edge_count = len(network.edges)
-        for node_pair_edges in self._edge_map.values():
-            self._remove_redundant_from_pair(network, node_pair_edges)
-        number_removed = edge_count - len(network.edges)
+        number_removed = 0
+        for key in candidate_keys:
+            number_removed += self._remove_redundant_from_pair(
+                network, self._edge_map[key])
+
+        # release references to edges of this network
+        self._edge_map = {}
         logger.debug('removed ' + str(number_removed) +
                      ' subsumed edges out of ' + str(edge_count))
 
@@ -1113,15 +2089,9 @@ class RedundantEdgeAdjudicator(NetworkUpdator):
         :return:
         """
         edge_count = len(network.edges)
-        edges_to_remove = set()
-
-        for edge_id, edge in network.get_edges():
-            if edge['i'] == 'neighbor-of':
-                edges_to_remove.add(edge_id)
-
-        for edge_id in edges_to_remove:
-            self._remove_edge(network, edge_id)
-        number_removed = edge_count - len(network.edges)
+        edges_to_remove = [edge_id for edge_id, edge in network.get_edges()
+                           if edge['i'] == NEIGHBOR_OF]
+        number_removed = self._remove_edges(network, edges_to_remove)
         logger.debug('removed ' + str(number_removed) + ' neighbor-of edges out of ' +
                      str(edge_count))
 
@@ -1130,20 +2100,14 @@ class RedundantEdgeAdjudicator(NetworkUpdator):
         Iterates through every node and deletes the attributes and the nodes PERMANENTLY
         param network
         """
-        node_ids_to_remove = set()
         node_ids_with_edges = set()
-
-        for k, v in network.get_edges():
-            s = v['s']
-            t = v['t']
-            node_ids_with_edges.add(s)
-            node_ids_with_edges.add(t)
+        for v in network.edges.values():
+            node_ids_with_edges.add(v['s'])
+            node_ids_with_edges.add(v['t'])
 
         pre_node_count = len(network.nodes)
         pre_node_attribute_count = len(network.nodeAttributes)
-        for node_id, node in network.get_nodes():
-            if node_id not in node_ids_with_edges:
-                node_ids_to_remove.add(node_id)
+        node_ids_to_remove = set(network.nodes.keys()) - node_ids_with_edges
 
         for node_id in node_ids_to_remove:
             self._remove_node(network, node_id)
@@ -1172,7 +2136,7 @@ class RedundantEdgeAdjudicator(NetworkUpdator):
         return issues
 
 
-class CHEBINodeNameReplacer(NetworkUpdator):
+class CHEBINodeNameReplacer(NodeUpdator):
     """
     If node name starts with CHEBI (then replace that name
     with value in :py:const:`PARTICIPANT_NAME` node attribute
@@ -1182,6 +2146,7 @@ class CHEBINodeNameReplacer(NetworkUpdator):
         Constructor
         """
         super(CHEBINodeNameReplacer, self).__init__()
+        self._pname_map = None
 
     def get_description(self):
         """
@@ -1190,31 +2155,44 @@ class CHEBINodeNameReplacer(NetworkUpdator):
         """
         return 'Replaces node names that start with CHEBI with value in ' + PARTICIPANT_NAME
 
-    def update(self, network):
+    def begin_update(self, network):
+        """
+        Indexes :py:const:`PARTICIPANT_NAME` node attribute
+        of **network**
+
+        :param network: network about to be updated
+        :type network: :py:class:`~ndex2.nice_cx_network.NiceCXNetwork`
+        :return: None
+        """
+        self._pname_map = _index_node_attribute(network, PARTICIPANT_NAME)
+        return None
+
+    def update_node(self, network, nodeid, node):
         """
         If node name starts with CHEBI (anthen replace that name
         with value in :py:const:`PARTICIPANT_NAME` node attribute
 
-        :param network: network to update
+        :param network: network being updated
         :type network: :py:class:`~ndex2.nice_cx_network.NiceCXNetwork`
-        :return: list of issues as strings encountered
+        :param nodeid: id of node
+        :type nodeid: int
+        :param node: node
+        :type node: dict
+        :return: list of issues as strings encountered or None
         :rtype: list
         """
-        issues = []
-        for nodeid, node in network.get_nodes():
-            if not node['n'].startswith('CHEBI'):
-                continue
-            node_attr = network.get_node_attribute(nodeid, PARTICIPANT_NAME)
-            if node_attr is None or node_attr == (None, None):
-                issues.append('Node: ' + str(node) +
-                              ' starts with CHEBI but ' + PARTICIPANT_NAME +
-                              ' node attribute does not exist')
-                continue
-            node['n'] = node_attr['v']
-        return issues
+        if not node['n'].startswith(_CHEBI_NAME_PREFIX):
+            return None
+        p_name = self._pname_map.get(nodeid, _MISS)
+        if p_name is _MISS:
+            return ['Node: ' + str(node) +
+                    ' starts with CHEBI but ' + PARTICIPANT_NAME +
+                    ' node attribute does not exist']
+        node['n'] = p_name
+        return None
 
 
-class CHEBINodeRepresentsPrefixRemover(NetworkUpdator):
+class CHEBINodeRepresentsPrefixRemover(NodeUpdator):
     """
     If node represents starts with chebi:CHEBI then remove
     the chebi:
@@ -1233,25 +2211,28 @@ class CHEBINodeRepresentsPrefixRemover(NetworkUpdator):
         return 'Removes chebi: from node represents fields that ' \
                'start with chebi:CHEBI'
 
-    def update(self, network):
+    def update_node(self, network, nodeid, node):
         """
-        If node name starts with CHEBI (anthen replace that name
-        with value in :py:const:`PARTICIPANT_NAME` node attribute
+        If node represents starts with chebi:CHEBI then
+        remove the chebi:
 
-        :param network: network to update
+        :param network: network being updated
         :type network: :py:class:`~ndex2.nice_cx_network.NiceCXNetwork`
-        :return: list of issues as strings encountered
-        :rtype: list
+        :param nodeid: id of node
+        :type nodeid: int
+        :param node: node
+        :type node: dict
+        :return: None
         """
-        issues = []
-        for nodeid, node in network.get_nodes():
-            if not node['r'].startswith('chebi:CHEBI'):
-                continue
-            node['r'] = node['r'].replace('chebi:', '', 1)
-        return issues
+        represents = node.get('r')
+        if not isinstance(represents, str) or\
+                not represents.startswith(_CHEBI_PREFIX):
+            return None
+        node['r'] = represents[_CHEBI_CUT:]
+        return None
 
 
-class GeneSymbolNodeNameUpdator(NetworkUpdator):
+class GeneSymbolNodeNameUpdator(NodeUpdator):
     """
     For protein nodes updates gene symbol from data
     in gene symbol lookup dictionary
@@ -1261,21 +2242,13 @@ class GeneSymbolNodeNameUpdator(NetworkUpdator):
         Constructor
         """
         super(GeneSymbolNodeNameUpdator, self).__init__()
-        self._gene_symbol_map = None
-        self._load_gene_symbol_map(genesymbol)
-
-    def _load_gene_symbol_map(self, genesymbol):
-        """
-        Loads gene symbol map from command line flag --genesymbol
-        :return:
-        """
         if not os.path.isfile(genesymbol):
             raise NDExNciPidLoaderError('Gene symbol mapping file ' +
                                         str(genesymbol) +
                                         ' does not exist')
-
-        with open(genesymbol, 'r') as f:
-            self._gene_symbol_map = json.load(f)
+        self._genesymbol = genesymbol
+        self._gene_symbol_map = None
+        self._pname_map = None
 
     def get_description(self):
         """
@@ -1284,39 +2257,51 @@ class GeneSymbolNodeNameUpdator(NetworkUpdator):
         """
         return 'Replaces gene symbol with another symbol from lookup table'
 
-    def update(self, network):
+    def begin_update(self, network):
         """
-        Iterates through all nodes in network that are
-        proteins and updates node names with gene symbol
+        Loads gene symbol map and indexes
+        :py:const:`PARTICIPANT_NAME` node attribute of **network**
+
+        :param network: network about to be updated
+        :type network: :py:class:`~ndex2.nice_cx_network.NiceCXNetwork`
+        :return: None
+        """
+        if self._gene_symbol_map is None:
+            self._gene_symbol_map = _load_gene_symbol_map(self._genesymbol)
+        self._pname_map = _index_node_attribute(network, PARTICIPANT_NAME)
+        return None
+
+    def update_node(self, network, nodeid, node):
+        """
+        If node is a protein update node name with gene symbol
         in mapping table.
 
-        :param network: network to update
+        :param network: network being updated
         :type network: :py:class:`~ndex2.nice_cx_network.NiceCXNetwork`
-        :return: list of issues as strings encountered
+        :param nodeid: id of node
+        :type nodeid: int
+        :param node: node
+        :type node: dict
+        :return: list of issues as strings encountered or None
         :rtype: list
         """
-        issues = []
-        for nodeid, node in network.get_nodes():
-            node_attr = network.get_node_attribute(nodeid, PARTICIPANT_NAME)
-            if node_attr is None or node_attr == (None, None):
-                continue
-            p_name = node_attr['v']
+        p_name = self._pname_map.get(nodeid, _MISS)
+        if p_name is _MISS:
+            return None
 
-            if p_name is not None and '_HUMAN' not in p_name:
-                continue
-            gene_symbol_mapped_name = self._gene_symbol_map.get(p_name)
-            if gene_symbol_mapped_name is None:
-                continue
-            clean_symbol = self._gene_symbol_map.get(p_name)
-            if len(clean_symbol) == 0 or clean_symbol == '-':
-                issues.append('Mapping came back with "-"  Going with '
-                              'old name => ' + node['n'])
-            else:
-                if node['n'] != clean_symbol:
-                    logger.debug('Updating node from name: ' +
-                                 node['n'] + ' to ' + clean_symbol)
-                    node['n'] = clean_symbol
-        return issues
+        if p_name is not None and '_HUMAN' not in p_name:
+            return None
+        clean_symbol = self._gene_symbol_map.get(p_name)
+        if clean_symbol is None:
+            return None
+        if len(clean_symbol) == 0 or clean_symbol == '-':
+            return ['Mapping came back with "-"  Going with '
+                    'old name => ' + node['n']]
+        if node['n'] != clean_symbol:
+            logger.debug('Updating node from name: ' +
+                         node['n'] + ' to ' + clean_symbol)
+            node['n'] = clean_symbol
+        return None
 
 
 class GeneSymbolChecker(NetworkUpdator):
@@ -1330,6 +2315,46 @@ class GeneSymbolChecker(NetworkUpdator):
         """
         super(GeneSymbolChecker, self).__init__()
         self._searcher = searcher
+        self._symbol_cache = {}
+
+    def _get_symbol(self, name):
+        """
+        Gets gene symbol for 'name' from searcher passed
+        in constructor remembering the result so names
+        repeated across nodes and networks are only
+        looked up once
+
+        :param name: name to look up
+        :type name: string
+        :return: gene symbol or None or empty string if not found
+        :rtype: string
+        """
+        res = self._symbol_cache.get(name, _MISS)
+        if res is _MISS:
+            res = self._searcher.get_symbol(name)
+            self._symbol_cache[name] = res
+        return res
+
+    def pop_new_symbols(self):
+        """
+        Gets symbols looked up by searcher passed in constructor
+        via :py:func:`GeneSymbolSearcher.pop_new_symbols`
+
+        :return: symbols as {id: symbol}
+        :rtype: dict
+        """
+        return self._searcher.pop_new_symbols()
+
+    def add_symbols(self, symbols):
+        """
+        Adds **symbols** to searcher passed in constructor
+        via :py:func:`GeneSymbolSearcher.add_symbols`
+
+        :param symbols: symbols as {id: symbol}
+        :type symbols: dict
+        :return: None
+        """
+        self._searcher.add_symbols(symbols)
 
     def get_description(self):
         """
@@ -1358,7 +2383,7 @@ class GeneSymbolChecker(NetworkUpdator):
             if node_attr['v'] != 'protein':
                 continue
 
-            res = self._searcher.get_symbol(node['n'])
+            res = self._get_symbol(node['n'])
             if res is None or res == '':
                 issues.append(str(node['n']) + ' does not come back as gene symbol')
             elif res != node['n']:
@@ -1409,8 +2434,9 @@ class NodeTypeUpdator(NetworkUpdator):
                               node_type['v'] +
                               ') found')
             else:
-                network.set_node_attribute(nodeid, 'type', typeval,
-                                           overwrite=True)
+                # node_type is the attribute stored in the network so
+                # update it in place instead of another lookup
+                node_type['v'] = typeval
         return issues
 
 
@@ -1446,17 +2472,20 @@ class NodeAliasUpdator(NetworkUpdator):
         :rtype: list
         """
         issues = []
+        debug_on = logger.isEnabledFor(logging.DEBUG)
         for k, v in network.get_nodes():
             # =============================
             # SET REPRESENTS
             # =============================
             aliases = network.get_node_attribute(v, 'alias')
-            if aliases is not None and len(aliases['v']) > 0:
-                logger.debug('Aliases is: ' + str(aliases))
+            if aliases is not None and aliases['v']:
+                if debug_on:
+                    logger.debug('Aliases is: ' + str(aliases))
                 v['r'] = (aliases['v'][0])
                 if len(aliases['v']) > 1:
-                    network.set_node_attribute(k, 'alias', aliases['v'][1:], type=aliases['d'],
-                                               overwrite=True)
+                    # aliases is the attribute stored in the network so
+                    # update it in place instead of another lookup
+                    aliases['v'] = aliases['v'][1:]
                 else:
                     network.remove_node_attribute(k, 'alias')
             else:
@@ -1464,7 +2493,7 @@ class NodeAliasUpdator(NetworkUpdator):
         return issues
 
 
-class GeneFamilyExpander(NetworkUpdator):
+class GeneFamilyExpander(NodeUpdator):
     """
     Expands gene families by updating
     type to proteinfamily and setting gene symbols
@@ -1475,21 +2504,12 @@ class GeneFamilyExpander(NetworkUpdator):
         Constructor
         """
         super(GeneFamilyExpander, self).__init__()
-        self._gene_symbol_map = None
-        self._load_gene_symbol_map(genesymbol)
-
-    def _load_gene_symbol_map(self, genesymbol):
-        """
-        Loads gene symbol map from command line flag --genesymbol
-        :return:
-        """
         if not os.path.isfile(genesymbol):
             raise NDExNciPidLoaderError('Gene symbol mapping file ' +
                                         str(genesymbol) +
                                         ' does not exist')
-
-        with open(genesymbol, 'r') as f:
-            self._gene_symbol_map = json.load(f)
+        self._genesymbol = genesymbol
+        self._gene_symbol_map = None
 
     def get_description(self):
         """
@@ -1499,39 +2519,50 @@ class GeneFamilyExpander(NetworkUpdator):
         return 'Expands any nodes of type protein with family in name' \
                ' to their proper gene families'
 
-    def update(self, network):
+    def begin_update(self, network):
         """
-        Iterates through all nodes in network that are
-        proteins and updates node names with gene symbol
-        in mapping table.
+        Loads gene symbol map
 
-        :param network: network to update
+        :param network: network about to be updated
         :type network: :py:class:`~ndex2.nice_cx_network.NiceCXNetwork`
-        :return: list of issues as strings encountered
+        :return: None
+        """
+        if self._gene_symbol_map is None:
+            self._gene_symbol_map = _load_gene_symbol_map(self._genesymbol)
+        return None
+
+    def update_node(self, network, nodeid, node):
+        """
+        If node name contains family set 'member' node attribute
+        to gene symbols in mapping table and 'type' to proteinfamily
+
+        :param network: network being updated
+        :type network: :py:class:`~ndex2.nice_cx_network.NiceCXNetwork`
+        :param nodeid: id of node
+        :type nodeid: int
+        :param node: node
+        :type node: dict
+        :return: list of issues as strings encountered or None
         :rtype: list
         """
-        issues = []
-        for nodeid, node in network.get_nodes():
-            if 'family' not in node['n']:
-                continue
-            genelist = self._gene_symbol_map.get(node['n'])
-            if genelist is None:
-                issues.append('No gene list for family ' + str(node['n']))
-                continue
-            memberlist = []
-            if len(genelist) is 0:
-                issues.append('Gene list for family is empty ' + str(node['n']))
-                continue
-            for entry in genelist.split(','):
-                memberlist.append('hgnc.symbol:' + entry)
-            network.set_node_attribute(nodeid, 'member', memberlist, type='list_of_string',
-                                       overwrite=True)
-            network.set_node_attribute(nodeid, 'type', 'proteinfamily', type='string',
-                                       overwrite=True)
-        return issues
+        if 'family' not in node['n']:
+            return None
+        genelist = self._gene_symbol_map.get(node['n'])
+        if genelist is None:
+            return ['No gene list for family ' + str(node['n'])]
+        if not genelist:
+            return ['Gene list for family is empty ' + str(node['n'])]
+        memberlist = []
+        for entry in genelist.split(','):
+            memberlist.append('hgnc.symbol:' + entry)
+        network.set_node_attribute(nodeid, 'member', memberlist, type='list_of_string',
+                                   overwrite=True)
+        network.set_node_attribute(nodeid, 'type', 'proteinfamily', type='string',
+                                   overwrite=True)
+        return None
 
 
-class NodeAttributeRemover(NetworkUpdator):
+class NodeAttributeRemover(NodeUpdator):
     """
     Update node alias attribute
     """
@@ -1549,24 +2580,35 @@ class NodeAttributeRemover(NetworkUpdator):
         """
         return 'Removes node attribute named ' + str(self._attr_name)
 
-    def update(self, network):
+    def begin_update(self, network):
         """
-        Iterates through all nodes in network that are
-        proteins and updates node names with gene symbol
-        in mapping table.
+        Checks attribute name is set
 
-        :param network: network to update
+        :param network: network about to be updated
         :type network: :py:class:`~ndex2.nice_cx_network.NiceCXNetwork`
-        :return: list of issues as strings encountered
+        :return: list of issues as strings encountered or None
         :rtype: list
         """
         if self._attr_name is None:
             return ['Attribute name is None']
+        return None
 
-        issues = []
-        for k, v in network.get_nodes():
-            aliases = network.remove_node_attribute(k, self._attr_name)
-        return issues
+    def update_node(self, network, nodeid, node):
+        """
+        Removes node attribute from node
+
+        :param network: network being updated
+        :type network: :py:class:`~ndex2.nice_cx_network.NiceCXNetwork`
+        :param nodeid: id of node
+        :type nodeid: int
+        :param node: node
+        :type node: dict
+        :return: None
+        """
+        if self._attr_name is None:
+            return None
+        network.remove_node_attribute(nodeid, self._attr_name)
+        return None
 
 
 class ProteinFamilyNodeMemberRemover(NetworkUpdator):
@@ -1582,6 +2624,7 @@ class ProteinFamilyNodeMemberRemover(NetworkUpdator):
         self._member_attr_name = 'member'
         self._hgncprefix = 'hgnc.symbol:'
         self._hgncprefix_len = len(self._hgncprefix)
+        self._edge_fac = NetworkEdgeFactory()
 
     def get_description(self):
         """
@@ -1601,11 +2644,38 @@ class ProteinFamilyNodeMemberRemover(NetworkUpdator):
         :return: list of issues as strings encountered
         :rtype: list
         """
-        net_edge_fac = NetworkEdgeFactory()
-        net_node_fac = NetworkNodeFactory()
         issues = []
         node_name_to_id = None
         nodes_to_remove = set()
+
+        # node id to edge ids index kept up to date as edges
+        # are added and removed below so edges connected to a
+        # node do not require a scan of all edges. Like
+        # node_name_to_id it is only built once a family
+        # with members is found
+        adj = None
+
+        def get_edges_of_node(node_id):
+            # sorted so edges are in same order as network.get_edges()
+            get_edge = self._edge_fac.get_network_edge_from_network
+            return [get_edge(net_cx=network, edge_id=eid)
+                    for eid in sorted(adj.get(node_id, ()))]
+
+        def add_edge(edge, source_node_id=None, target_node_id=None):
+            new_id = edge.add_edge_to_network(net_cx=network,
+                                              source_node_id=source_node_id,
+                                              target_node_id=target_node_id)
+            new_edge = network.get_edge(new_id)
+            adj.setdefault(new_edge['s'], set()).add(new_id)
+            adj.setdefault(new_edge['t'], set()).add(new_id)
+
+        def remove_edge(edge):
+            edge.remove_edge_from_network(net_cx=network)
+            for node_id in (edge.get_source_node_id(),
+                            edge.get_target_node_id()):
+                if node_id in adj:
+                    adj[node_id].discard(edge.get_id())
+
         for family_node_id, family_node_obj in network.get_nodes():
             family_members,\
             sub_issues = self._get_members_of_family_node(network, family_node_id)
@@ -1614,14 +2684,11 @@ class ProteinFamilyNodeMemberRemover(NetworkUpdator):
             if len(family_members) == 0:
                 continue
 
-            # get all edges connected to family node
-            family_node_edges = net_edge_fac.\
-                get_all_edges_connected_to_node(net_cx=network,
-                                                node_id=family_node_id)
-
-            # create node name to id dict if we have not already
+            # create node name to id dict and edge index
+            # if we have not already
             if node_name_to_id is None:
                 node_name_to_id = self._get_node_name_to_id_dict(network)
+                adj = _build_node_edge_index(network)
 
             for member in family_members:
                 if member not in node_name_to_id:
@@ -1631,15 +2698,12 @@ class ProteinFamilyNodeMemberRemover(NetworkUpdator):
                 mem_node_id = node_name_to_id[member]
                 # so this member has a regular node in the network
                 # need to check edges
-                all_member_edges = net_edge_fac.\
-                    get_all_edges_connected_to_node(net_cx=network,
-                                                    node_id=mem_node_id)
+                all_member_edges = get_edges_of_node(mem_node_id)
                 for member_edge in all_member_edges:
                     # need to move edge over
                     # determine source and target node id by replacing the
                     # edge id to the member node which could be a source
                     # or target
-                    mem_node_id = node_name_to_id[member]
                     if member_edge.get_source_node_id() == mem_node_id:
                         new_source_id = family_node_id
                         new_target_id = member_edge.get_target_node_id()
@@ -1648,76 +2712,89 @@ class ProteinFamilyNodeMemberRemover(NetworkUpdator):
                         new_source_id = member_edge.get_source_node_id()
 
                     # move the edge and its attributes over to the family node
-                    member_edge.\
-                        add_edge_to_network(net_cx=network,
-                                            source_node_id=new_source_id,
-                                            target_node_id=new_target_id)
-
-                # get all edges connected to family
-                updated_family_edges = net_edge_fac.\
-                    get_all_edges_connected_to_node(net_cx=network,
-                                                    node_id=family_node_id)
-
-                # take all the family edges and merge them into a
-                # new list of edges
-                new_edges = self.\
-                    _get_merged_edges(updated_family_edges)
-
-                # remove old family edges
-                for old_fedge in updated_family_edges:
-                    old_fedge.remove_edge_from_network(net_cx=network)
-
-                # add new family edges
-                for new_edge in new_edges:
-                    new_edge.add_edge_to_network(net_cx=network)
-
-                nodes_to_remove.add(node_name_to_id[member])
+                    add_edge(member_edge, source_node_id=new_source_id,
+                             target_node_id=new_target_id)
+
+                # group all edges connected to family and replace each
+                # group that needs merging with a single merged edge.
+                # Edges with nothing to merge are left in the network
+                # as is instead of being removed and added back
+                edge_dict = self.\
+                    _get_edge_dict(get_edges_of_node(family_node_id))
+                for group in edge_dict.values():
+                    if len(group) == 1:
+                        continue
+                    for old_fedge in group:
+                        remove_edge(old_fedge)
+                    add_edge(self._merge_edge_group(group))
+
+                nodes_to_remove.add(mem_node_id)
                 issues.append(str(member) +
                               ' node removed since it is part of ' +
                               str(family_node_obj['n']))
 
-        # remove all the member nodes that are in families
+        # remove all the member nodes that are in families. This is
+        # done after all families are processed since a member can
+        # be in more than one family. The node attributes are not
+        # needed to remove the node so skip copying them
         for node_id in nodes_to_remove:
-            mem_node = net_node_fac.\
-                get_network_node_from_network(net_cx=network,
-                                              node_id=node_id)
-            mem_node.remove_node_from_network(net_cx=network)
+            node_obj = network.get_node(node_id)
+            mem_node = NetworkNode(node_id=node_id, name=node_obj['n'],
+                                   represents=node_obj.get('r'),
+                                   network_edge_factory=self._edge_fac)
+            mem_edges = get_edges_of_node(node_id)
+            for mem_edge in mem_edges:
+                remove_edge(mem_edge)
+            mem_node.remove_node_from_network(net_cx=network, edges=[])
 
         return issues
 
-    def _get_edge_key(self, edge, flip_src_target=False):
+    def _get_directed_value(self, edge):
         """
-        Gets edge key
+        Gets value of 'directed' attribute on **edge**
+
         :param edge:
-        :return:
+        :type edge: :py:class:`~ndexncipidloader.network.NetworkEdge`
+        :return: value of 'directed' attribute or ``False`` if not set
+        """
+        attributes = edge.get_attributes()
+        if attributes is None:
+            return False
+        for attrib in attributes:
+            if attrib.get_name() == 'directed':
+                return attrib.get_value()
+        return False
+
+    def _get_edge_key(self, edge, d_val=None):
         """
-        if flip_src_target is True:
-            src_id = edge.get_target_node_id()
-            target_id = edge.get_source_node_id()
-        else:
-            src_id = edge.get_source_node_id()
-            target_id = edge.get_target_node_id()
-        d_val = False
-        if edge.get_attributes() is not None:
-            for attrib in edge.get_attributes():
-                if attrib.get_name() == 'directed':
-                    d_val = attrib.get_value()
-                    break
-
-        return 's=' + str(src_id) + ', t=' +\
-               str(target_id) + ', i=' +\
-               edge.get_interaction() +\
-               ', directed=' + str(d_val), d_val
+        Gets edge key. The source and target node ids are put
+        in ascending order so edges with flipped source and
+        target get the same key
+        :param edge:
+        :param d_val: value of 'directed' attribute on **edge**, if
+                      ``None`` it is looked up via
+                      :py:func:`_get_directed_value`
+        :return: (key, directed value)
+        :rtype: tuple
+        """
+        src_id = edge.get_source_node_id()
+        target_id = edge.get_target_node_id()
+        if target_id < src_id:
+            src_id, target_id = target_id, src_id
+        if d_val is None:
+            d_val = self._get_directed_value(edge)
+
+        return (src_id, target_id, edge.get_interaction(), d_val), d_val
 
     def _get_edge_dict(self, edges):
         """
         Groups a list of edges by source, target, interaction, and directed
         attribute. The result is a dict
-        where the key is a str in form:
+        where the key is a tuple in form:
 
         .. code-block:: python
 
-            s=<SRC NODE>, t=<TARGET NODE>, i=<INTERACTION>, directed=<VALUE>
+            (<LOWER NODE ID>, <HIGHER NODE ID>, <INTERACTION>, <DIRECTED VALUE>)
 
         and the values are a list of
         :py:class:`~ndexncipidloader.network.NetworkEdge` objects
@@ -1725,7 +2802,7 @@ class ProteinFamilyNodeMemberRemover(NetworkUpdator):
 
         .. note::
 
-            If two edges have directed ``False``, matching interaction,
+            If two edges have the same directed value, matching interaction,
             but flipped source and target node ids, then they will be
             grouped into the same list
 
@@ -1737,22 +2814,11 @@ class ProteinFamilyNodeMemberRemover(NetworkUpdator):
         """
         edge_dict = {}
 
+        get_directed_value = self._get_directed_value
         for edge in edges:
-            e_key, d_val = self._get_edge_key(edge)
-
-            if e_key not in edge_dict:
-                reverse_e_key, _ = self._get_edge_key(edge,
-                                                      flip_src_target=True)
-                # check if key is in reverse
-                # if so set e_key to the reverse key
-                # otherwise add new entry in dict with
-                # original e_key
-                if reverse_e_key in edge_dict:
-                    e_key = reverse_e_key
-                else:
-                    edge_dict[e_key] = []
-            # append the edge to dict
-            edge_dict[e_key].append(edge)
+            e_key, d_val = self._get_edge_key(edge,
+                                              d_val=get_directed_value(edge))
+            edge_dict.setdefault(e_key, []).append(edge)
         return edge_dict
 
     def _get_merged_edges(self, edges):
@@ -1768,28 +2834,41 @@ class ProteinFamilyNodeMemberRemover(NetworkUpdator):
         """
         edge_dict = self._get_edge_dict(edges)
 
+        # one group per edge means nothing to merge
+        if len(edge_dict) == len(edges):
+            return list(edges)
+
         # okay edge_dict has edges with same source target and interaction
         # if values are single, its easy fix add to new list
         # if there are multiple then call
         # the merge edge function and add the resulting merged edge
         new_edges = []
-        merged_edges = []
-        for key in edge_dict.keys():
-            if len(edge_dict[key]) == 1:
-                new_edges.append(edge_dict[key][0])
+        for group in edge_dict.values():
+            if len(group) == 1:
+                new_edges.append(group[0])
                 continue
-
-            base_edge = edge_dict[key][0]
-            for sub_edge in edge_dict[key][1:]:
-                if logger.isEnabledFor(logging.DEBUG):
-                    merged_edges.append(str(sub_edge))
-                base_edge.merge_edge(sub_edge)
-            new_edges.append(base_edge)
-            if logger.isEnabledFor(logging.DEBUG):
-                logger.debug(str(merged_edges) +
-                             ' merged into: ' + str(base_edge))
+            new_edges.append(self._merge_edge_group(group))
         return new_edges
 
+    def _merge_edge_group(self, edges):
+        """
+        Merges all the **edges** into the first edge in the list
+
+        :param edges: list of
+                      :py:class:`~ndexncipidloader.network.NetworkEdge`
+                      objects with same key from :py:func:`_get_edge_key`
+        :type edges: list
+        :return: first edge in **edges** with the others merged into it
+        :rtype: :py:class:`~ndexncipidloader.network.NetworkEdge`
+        """
+        base_edge = edges[0]
+        for sub_edge in edges[1:]:
+            base_edge.merge_edge(sub_edge)
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug(str([str(e) for e in edges[1:]]) +
+                         ' merged into: ' + str(base_edge))
+        return base_edge
+
     def _get_node_name_to_id_dict(self, network):
         """
         Builds dict with key as node name and value is node id
@@ -1799,10 +2878,8 @@ class ProteinFamilyNodeMemberRemover(NetworkUpdator):
         :return:
         :rtype: dict
         """
-        node_name_to_id = {}
-        for node_id, node_obj in network.get_nodes():
-            node_name_to_id[node_obj['n']] = node_id
-        return node_name_to_id
+        return {node_obj['n']: node_id
+                for node_id, node_obj in network.get_nodes()}
 
     def _get_members_of_family_node(self, network, node_id):
         """
@@ -1827,14 +2904,10 @@ class ProteinFamilyNodeMemberRemover(NetworkUpdator):
                           str(self._member_attr_name) +
                           ' attribute is not of type list')
             return [], issues
-        node_names = []
-
-        for entry in m_list:
-            if entry.startswith(self._hgncprefix):
-                name_only = entry[self._hgncprefix_len:]
-            else:
-                name_only = entry
-            node_names.append(name_only)
+        prefix = self._hgncprefix
+        prefix_len = self._hgncprefix_len
+        node_names = [entry[prefix_len:] if entry.startswith(prefix)
+                      else entry for entry in m_list]
         return node_names, issues
 
 
@@ -1847,8 +2920,8 @@ class NDExNciPidLoader(object):
     def __init__(self, args,
                  netattribfac=None,
                  networkupdators=None,
-                 py4cyto=Py4CytoscapeWrapper(),
-                 ndexextra=NDExExtraUtils()):
+                 py4cyto=None,
+                 ndexextra=None):
         """
         Constructor
 
@@ -1858,6 +2931,12 @@ class NDExNciPidLoader(object):
         :type netattribfac: :py:class:`NetworkAttributesFromTSVFactory`
         :param networkupdators: list of :py:class:`NetworkUpdators`
         :type networkupdators: list(:py:class:`NetworkUpdators`)
+        :param py4cyto: wrapper used to talk to Cytoscape, if ``None``
+                        a :py:class:`ndexutil.cytoscape.Py4CytoscapeWrapper`
+                        is created when a Cytoscape layout is first run
+        :param ndexextra: if ``None`` a
+                          :py:class:`ndexutil.ndex.NDExExtraUtils` is
+                          created when a Cytoscape layout is first run
         """
         self._args = args
         self._user = None
@@ -1891,6 +2970,24 @@ class NDExNciPidLoader(object):
 
         self._networksystemproperty_retry = 3
         self._networksystemproperty_wait = 1
+        self._worker_key = None
+
+    def __getstate__(self):
+        """
+        Gets state to pickle when this loader is sent to worker
+        processes. The NDEx and Cytoscape clients are left out so
+        each worker creates its own, as are the style template and
+        network attributes, which :py:func:`_get_worker_loader`
+        loads in the worker, so little is sent with each file
+
+        :return: state
+        :rtype: dict
+        """
+        state = self.__dict__.copy()
+        for key in ['_ndex', '_py4', '_ndexextra', '_template',
+                    '_netattrib']:
+            state[key] = None
+        return state
 
     def _parse_config(self):
         """
@@ -1900,8 +2997,13 @@ class NDExNciPidLoader(object):
         :py:const:`~ndexutil.config.NDExUtilConfig.PASSWORD`
         :py:const:`~ndexutil.config.NDExUtilConfig.SERVER`
 
+        If configuration has already been parsed this method
+        does nothing.
+
         :return: None
         """
+        if self._user is not None:
+            return
         ncon = NDExUtilConfig(conf_file=self._args.conf)
         con = ncon.get_config()
         self._user = con.get(self._args.profile, NDExUtilConfig.USER)
@@ -1910,25 +3012,36 @@ class NDExNciPidLoader(object):
 
     def _parse_load_plan(self):
         """
+        Loads the load plan specified by self._args.loadplan into
+        self._loadplan unless it has already been loaded
 
         :return:
         """
+        if self._loadplan is not None:
+            return
         with open(self._args.loadplan, 'r') as f:
             self._loadplan = json.load(f)
 
     def _load_network_attributes(self):
         """
         Uses netattribfac passed in constructor to create
-        a network attributes object
+        a network attributes object unless one has already
+        been created
         :return:
         """
+        if self._netattrib is not None:
+            return
         self._netattrib = self._netattribfac.get_network_attributes_obj()
 
     def _load_style_template(self):
         """
         Loads the CX network specified by self._args.style into self._template
+        unless it has already been loaded
         :return:
         """
+        if self._template is not None:
+            return
+        import ndex2
         self._template = ndex2.create_nice_cx_from_file(os.path.abspath(self._args.style))
 
     def _load_network_summaries_for_user(self):
@@ -1938,10 +3051,9 @@ class NDExNciPidLoader(object):
         :return: dict
         """
         net_summaries = self._ndex.get_network_summaries_for_user(self._user)
-        self._net_summaries = {}
-        for nk in net_summaries:
-            if nk.get('name') is not None:
-                self._net_summaries[nk.get('name').upper()] = nk.get('externalId')
+        self._net_summaries = {nk['name'].upper(): nk.get('externalId')
+                               for nk in net_summaries
+                               if nk.get('name') is not None}
 
     def _get_network_properties(self, network_id):
         """
@@ -1960,7 +3072,8 @@ class NDExNciPidLoader(object):
         return return_properties
 
     def _merge_node_attributes(self, network, source_attribute1,
-                               source_attribute2, target_attribute):
+                               source_attribute2, target_attribute,
+                               nodes=None):
         """
         Iterate through every node in 'network' and put the attributes in
         'source_attribute1' or 'source_attribute2' into a new 'target_attribute'
@@ -1971,25 +3084,99 @@ class NDExNciPidLoader(object):
         :param source_attribute1:
         :param source_attribute2:
         :param target_attribute:
+        :param nodes: (node id, node) tuples to merge, if ``None``
+                      :py:func:`get_nodes` is called on 'network'
+        :type nodes: list
         :return: list of issues as string
         :rtype: list
         """
-        issues = []
-        for node_id, node in network.get_nodes():
-            value1 = network.get_node_attribute(node, source_attribute1)
-            value2 = network.get_node_attribute(node, source_attribute2)
-            if value1 and value2:
-                if value1['v'] != value2['v']:
-                    issues.append('both attributes have values' +
-                                  source_attribute1 + ' => ' + str(value1['v']) + ' and ' +
-                                  source_attribute2 + ' => ' + str(value2['v']))
-            merged_value = value1 or value2
-            if merged_value:
-                network.set_node_attribute(node['@id'], target_attribute, merged_value['v'],
-                                           type=merged_value['d'],
-                                           overwrite=True)
-                network.remove_node_attribute(node, source_attribute1)
-                network.remove_node_attribute(node, source_attribute2)
+        return self._merge_node_attribute_pairs(network,
+                                                [(source_attribute1,
+                                                  source_attribute2,
+                                                  target_attribute)],
+                                                nodes=nodes)[0]
+
+    def _merge_node_attribute_pairs(self, network, merges, nodes=None):
+        """
+        Same as :py:func:`_merge_node_attributes`, but runs every merge in
+        'merges' in one pass over the nodes and one scan of each node's
+        attributes. The merges are applied to a node in the order given,
+        so the result matches calling :py:func:`_merge_node_attributes`
+        once per merge as long as no target attribute is also a source
+        attribute
+
+        :param network:
+        :type network: :py:class:`~ndex2.nice_cx_network.NiceCXNetwork`
+        :param merges: (source attribute 1, source attribute 2,
+                       target attribute) tuples
+        :type merges: list
+        :param nodes: (node id, node) tuples to merge, if ``None``
+                      :py:func:`get_nodes` is called on 'network'
+        :type nodes: list
+        :return: list of issues for each merge in 'merges'
+        :rtype: list
+        """
+        issues = [[] for merge in merges]
+        source_names = set()
+        for source_attribute1, source_attribute2, target in merges:
+            source_names.add(source_attribute1)
+            source_names.add(source_attribute2)
+
+        if nodes is None:
+            nodes = network.get_nodes()
+        node_attributes = network.nodeAttributes
+        for node_id, node in nodes:
+            attrs = node_attributes.get(node_id)
+            if not attrs:
+                continue
+
+            # find first value of all source attributes with one
+            # scan of the node's attributes
+            values = {}
+            for attr in attrs:
+                attr_name = attr.get('n')
+                if attr_name in source_names and attr_name not in values:
+                    values[attr_name] = attr
+
+            if not values:
+                continue
+
+            for merge_issues, merge in zip(issues, merges):
+                source_attribute1, source_attribute2, target_attribute = merge
+                value1 = values.get(source_attribute1)
+                value2 = values.get(source_attribute2)
+                if value1 and value2:
+                    if value1['v'] != value2['v']:
+                        merge_issues.append('both attributes have values' +
+                                            source_attribute1 + ' => ' + str(value1['v']) + ' and ' +
+                                            source_attribute2 + ' => ' + str(value2['v']))
+                merged_value = value1 or value2
+                if not merged_value:
+                    continue
+                if merged_value['v'] is None or merged_value['d'] is None:
+                    # let ndex2 raise on missing value or infer the type
+                    network.set_node_attribute(node_id, target_attribute, merged_value['v'],
+                                               type=merged_value['d'],
+                                               overwrite=True)
+                    new_attr = None
+                else:
+                    new_attr = {'po': node_id, 'n': target_attribute,
+                                'v': merged_value['v'],
+                                'd': merged_value['d']}
+
+                # rebuild the attribute list in one go dropping the
+                # source attributes found above and any existing target
+                # attribute which is what set_node_attribute(overwrite=True)
+                # followed by remove_node_attribute() calls did
+                attrs = node_attributes[node_id]
+                if new_attr is None:
+                    attrs[:] = [attr for attr in attrs
+                                if attr is not value1 and attr is not value2]
+                else:
+                    attrs[:] = [attr for attr in attrs
+                                if attr is not value1 and attr is not value2 and
+                                attr.get('n') != target_attribute]
+                    attrs.append(new_attr)
         return issues
 
     def _get_pandas_dataframe(self, file_name):
@@ -2000,52 +3187,58 @@ class NDExNciPidLoader(object):
         """
         path_to_sif = os.path.join(os.path.abspath(self._args.sifdir),
                                    file_name)
-        if os.path.getsize(path_to_sif) is 0:
+        with open(path_to_sif, 'r') as f:
+            text = f.read()
+
+        # checking what was read saves a stat() call per file
+        if len(text) == 0:
             logger.error('File is empty: ' + path_to_sif)
             return None
 
-        with open(path_to_sif, 'r') as f:
-            lines = f.readlines()
-
-        mode = "edge"
-        edge_lines = []
-        edge_rows_tuples = []
-        node_rows_tuples = []
-        edge_fields = []
-        node_fields = []
-        for index in range(len(lines)):
-            line = self._normalize_context_prefixes(lines[index])
-            if index is 0:
-                edge_fields = [h.strip() for h in line.split('\t')]
-            elif line == '\n':
-                mode = "node_header"
-            elif mode is "node_header":
-                node_fields = [h.strip() for h in line.split('\t')]
-                mode = "node"
-            elif mode is "node":
-                node_tuple = tuple(line.split('\t'))
-                node_rows_tuples.append(node_tuple)
-            elif mode is "edge":
-                edge_tuple = tuple(line.split('\t'))
-                edge_rows_tuples.append(edge_tuple)
-                edge_lines.append(line)
-
-        df = pd.DataFrame.from_records(edge_rows_tuples, columns=edge_fields)
-
-        df_nodes = pd.DataFrame.from_records(node_rows_tuples, columns=node_fields)
-
-        df_with_a = df.join(df_nodes.set_index('PARTICIPANT'), on='PARTICIPANT_A')
-
-        df_with_a_b = df_with_a.join(df_nodes.set_index('PARTICIPANT'), on='PARTICIPANT_B', lsuffix='_A',
-                                     rsuffix='_B')
-        df_with_a_b = df_with_a_b.replace('\n', '', regex=True)
-        df_with_a_b['PARTICIPANT_A'] = df_with_a_b['PARTICIPANT_A'].map(lambda x: x.lstrip('[').rstrip(']'))
-        df_with_a_b['PARTICIPANT_B'] = df_with_a_b['PARTICIPANT_B'].map(lambda x: x.lstrip('[').rstrip(']'))
+        text = self._normalize_context_prefixes(text)
+
+        # edges come first followed by a blank line and then the nodes
+        edges_text, _, nodes_text = text.partition('\n\n')
+
+        df = self._read_sif_section(edges_text)
+
+        df_nodes = self._read_sif_section(nodes_text)
+
+        # index the nodes once and use it for both joins
+        df_nodes = df_nodes.set_index('PARTICIPANT')
+
+        df_with_a = df.join(df_nodes, on='PARTICIPANT_A')
+
+        df_with_a_b = df_with_a.join(df_nodes, on='PARTICIPANT_B',
+                                     lsuffix='_A', rsuffix='_B')
+        for col in ('PARTICIPANT_A', 'PARTICIPANT_B'):
+            participants = df_with_a_b[col].str.lstrip('[')
+            df_with_a_b[col] = participants.str.rstrip(']')
         return df_with_a_b
 
+    def _read_sif_section(self, text):
+        """
+        Parses tab delimited **text** with a header line into a
+        :py:class:`pandas.DataFrame` leaving all values as str
+
+        :param text: edge or node section of SIF file
+        :type text: str
+        :return: data frame with header values as column names
+        :rtype: :py:class:`pandas.DataFrame`
+        """
+        import pandas as pd
+        section_df = pd.read_csv(io.StringIO(text), sep='\t', dtype=str,
+                                 engine='c', quoting=csv.QUOTE_NONE,
+                                 na_filter=False)
+        section_df.columns = [h.strip() for h in section_df.columns]
+        return section_df
+
     def _normalize_context_prefixes(self, theline):
         """this function replaces any references of uniprot knowledgebase: with uniprot: and
         kegg compound: with kegg.compound: to adhere to new normalization conventions
+
+        None of the prefixes span a line so this can be run on the
+        text of a whole SIF file at once
         """
         if theline is None:
             logger.warning('Unexpected None passed in')
@@ -2068,8 +3261,59 @@ class NDExNciPidLoader(object):
         :rtype: list
         """
         return [{'node': n,
-                 'x': float(G.pos[n][0]),
-                 'y': float(G.pos[n][1])} for n in G.pos]
+                 'x': float(xy[0]),
+                 'y': float(xy[1])} for n, xy in G.pos.items()]
+
+    def _get_node_scale(self, num_nodes):
+        """
+        Gets scale for coordinates of a layout, which grows with the
+        number of nodes
+
+        :param num_nodes: number of nodes in network
+        :type num_nodes: int
+        :return: scale
+        :rtype: int
+        """
+        if num_nodes < 10:
+            return num_nodes*20
+        if num_nodes < 20:
+            return num_nodes*15
+        if num_nodes < 100:
+            return num_nodes*10
+        return num_nodes*5
+
+    def _apply_forceatlas2_layout(self, network, iterations=50):
+        """
+        Applies ForceAtlas2 layout from
+        `fa2 <https://pypi.org/project/fa2>`_ with Barnes-Hut
+        approximation of the repulsive forces and puts the coordinates
+        into 'cartesianLayout' aspect on the 'network' passed in.
+        Unlike :py:func:`_apply_simple_spring_layout` each iteration
+        is O(N log N) instead of O(N^2)
+
+        :param network: Network to update
+        :type network: :py:class:`~ndex2.nice_cx_network.NiceCXNetwork`
+        :param iterations: Number of iterations to run
+                           default is 50
+        :type iterations: int
+        :raises NDExNciPidLoaderError: if fa2 is not installed
+        :return: None
+        """
+        try:
+            from fa2 import ForceAtlas2
+        except ImportError:
+            raise NDExNciPidLoaderError('fa2 package must be installed '
+                                        'to use forceatlas2 layout')
+
+        num_nodes = len(network.nodes)
+        my_networkx = network.to_networkx(mode='default')
+        forceatlas2 = ForceAtlas2(barnesHutOptimize=True,
+                                  scalingRatio=self._get_node_scale(num_nodes),
+                                  verbose=False)
+        my_networkx.pos = forceatlas2.\
+            forceatlas2_networkx_layout(my_networkx, iterations=iterations)
+        cartesian_aspect = self._cartesian(my_networkx)
+        network.set_opaque_aspect("cartesianLayout", cartesian_aspect)
 
     def _apply_simple_spring_layout(self, network, iterations=50):
         """
@@ -2085,31 +3329,141 @@ class NDExNciPidLoader(object):
         :type iterations: int
         :return: None
         """
+        import networkx as nx
 
-        num_nodes = len(network.get_nodes())
+        # size of the underlying node dict, no need to go
+        # through get_nodes()
+        num_nodes = len(network.nodes)
         my_networkx = network.to_networkx(mode='default')
-        if num_nodes < 10:
-            nodescale = num_nodes*20
-        elif num_nodes < 20:
-            nodescale = num_nodes*15
-        elif num_nodes < 100:
-            nodescale = num_nodes*10
-        else:
-            nodescale = num_nodes*5
+        nodescale = self._get_node_scale(num_nodes)
 
+        layout_kwargs = {}
+        method = self._get_spring_layout_method(nx, num_nodes)
+        if method is not None:
+            layout_kwargs['method'] = method
         my_networkx.pos = nx.drawing.spring_layout(my_networkx,
                                                    scale=nodescale,
                                                    k=1.8,
-                                                   iterations=iterations)
+                                                   iterations=iterations,
+                                                   **layout_kwargs)
         cartesian_aspect = self._cartesian(my_networkx)
         network.set_opaque_aspect("cartesianLayout", cartesian_aspect)
 
+    def _get_spring_layout_method(self, nx, num_nodes):
+        """
+        Gets the method to pass to :py:func:`networkx.drawing.spring_layout`.
+        For networks with at least :py:const:`ENERGY_SPRING_LAYOUT_MIN_NODES`
+        nodes ``energy`` is returned, which minimizes the Fruchterman-Reingold
+        energy with L-BFGS and converges in far fewer steps than the default
+        force iteration. This requires networkx 3.4+ and scipy.
+
+        :param nx: networkx module
+        :type nx: module
+        :param num_nodes: number of nodes in network
+        :type num_nodes: int
+        :return: ``energy`` or ``None`` to use the networkx default
+        :rtype: str
+        """
+        if num_nodes < ENERGY_SPRING_LAYOUT_MIN_NODES:
+            return None
+        params = inspect.signature(nx.drawing.spring_layout).parameters
+        if 'method' not in params:
+            logger.debug('Installed networkx lacks energy spring layout')
+            return None
+        if importlib.util.find_spec('scipy') is None:
+            logger.debug('scipy not installed, cannot use energy '
+                         'spring layout')
+            return None
+        return 'energy'
+
+    def _get_cx_with_node_id_attribute(self, network):
+        """
+        Gets CX of 'network' with id of each node added as a
+        :py:const:`NDExExtraUtils.ORIG_NODE_ID_ATTR` node attribute, which
+        :py:func:`NDExExtraUtils.extract_layout_aspect_from_cx` uses to map
+        the layout from Cytoscape back to the node ids. This matches
+        :py:func:`NDExExtraUtils.add_node_id_as_node_attribute`, but
+        works in memory. The attributes are removed from 'network' before
+        returning
+
+        :param network:
+        :type network: :py:class:`~ndex2.nice_cx_network.NiceCXNetwork`
+        :return: CX
+        :rtype: list
+        """
+        from ndexutil.ndex import NDExExtraUtils
+        attr_name = NDExExtraUtils.ORIG_NODE_ID_ATTR
+        node_attributes = network.nodeAttributes
+        added_to = []
+        try:
+            for node_id in network.nodes:
+                attrs = node_attributes.get(node_id)
+                if attrs is None:
+                    attrs = []
+                    node_attributes[node_id] = attrs
+                attrs.append({'po': node_id, 'n': attr_name,
+                              'v': node_id, 'd': 'long'})
+                added_to.append(node_id)
+            return network.to_cx()
+        finally:
+            for node_id in added_to:
+                attrs = node_attributes[node_id]
+                attrs.pop()
+                if not attrs:
+                    del node_attributes[node_id]
+
+    def _get_layout_cache_file(self, network):
+        """
+        Gets path to file in directory set via **--layoutcache** flag
+        for layout of 'network'. The file name is a hash of the layout
+        name along with the node ids and the source and target of every
+        edge so a network whose topology did not change reuses the
+        layout computed on an earlier run
+
+        :param network:
+        :type network: :py:class:`~ndex2.nice_cx_network.NiceCXNetwork`
+        :return: path to cache file or None if no cache directory is set
+        :rtype: string
+        """
+        if self._args.layoutcache is None:
+            return None
+        edges = sorted((edge['s'], edge['t'])
+                       for edge in network.edges.values())
+        topology = ' '.join([str(self._args.layout),
+                             ','.join(str(n) for n in sorted(network.nodes)),
+                             ','.join(str(s) + '-' + str(t)
+                                      for s, t in edges)])
+        digest = hashlib.sha256(topology.encode('utf-8')).hexdigest()
+        return os.path.join(self._args.layoutcache, digest + '.json')
+
     def _apply_cytoscape_layout(self, network):
         """
-        Applies Cytoscape layout on network
+        Applies Cytoscape layout on network. If a layout for a network
+        with same topology was cached via **--layoutcache** flag, that
+        layout is used and Cytoscape is not contacted
+
         :param network:
         :return:
         """
+        cache_file = self._get_layout_cache_file(network)
+        if cache_file is not None and os.path.isfile(cache_file):
+            try:
+                with open(cache_file, 'r') as f:
+                    cached_layout = json.load(f)
+                logger.info('Using cached layout from: ' + cache_file)
+                network.set_opaque_aspect('cartesianLayout', cached_layout)
+                return
+            except ValueError as ve:
+                logger.error('Unable to parse cached layout file ' +
+                             cache_file + ' running layout instead : ' +
+                             str(ve))
+
+        if self._py4 is None:
+            from ndexutil.cytoscape import Py4CytoscapeWrapper
+            self._py4 = Py4CytoscapeWrapper()
+        if self._ndexextra is None:
+            from ndexutil.ndex import NDExExtraUtils
+            self._ndexextra = NDExExtraUtils()
 
         try:
             self._py4.cytoscape_ping()
@@ -2119,18 +3473,16 @@ class NDExNciPidLoader(object):
 
         tmp_cx_file = os.path.join(self._args.sifdir, 'tmp.cx')
 
-        with open(tmp_cx_file, 'w') as f:
-            json.dump(network.to_cx(), f)
-
-        annotated_cx_file = os.path.join(self._args.sifdir, 'annotated.tmp.cx')
+        # annotate node ids in memory and write the CX once instead of
+        # writing it, reloading it and writing an annotated copy
+        _write_cx_to_file(self._get_cx_with_node_id_attribute(network),
+                          tmp_cx_file)
 
-        self._ndexextra.add_node_id_as_node_attribute(cxfile=tmp_cx_file,
-                                                      outcxfile=annotated_cx_file)
-        file_size = os.path.getsize(annotated_cx_file)
+        file_size = os.path.getsize(tmp_cx_file)
 
-        logger.info('Importing network from file: ' + annotated_cx_file +
+        logger.info('Importing network from file: ' + tmp_cx_file +
                     ' (' + str(file_size) + ' bytes) into Cytoscape')
-        net_dict = self._py4.import_network_from_file(annotated_cx_file,
+        net_dict = self._py4.import_network_from_file(tmp_cx_file,
                                                       base_url=self._args.cyresturl)
         if 'networks' not in net_dict:
             raise NDExNciPidLoaderError('Error network view could not '
@@ -2140,7 +3492,6 @@ class NDExNciPidLoader(object):
                                         'viewThreshold property in '
                                         'Cytoscape preferences')
 
-        os.unlink(annotated_cx_file)
         net_suid = net_dict['networks'][0]
 
         logger.info('Applying layout ' + self._args.layout +
@@ -2164,6 +3515,17 @@ class NDExNciPidLoader(object):
         layout_aspect = self._ndexextra.extract_layout_aspect_from_cx(input_cx_file=tmp_cx_file)
         network.set_opaque_aspect('cartesianLayout', layout_aspect)
 
+        if cache_file is not None and layout_aspect is not None:
+            os.makedirs(self._args.layoutcache, exist_ok=True)
+            logger.debug('Caching layout to: ' + cache_file)
+            # write to a temporary file and rename so an interrupted
+            # write, or another run caching the same layout, does
+            # not leave a corrupt cache file
+            tmp_cache = cache_file + '.' + str(os.getpid()) + '.tmp'
+            with open(tmp_cache, 'w') as f:
+                json.dump(layout_aspect, f)
+            os.replace(tmp_cache, cache_file)
+
     def _process_sif(self, file_name):
         """
         Processes sif file
@@ -2171,12 +3533,29 @@ class NDExNciPidLoader(object):
         :return: Report on issues found with processing
         :rtype: :py:class:`NetworkIssueReport`
         """
-        node_table = []
+        res = self._build_network(file_name)
+        if res is None:
+            return None
+        network, report = res
+        return self._save_network(network, report)
+
+    def _build_network(self, file_name):
+        """
+        Creates network from sif file merging node attributes
+        and running network updators passed in constructor.
+        This does not talk to NDEx or Cytoscape so it can be
+        run in a separate process.
 
+        :param file_name: name of sif file
+        :type file_name: string
+        :return: (network, report) or None if sif file is empty
+        :rtype: tuple
+        """
         df = self._get_pandas_dataframe(file_name)
         if df is None:
             return None
 
+        import ndexutil.tsv.tsv2nicecx2 as t2n
         network = t2n.convert_pandas_to_nice_cx_with_load_plan(df, self._loadplan)
 
         siflessname = file_name.replace('.sif', '')
@@ -2191,29 +3570,38 @@ class NDExNciPidLoader(object):
         report = NetworkIssueReport(network.get_name())
 
         # merge node attributes, logic was removed ndex2 python client so call a local implementation
-        issues = self._merge_node_attributes(network, 'alias_a', 'alias_b', 'alias')
-        report.addissues('Merge of alias_a and alias_b node attributes to alias node attribute', issues)
-
-        # more node attribute merging
-        issues = self._merge_node_attributes(network, 'PARTICIPANT_TYPE_A',
-                                             'PARTICIPANT_TYPE_B', 'type')
+        merges = [('alias_a', 'alias_b', 'alias'),
+                  ('PARTICIPANT_TYPE_A', 'PARTICIPANT_TYPE_B', 'type'),
+                  ('PARTICIPANT_NAME_A', 'PARTICIPANT_NAME_B',
+                   'PARTICIPANT_NAME')]
+        merge_issues = self._merge_node_attribute_pairs(network, merges)
+        report.addissues('Merge of alias_a and alias_b node attributes to alias node attribute',
+                         merge_issues[0])
         report.addissues('Merge of PARTICIPANT_TYPE_A and PARTICIPANT_TYPE_B '
-                         'node attributes to type node attribute', issues)
-
-        # more node attribute merging
-        issues = self._merge_node_attributes(network, 'PARTICIPANT_NAME_A',
-                                             'PARTICIPANT_NAME_B',
-                                             'PARTICIPANT_NAME')
+                         'node attributes to type node attribute',
+                         merge_issues[1])
         report.addissues('Merge of PARTICIPANT_NAME_A and PARTICIPANT_NAME_B '
                          'node attributes to PARTICIPANT_NAME node attribute',
-                         issues)
+                         merge_issues[2])
 
         if self._networkupdators is not None:
             for updator in self._networkupdators:
-                issues = updator.update(network)
-                report.addissues(updator.get_description(), issues)
+                updator.update_with_report(network, report)
+        return network, report
+
+    def _save_network(self, network, report):
+        """
+        Applies style, layout and network attributes to
+        'network' and saves it to NDEx
 
-        if len(network.get_nodes()) is 0:
+        :param network: network from :py:func:`_build_network`
+        :type network: :py:class:`~ndex2.nice_cx_network.NiceCXNetwork`
+        :param report: report from :py:func:`_build_network`
+        :type report: :py:class:`NetworkIssueReport`
+        :return: Report on issues found with processing
+        :rtype: :py:class:`NetworkIssueReport`
+        """
+        if len(network.nodes) == 0:
             report.addissues('Other',
                              ['Network has 0 nodes remaining.'
                               'Skipping Save to NDEx'])
@@ -2225,12 +3613,16 @@ class NDExNciPidLoader(object):
         if self._args.layout is not None:
             if self._args.layout == 'spring':
                 self._apply_simple_spring_layout(network)
+            elif self._args.layout == 'forceatlas2':
+                self._apply_forceatlas2_layout(network)
             else:
                 if self._args.layout == '-':
                     self._args.layout = 'force-directed'
                 self._apply_cytoscape_layout(network)
 
-        network_update_key = self._net_summaries.get(network.get_name().upper())
+        # get_name() scans the network attributes so look it up once
+        network_name = network.get_name()
+        network_update_key = self._net_summaries.get(network_name.upper())
 
         # set the version in the network
         self._set_version_in_network_attributes(network)
@@ -2261,11 +3653,11 @@ class NDExNciPidLoader(object):
         self._add_node_types_in_network_to_report(network, report)
 
         if network_update_key is not None:
-            logger.debug('Updating existing network: ' + network.get_name())
+            logger.debug('Updating existing network: ' + network_name)
             network.update_to(network_update_key, self._server, self._user, self._pass,
                               user_agent=self._get_user_agent())
         else:
-            logger.debug('Saving new network: ' + network.get_name())
+            logger.debug('Saving new network: ' + network_name)
             neturl = self._ndex.save_new_network(network.to_cx(),
                                                  visibility=self._visibility)
             updateprops = self._update_network_system_properties(neturl)
@@ -2281,7 +3673,7 @@ class NDExNciPidLoader(object):
         :return: None upon success or string with error message
         :rtype: str
         """
-        net_uuid = re.sub('^.*\/', '', neturl)
+        net_uuid = neturl[neturl.rfind('/') + 1:]
         prop_dict = {'index_level': self._indexlevel.upper(),
                      'showcase': self._showcase}
 
@@ -2317,7 +3709,7 @@ class NDExNciPidLoader(object):
         :param report:
         :return: None
         """
-        for i, node in network.get_nodes():
+        for i in network.nodes:
             val = network.get_node_attribute_value(i, 'type')
             report.add_nodetype(val)
 
@@ -2362,12 +3754,18 @@ class NDExNciPidLoader(object):
         """
         issues = []
 
+        # index template attributes in one scan keeping the first
+        # of any duplicates like get_network_attribute() does
+        template_attrs = {}
+        for attr in self._template.networkAttributes:
+            template_attrs.setdefault(attr.get('n'), attr)
+
         # for complete interaction network use this description
         if network.get_name() == COMPLETE_INTERACTION_NAME:
             description = 'This network includes all interactions of the ' \
                           'individual NCI-PID pathways.<br/>'
         else:
-            tempdesc = self._template.get_network_attribute('description')
+            tempdesc = template_attrs.get('description')
             if tempdesc is None:
                 issues.append('description network attribute not set cause its '
                               'missing from template network')
@@ -2377,7 +3775,7 @@ class NDExNciPidLoader(object):
 
         network.set_network_attribute('description', description)
 
-        organism = self._template.get_network_attribute('organism')
+        organism = template_attrs.get('organism')
         if organism is not None:
             network.set_network_attribute('organism', organism['v'])
         else:
@@ -2456,12 +3854,12 @@ class NDExNciPidLoader(object):
         :type :py:class:`~ndex2.nice_cx_network.NiceCXNetwork`
         :return: None
         """
+        owlfile = network.get_name() + '.owl.gz'
         network.set_network_attribute(DERIVED_FROM_ATTRIB,
                                       '<a href="'
                                       'ftp://' + DEFAULT_FTP_HOST +
                                       '/' + DEFAULT_FTP_DIR + '/' +
-                                      network.get_name() + '.owl.gz">' +
-                                      network.get_name() + '.owl.gz</a>')
+                                      owlfile + '">' + owlfile + '</a>')
 
     def _get_user_agent(self):
         """
@@ -2471,12 +3869,81 @@ class NDExNciPidLoader(object):
         """
         return 'ncipid/' + self._args.version
 
+    def _pop_new_symbols(self):
+        """
+        Gets gene symbols looked up by network updators since
+        this method was last called via
+        :py:func:`NetworkUpdator.pop_new_symbols`
+
+        :return: symbols for each network updator or ``None``
+                 if there are no network updators
+        :rtype: list
+        """
+        if self._networkupdators is None:
+            return None
+        return [updator.pop_new_symbols()
+                for updator in self._networkupdators]
+
+    def _add_symbols(self, new_symbols):
+        """
+        Adds gene symbols from :py:func:`_pop_new_symbols`, called
+        on a copy of this loader in a worker process, to the
+        network updators of this loader
+
+        :param new_symbols: symbols for each network updator
+        :type new_symbols: list
+        :return: None
+        """
+        if new_symbols is None or self._networkupdators is None:
+            return
+        for updator, symbols in zip(self._networkupdators, new_symbols):
+            if symbols:
+                updator.add_symbols(symbols)
+
+    def _map_in_workers(self, func, file_names):
+        """
+        Runs **func** on each of **file_names** in a pool of
+        --numworkers processes. Each file is sent along with this
+        loader, pickled via :py:func:`__getstate__`, and gene symbols
+        looked up in the workers are added to the network updators
+        of this loader so they are saved with the gene symbol cache
+
+        :param func: :py:func:`_build_network_in_worker` or
+                     :py:func:`_process_sif_in_worker`
+        :type func: function
+        :param file_names: names of sif files
+        :type file_names: list
+        :return: result of **func** for each file, in order of
+                 **file_names**, as each one finishes
+        :rtype: generator
+        """
+        # lets workers tell this run from an earlier one
+        self._worker_key = uuid.uuid4().hex
+        with ProcessPoolExecutor(max_workers=self._args.numworkers) as\
+                executor:
+            for res, new_symbols in executor.map(func,
+                                                 itertools.repeat(self),
+                                                 file_names):
+                self._add_symbols(new_symbols)
+                yield res
+
+    def _layout_needs_cytoscape(self):
+        """
+        Tells if layout set via **--layout** flag is run in Cytoscape
+
+        :return: True if layout is run in Cytoscape otherwise False
+        :rtype: bool
+        """
+        return self._args.layout is not None and\
+            self._args.layout not in ('spring', 'forceatlas2')
+
     def _create_ndex_connection(self):
         """
         creates connection to ndex
         :return:
         """
         if self._ndex is None:
+            from ndex2.client import Ndex2
             self._ndex = Ndex2(host=self._server, username=self._user,
                                password=self._pass, user_agent=self._get_user_agent())
 
@@ -2493,20 +3960,50 @@ class NDExNciPidLoader(object):
         self._load_network_attributes()
         self._load_style_template()
         report_list = []
-        file_reverse = sorted(os.listdir(self._args.sifdir),
-                              key=lambda s: s.lower(), reverse=True)
-
-        for file in file_reverse:
-            if self._args.singlefile is not None:
-                if self._args.singlefile != os.path.basename(file):
+        singlefile = self._args.singlefile
+
+        # filter before sorting so the sort key is only computed
+        # for files that will actually be processed
+        with os.scandir(self._args.sifdir) as entries:
+            file_reverse = [entry.name for entry in entries
+                            if entry.name.endswith('.sif') and
+                            (singlefile is None or
+                             entry.name == singlefile)]
+        file_reverse.sort(key=str.lower, reverse=True)
+
+        numworkers = self._args.numworkers
+        if numworkers is not None and numworkers > 1 and\
+                len(file_reverse) > 1 and\
+                not self._layout_needs_cytoscape():
+            # no shared Cytoscape instance is needed so each
+            # process builds and saves its networks
+            logger.info('Processing networks using ' + str(numworkers) +
+                        ' processes')
+            report_list.extend(self._map_in_workers(_process_sif_in_worker,
+                                                    file_reverse))
+        elif numworkers is not None and numworkers > 1 and\
+                len(file_reverse) > 1:
+            # build networks in parallel, but save them one at a
+            # time from this process since the layout runs in
+            # a single Cytoscape instance
+            logger.info('Building networks using ' + str(numworkers) +
+                        ' processes')
+            res_list = self._map_in_workers(_build_network_in_worker,
+                                            file_reverse)
+            for file, res in zip(file_reverse, res_list):
+                logger.debug('Saving ' + file)
+                if res is None:
                     continue
-
-            if file.endswith(".sif"):
+                report_list.append(self._save_network(res[0], res[1]))
+        else:
+            for file in file_reverse:
                 logger.debug('Processing ' + file)
                 report_list.append(self._process_sif(file))
 
         node_type = set()
         for entry in report_list:
+            if entry is None:
+                continue
             for nt in entry.get_nodetypes():
                 node_type.add(nt)
             sys.stdout.write(entry.get_fullreport_as_string())
@@ -2518,6 +4015,75 @@ class NDExNciPidLoader(object):
         return 0
 
 
+_WORKER_LOADER = None
+"""
+:py:class:`NDExNciPidLoader` used in worker processes, set by
+:py:func:`_get_worker_loader`
+"""
+
+
+def _get_worker_loader(loader):
+    """
+    Gets loader to use in a worker process. The first **loader**
+    received for a run of :py:func:`NDExNciPidLoader._map_in_workers`
+    is kept, with its network attributes and style template loaded,
+    and used for the rest of the files the worker gets in that run
+    so data loaded by it and its network updators, such as gene
+    symbols already looked up, is reused
+
+    :param loader: loader sent with file
+    :type loader: :py:class:`NDExNciPidLoader`
+    :return: loader to use
+    :rtype: :py:class:`NDExNciPidLoader`
+    """
+    global _WORKER_LOADER
+    if _WORKER_LOADER is None or loader._worker_key is None or\
+            _WORKER_LOADER._worker_key != loader._worker_key:
+        loader._load_network_attributes()
+        loader._load_style_template()
+        _WORKER_LOADER = loader
+    return _WORKER_LOADER
+
+
+def _build_network_in_worker(loader, file_name):
+    """
+    Calls :py:func:`NDExNciPidLoader._build_network` on loader
+    from :py:func:`_get_worker_loader`
+
+    :param loader: loader sent with file
+    :type loader: :py:class:`NDExNciPidLoader`
+    :param file_name: name of sif file
+    :type file_name: string
+    :return: ((network, report) or None if sif file is empty,
+             gene symbols looked up)
+    :rtype: tuple
+    """
+    worker_loader = _get_worker_loader(loader)
+    return (worker_loader._build_network(file_name),
+            worker_loader._pop_new_symbols())
+
+
+def _process_sif_in_worker(loader, file_name):
+    """
+    Calls :py:func:`NDExNciPidLoader._process_sif` on loader
+    from :py:func:`_get_worker_loader` so the network is
+    built and saved to NDEx in the worker process with
+    a connection created by that process
+
+    :param loader: loader sent with file
+    :type loader: :py:class:`NDExNciPidLoader`
+    :param file_name: name of sif file
+    :type file_name: string
+    :return: (Report on issues found with processing or None
+             if sif file is empty, gene symbols looked up)
+    :rtype: tuple
+    """
+    worker_loader = _get_worker_loader(loader)
+    worker_loader._create_ndex_connection()
+    return (worker_loader._process_sif(file_name),
+            worker_loader._pop_new_symbols())
+
+
 class PaxtoolsRunner(object):
     """
     Runs paxtools.jar to convert .owl files to .sif
@@ -2550,16 +4116,32 @@ class PaxtoolsRunner(object):
         counter = 0
         logger.info('Running ' + self._paxtools + ' on .owl files in ' + self._ftpdir)
         for entry in os.listdir(self._ftpdir):
-            if not entry.endswith('.owl'):
-                continue
-            owlfile = os.path.join(self._ftpdir, entry)
-            siffile = os.path.join(self._outdir, re.sub('\.owl', '.sif', entry))
-            if os.path.isfile(siffile):
-                continue
-            self._run_paxtool(owlfile, siffile)
-            counter += 1
+            if self.convert_owl_file(os.path.join(self._ftpdir, entry)):
+                counter += 1
         logger.info('Ran ' + self._paxtools + ' on ' + str(counter) + ' files')
 
+    def convert_owl_file(self, owlfile):
+        """
+        Runs paxtools on a single **owlfile** writing the SIF file
+        to the 'outdir' set in the constructor. This method can
+        be called while other owl files are still being downloaded.
+
+        :param owlfile: Path to owl file, files not ending with .owl
+                        are ignored
+        :type owlfile: string
+        :return: True if paxtools was run otherwise False if
+                 file is not an owl file or SIF file already exists
+        :rtype: bool
+        """
+        entry = os.path.basename(owlfile)
+        if not entry.endswith('.owl'):
+            return False
+        siffile = os.path.join(self._outdir, entry.replace('.owl', '.sif'))
+        if os.path.isfile(siffile):
+            return False
+        self._run_paxtool(owlfile, siffile)
+        return True
+
     def _run_paxtool(self, owlfile, siffile):
         """
         Runs paxtools to convert the owl file to SIF using these arguments:
@@ -2569,6 +4151,10 @@ class PaxtoolsRunner(object):
         chemDb=chebi,pubchem
         -useNameIfNoId -extended
 
+        If paxtools exits with a non zero code any partially written
+        **siffile** is removed so it is not mistaken for a converted
+        file and skipped later on
+
         :param owlfile: Input owl file
         :type owlfile: string
         :param siffile: Output sif file
@@ -2580,9 +4166,403 @@ class PaxtoolsRunner(object):
                'seqDb=hgnc,uniprot,refseq,ncbi,entrez,ensembl', 'chemDb=chebi,pubchem',
                '-useNameIfNoId', '-extended']
         logger.debug('Running ' + ' '.join(cmd))
-        status = subprocess.call(cmd)
-        if status is not 0:
-            logger.error('Got non zero exit from command')
+        proc = subprocess.run(cmd, stdout=subprocess.DEVNULL,
+                              stderr=subprocess.PIPE, check=False)
+        if proc.returncode != 0:
+            logger.error('Got non zero exit (' + str(proc.returncode) +
+                         ') from command: ' +
+                         proc.stderr[:2048].decode('utf-8', errors='replace'))
+            if os.path.isfile(siffile):
+                logger.info('Removing partial SIF file: ' + siffile)
+                os.remove(siffile)
+
+
+class GunzipWriter(io.RawIOBase):
+    """
+    Writable file like object that gunzips data written to it,
+    chunk by chunk, into another file. Lets FTP downloads of *.gz*
+    files be decompressed as they arrive rather than holding the
+    whole compressed file in memory. Like :py:func:`gzip.decompress`
+    files with multiple gzip members are supported
+    """
+
+    def __init__(self, out):
+        """
+        Constructor
+
+        :param out: binary file to write decompressed data to
+        """
+        super(GunzipWriter, self).__init__()
+        self._out = out
+        self._decompressor = zlib.decompressobj(16 + zlib.MAX_WBITS)
+        self._in_member = False
+        self._compressed_bytes = 0
+
+    def get_compressed_bytes(self):
+        """
+        Gets number of compressed bytes written
+
+        :return: number of bytes
+        :rtype: int
+        """
+        return self._compressed_bytes
+
+    def writable(self):
+        """
+        :return: True
+        :rtype: bool
+        """
+        return True
+
+    def write(self, data):
+        """
+        Decompresses 'data' writing the result to the output file
+
+        :param data: chunk of gzip compressed data
+        :type data: bytes
+        :return: number of bytes consumed
+        :rtype: int
+        """
+        self._compressed_bytes += len(data)
+        remaining = data
+        while remaining:
+            self._in_member = True
+            self._out.write(self._decompressor.decompress(remaining))
+            if not self._decompressor.eof:
+                break
+            # start of next gzip member, if any
+            remaining = self._decompressor.unused_data
+            self._decompressor = zlib.decompressobj(16 + zlib.MAX_WBITS)
+            self._in_member = False
+        return len(data)
+
+    def finish(self):
+        """
+        Verifies all data written was decompressed
+
+        :raises EOFError: if data ended in the middle of a gzip member
+        :return: None
+        """
+        if self._in_member:
+            raise EOFError('Compressed file ended before the '
+                           'end-of-stream marker was reached')
+
+
+class HashingWriter(io.RawIOBase):
+    """
+    Writable file like object that passes data written to it on
+    to another file while computing the SHA-256 digest of the data
+    """
+
+    def __init__(self, out):
+        """
+        Constructor
+
+        :param out: binary file to write data to
+        """
+        super(HashingWriter, self).__init__()
+        self._out = out
+        self._hash = hashlib.sha256()
+
+    def get_hexdigest(self):
+        """
+        Gets SHA-256 digest of data written so far
+
+        :return: digest as hex string
+        :rtype: string
+        """
+        return self._hash.hexdigest()
+
+    def writable(self):
+        """
+        :return: True
+        :rtype: bool
+        """
+        return True
+
+    def write(self, data):
+        """
+        Writes 'data' to output file updating the digest
+
+        :param data: data to write
+        :type data: bytes
+        :return: number of bytes written
+        :rtype: int
+        """
+        self._hash.update(data)
+        self._out.write(data)
+        return len(data)
+
+
+def _get_sha256_of_file(path):
+    """
+    Gets SHA-256 digest of file at 'path'
+
+    :param path: path to file
+    :type path: string
+    :return: digest as hex string
+    :rtype: string
+    """
+    with open(path, 'rb') as f:
+        if hasattr(hashlib, 'file_digest'):
+            return hashlib.file_digest(f, 'sha256').hexdigest()
+        sha = hashlib.sha256()
+        for chunk in iter(functools.partial(f.read, 1 << 20), b''):
+            sha.update(chunk)
+        return sha.hexdigest()
+
+
+class AdaptiveConcurrencyLimit(object):
+    """
+    Limits number of concurrent downloads to a value that is adjusted,
+    between minimum and maximum set in constructor, based on measured
+    throughput. Every *interval* seconds the download rate is compared
+    to the previous interval. If the rate went up, the limit is raised
+    by one, otherwise it is lowered by one so the limit settles near
+    the concurrency the link and FTP server can actually sustain
+    """
+
+    def __init__(self, min_limit, max_limit, interval=2.0,
+                 min_improvement=0.05, clock=time.monotonic):
+        """
+        Constructor
+
+        :param min_limit: smallest number of concurrent downloads,
+                          also the starting limit
+        :type min_limit: int
+        :param max_limit: largest number of concurrent downloads
+        :type max_limit: int
+        :param interval: seconds between limit adjustments
+        :type interval: float
+        :param min_improvement: fraction the rate must improve by
+                                over previous interval to count as
+                                an increase
+        :type min_improvement: float
+        :param clock: function returning current time in seconds
+        :type clock: function
+        """
+        self._min_limit = max(1, min_limit)
+        self._max_limit = max(self._min_limit, max_limit)
+        self._limit = self._min_limit
+        self._interval = interval
+        self._min_improvement = min_improvement
+        self._clock = clock
+        self._active = 0
+        self._bytes = 0
+        self._window_start = clock()
+        self._last_rate = None
+        self._cond = threading.Condition()
+
+    def get_limit(self):
+        """
+        Gets current limit on concurrent downloads
+
+        :return: limit
+        :rtype: int
+        """
+        return self._limit
+
+    @contextmanager
+    def slot(self):
+        """
+        Waits until fewer than the current limit of downloads are
+        running and holds a slot for the duration of the ``with`` block
+        """
+        with self._cond:
+            while self._active >= self._limit:
+                self._cond.wait()
+            self._active += 1
+        try:
+            yield
+        finally:
+            with self._cond:
+                self._active -= 1
+                self._cond.notify_all()
+
+    def add_bytes(self, num_bytes):
+        """
+        Records 'num_bytes' downloaded, adjusting the limit
+        if *interval* seconds have passed since the last adjustment
+
+        :param num_bytes: number of bytes downloaded
+        :type num_bytes: int
+        :return: None
+        """
+        with self._cond:
+            self._bytes += num_bytes
+            now = self._clock()
+            elapsed = now - self._window_start
+            if elapsed < self._interval:
+                return
+            rate = self._bytes / elapsed
+            if self._last_rate is None or\
+                    rate > self._last_rate * (1.0 + self._min_improvement):
+                self._limit = min(self._limit + 1, self._max_limit)
+            else:
+                self._limit = max(self._limit - 1, self._min_limit)
+            logger.info('FTP download rate ' + str(int(rate)) +
+                        ' bytes/sec, concurrent downloads set to ' +
+                        str(self._limit))
+            self._last_rate = rate
+            self._bytes = 0
+            self._window_start = now
+            self._cond.notify_all()
+
+
+class FtpConnectionPool(object):
+    """
+    Pool of :py:class:`ftpretty.ftpretty` connections that are
+    created on demand, up to size set in constructor, and
+    reused so each file download does not require a new login
+    """
+
+    def __init__(self, ftphost, ftpuser, ftppass, timeout=10,
+                 size=DEFAULT_FTP_POOL_SIZE,
+                 connection_factory=None):
+        """
+        Constructor
+
+        :param ftphost: FTP host
+        :type ftphost: string
+        :param ftpuser: FTP user
+        :type ftpuser: string
+        :param ftppass: FTP password
+        :type ftppass: string
+        :param timeout: timeout in seconds for FTP connection
+        :type timeout: int
+        :param size: maximum number of connections to create
+        :type size: int
+        :param connection_factory: called with host, user, password
+                                   and timeout keyword argument to
+                                   create a new connection, if ``None``
+                                   :py:class:`ftpretty.ftpretty` is used
+        :type connection_factory: function
+        """
+        self._ftphost = ftphost
+        self._ftpuser = ftpuser
+        self._ftppass = ftppass
+        self._timeout = timeout
+        self._size = max(1, size)
+        self._connection_factory = connection_factory
+        self._idle = queue.LifoQueue()
+        self._connections = []
+        self._lock = threading.Lock()
+
+    def get_size(self):
+        """
+        Gets maximum number of connections in pool
+
+        :return: maximum number of connections
+        :rtype: int
+        """
+        return self._size
+
+    def add_connection(self, conn):
+        """
+        Adds an already created connection to the pool
+
+        :param conn: FTP connection
+        """
+        with self._lock:
+            self._connections.append(conn)
+        self._idle.put(conn)
+
+    def _get_connection(self):
+        """
+        Gets an idle connection, creating a new one if none
+        are idle and the pool is not full, otherwise waits for
+        a connection to be returned
+
+        :return: FTP connection
+        """
+        while True:
+            try:
+                conn = self._idle.get_nowait()
+            except queue.Empty:
+                conn = None
+            if conn is not None:
+                return conn
+
+            with self._lock:
+                create_new = len(self._connections) < self._size
+                if create_new:
+                    # reserve slot so other threads do not also create one
+                    self._connections.append(None)
+            if create_new is True:
+                break
+            conn = self._idle.get()
+            if conn is not None:
+                return conn
+            # None means a connection was discarded, freeing
+            # a slot, so loop around to try creating one
+
+        try:
+            if self._connection_factory is None:
+                from ftpretty import ftpretty
+                self._connection_factory = ftpretty
+            conn = self._connection_factory(self._ftphost, self._ftpuser,
+                                            self._ftppass,
+                                            timeout=self._timeout)
+        except Exception:
+            with self._lock:
+                self._connections.remove(None)
+            raise
+        with self._lock:
+            self._connections[self._connections.index(None)] = conn
+        return conn
+
+    @contextmanager
+    def item(self):
+        """
+        Checks out a connection from the pool for the duration
+        of the ``with`` block
+
+        :return: FTP connection
+        """
+        conn = self._get_connection()
+        completed = False
+        try:
+            yield conn
+            completed = True
+        finally:
+            if completed is True:
+                self._idle.put(conn)
+            else:
+                self._discard_connection(conn)
+
+    def _discard_connection(self, conn):
+        """
+        Closes and removes 'conn' from the pool, freeing its slot,
+        since after an error its state, such as a transfer cut off
+        midway, is unknown and it should not be handed out again
+
+        :param conn: FTP connection
+        :return: None
+        """
+        with self._lock:
+            if conn in self._connections:
+                self._connections.remove(conn)
+        try:
+            conn.close()
+        except Exception as e:
+            logger.debug('Error closing FTP connection: ' + str(e))
+        # wake up any thread waiting for a connection so it
+        # can create a new one in the freed slot
+        self._idle.put(None)
+
+    def close(self):
+        """
+        Closes all connections in pool
+        """
+        with self._lock:
+            connections = [c for c in self._connections if c is not None]
+            self._connections = []
+        self._idle = queue.LifoQueue()
+        for conn in connections:
+            try:
+                conn.close()
+            except Exception as e:
+                logger.debug('Error closing FTP connection: ' + str(e))
 
 
 class FtpDataDownloader(object):
@@ -2595,7 +4575,9 @@ class FtpDataDownloader(object):
                  ftpdir=DEFAULT_FTP_DIR,
                  ftpuser=DEFAULT_FTP_USER,
                  ftppass=DEFAULT_FTP_PASS,
-                 timeout=10):
+                 timeout=10,
+                 poolsize=DEFAULT_FTP_POOL_SIZE,
+                 maxpoolsize=None):
         """
         Constructor that sets parameters needed to download OWL
         files
@@ -2612,6 +4594,15 @@ class FtpDataDownloader(object):
         :type ftppass: string
         :param timeout: timeout in seconds for FTP connection
         :type timeout: int
+        :param poolsize: number of FTP connections used to download
+                         files in parallel
+        :type poolsize: int
+        :param maxpoolsize: If set and larger then 'poolsize', number
+                            of parallel downloads starts at 'poolsize'
+                            and is adjusted, up to this value, based on
+                            measured throughput via
+                            :py:class:`AdaptiveConcurrencyLimit`
+        :type maxpoolsize: int
         """
         self._ftphost = ftphost
         self._ftpdir = ftpdir
@@ -2619,8 +4610,11 @@ class FtpDataDownloader(object):
         self._ftppass = ftppass
         self._outdir = outdir
         self._timeout = timeout
+        self._poolsize = poolsize
+        self._maxpoolsize = maxpoolsize
         self._altftp = None
-        self._ftp = None
+        self._pool = None
+        self._limit = None
 
     def set_alternate_ftp(self, altftp):
         """
@@ -2633,10 +4627,18 @@ class FtpDataDownloader(object):
         Connects to ftp server
         """
         if self._altftp is not None:
-            self._ftp = self._altftp
+            self._pool = FtpConnectionPool(self._ftphost, self._ftpuser,
+                                           self._ftppass, size=1)
+            self._pool.add_connection(self._altftp)
             return
-        self._ftp = ftpretty(self._ftphost, self._ftpuser, self._ftppass,
-                             timeout=self._timeout)
+        self._pool = FtpConnectionPool(self._ftphost, self._ftpuser,
+                                       self._ftppass,
+                                       timeout=self._timeout,
+                                       size=max(self._poolsize,
+                                                self._maxpoolsize or 0))
+        # connect now so connection problems are raised here
+        with self._pool.item():
+            pass
         return
 
     def disconnect(self):
@@ -2644,50 +4646,165 @@ class FtpDataDownloader(object):
         Disconnects from FTP
         :return:
         """
-        if self._ftp is not None:
-            self._ftp.close()
+        if self._pool is not None:
+            self._pool.close()
+
+    def _download_file(self, entry, destfile):
+        """
+        Downloads 'entry' from FTP to 'destfile' using a
+        connection from the pool, gunzipping if 'entry' ends
+        with *.gz*
+
+        :param entry: path of file on FTP server
+        :type entry: string
+        :param destfile: path to write file to
+        :type destfile: string
+        :return: 'destfile'
+        :rtype: string
+        """
+        if self._limit is None:
+            self._download_file_with_pool(entry, destfile)
+            return destfile
+        with self._limit.slot():
+            num_bytes = self._download_file_with_pool(entry, destfile)
+        self._limit.add_bytes(num_bytes)
+        return destfile
+
+    def _download_file_with_pool(self, entry, destfile):
+        """
+        Downloads 'entry' from FTP to 'destfile' using a
+        connection from the pool, gunzipping if 'entry' ends
+        with *.gz*
+
+        :param entry: path of file on FTP server
+        :type entry: string
+        :param destfile: path to write file to
+        :type destfile: string
+        :return: number of bytes transferred
+        :rtype: int
+        """
+        logger.debug('Downloading ' + entry + ' to ' + destfile)
+
+        # write to a temporary file that is only renamed to 'destfile'
+        # once the download finishes, so an interrupted run never leaves
+        # a partial file that looks downloaded
+        partfile = destfile + PARTIAL_DOWNLOAD_SUFFIX
+        with self._pool.item() as ftp:
+            if entry.endswith('.gz'):
+                # decompress as data arrives instead of buffering
+                # the whole compressed file
+                with open(partfile, 'wb',
+                          buffering=GUNZIP_BUFFER_SIZE) as f:
+                    hasher = HashingWriter(f)
+                    writer = GunzipWriter(hasher)
+                    ftp.get(entry, writer)
+                    writer.finish()
+                num_bytes = writer.get_compressed_bytes()
+            else:
+                with open(partfile, 'wb') as f:
+                    hasher = HashingWriter(f)
+                    ftp.get(entry, hasher)
+                    num_bytes = f.tell()
+        os.replace(partfile, destfile)
+        self._write_checksum_file(destfile, hasher.get_hexdigest())
+        return num_bytes
+
+    def _write_checksum_file(self, destfile, hexdigest):
+        """
+        Atomically writes 'hexdigest' to checksum file of 'destfile'
+        in format used by **sha256sum**
+
+        :param destfile: path to downloaded file
+        :type destfile: string
+        :param hexdigest: SHA-256 digest of 'destfile'
+        :type hexdigest: string
+        :return: None
+        """
+        checksumfile = destfile + CHECKSUM_SUFFIX
+        tmpfile = checksumfile + PARTIAL_DOWNLOAD_SUFFIX
+        with open(tmpfile, 'w') as f:
+            f.write(hexdigest + '  ' + os.path.basename(destfile) + '\n')
+        os.replace(tmpfile, checksumfile)
+
+    def _is_downloaded(self, destfile):
+        """
+        Tells if 'destfile' was completely downloaded by checking
+        it matches the SHA-256 digest in its checksum file written
+        by :py:func:`_write_checksum_file`
+
+        :param destfile: path to downloaded file
+        :type destfile: string
+        :return: True if 'destfile' and its checksum file exist and
+                 the digest matches otherwise False
+        :rtype: bool
+        """
+        checksumfile = destfile + CHECKSUM_SUFFIX
+        if not os.path.isfile(destfile) or not os.path.isfile(checksumfile):
+            return False
+        with open(checksumfile, 'r') as f:
+            expected = f.read().split()
+        if len(expected) == 0:
+            return False
+        return _get_sha256_of_file(destfile) == expected[0]
 
-    def download_data(self):
+    def download_data(self, callback=None):
         """
         Creates output directory set in constructor and then proceeds
         to download all files in ftp directory also set in constructor.
+        Files are downloaded in parallel using up to *poolsize*
+        connections set in constructor.
 
         If the downloaded file ends with *.gz* extension it is gunzipped
         first and the suffix is removed.
 
         .. note::
 
-        If a file already exists on the file system (regardless of size)
-        this code does NOT download that file again.
+        If a file already exists on the file system and matches the
+        SHA-256 digest in its *.sha256* checksum file, written after
+        each download, this code does NOT download that file again.
 
+        :param callback: If set, called with path of each file right
+                         after it is downloaded so processing can start
+                         while remaining files are still downloading
+        :type callback: function
         :return: None
         """
         if not os.path.isdir(self._outdir):
             os.makedirs(self._outdir, mode=0o755)
-        filelist = self._ftp.list(self._ftpdir)
+        with self._pool.item() as ftp:
+            filelist = ftp.list(self._ftpdir)
         if filelist is None:
             logger.error('No files found in ftp directory')
             return
         logger.info('Found ' + str(len(filelist)) +
                     ' files in ftp directory. Starting download')
-        counter = 0
+        downloads = []
         for entry in filelist:
-            destfile = re.sub('\\.gz', '',
-                              os.path.join(self._outdir,
-                                           os.path.basename(entry)))
-            if os.path.isfile(destfile) and os.path.getsize(destfile) > 0:
+            destfile = os.path.join(self._outdir,
+                                    os.path.basename(entry)).replace('.gz', '')
+            if self._is_downloaded(destfile):
                 logger.debug(entry +
-                             ' appears to have been downloaded. Skipping...')
+                             ' was already downloaded. Skipping...')
                 continue
-            logger.debug('Downloading ' + entry + ' to ' + destfile)
-            if entry.endswith('.gz'):
-                data = self._ftp.get(entry)
-                with open(destfile, 'wb') as f:
-                    f.write(gzip.decompress(data))
-            else:
-                with open(destfile, 'wb') as f:
-                    self._ftp.get(entry, f)
-            counter += 1
+            downloads.append((entry, destfile))
+
+        if self._maxpoolsize is not None and\
+                self._pool.get_size() > self._poolsize:
+            self._limit = AdaptiveConcurrencyLimit(self._poolsize,
+                                                   self._pool.get_size())
+        else:
+            self._limit = None
+
+        counter = 0
+        with ThreadPoolExecutor(max_workers=self._pool.get_size()) as\
+                executor:
+            futures = [executor.submit(self._download_file, entry, destfile)
+                       for entry, destfile in downloads]
+            for future in as_completed(futures):
+                destfile = future.result()
+                counter += 1
+                if callback is not None:
+                    callback(destfile)
         logger.info('Downloaded ' + str(counter) + ' files')
 
 
@@ -2752,38 +4869,62 @@ def main(args):
         ftpdir = os.path.join(outdir, FTP_SUBDIR)
 
         _setup_logging(theargs)
+        bclient = None
+        if theargs.biothingscache is not None:
+            from biothings_client import get_client
+            bclient = get_client('gene')
+            _setup_biothings_caching(bclient, theargs.biothingscache,
+                                     clear=theargs.clearbiothingscache)
+
         if theargs.skipdownload is True:
             logger.info('--skipdownload set. Skipping download')
         else:
             logger.info('Downloading data from ftp')
             paxtools = os.path.abspath(theargs.paxtools)
-            dloader = FtpDataDownloader(ftpdir)
+            paxy = PaxtoolsRunner(ftpdir, outdir, paxtools)
+            dloader = FtpDataDownloader(ftpdir,
+                                        poolsize=theargs.ftppoolsize,
+                                        maxpoolsize=theargs.ftpmaxpoolsize)
             dloader.connect_to_ftp()
-            dloader.download_data()
+
+            # convert owl files to sif as they arrive
+            futures = []
+            with ThreadPoolExecutor(max_workers=1) as executor:
+                submit = functools.partial(executor.submit,
+                                           paxy.convert_owl_file)
+                dloader.download_data(callback=lambda owlfile:
+                                      futures.append(submit(owlfile)))
             dloader.disconnect()
-            logger.info('Converting owl files to sif, if needed')
-            paxy = PaxtoolsRunner(ftpdir, outdir, paxtools)
+
+            # raise any error hit converting an owl file
+            for future in futures:
+                future.result()
+            logger.info('Converting any remaining owl files to sif, '
+                        'if needed')
             paxy.run_paxtools()
 
         if theargs.getfamilies is True:
-            extractor = GeneFamilyFromOwlExtractor()
+            extractor = GeneFamilyFromOwlExtractor(bclient=bclient)
             res = extractor.get_gene_family_mapping_as_string(ftpdir)
             sys.stdout.write(res)
             return 0
 
         nafac = NetworkAttributesFromTSVFactory(theargs.networkattrib)
-        searcher = GeneSymbolSearcher()
+        searcher = GeneSymbolSearcher(bclient=bclient,
+                                      cache_path=theargs.genesymbolcache)
+        # run in a single pass over the nodes
+        node_updators = [CHEBINodeNameReplacer(),
+                         CHEBINodeRepresentsPrefixRemover(),
+                         GeneSymbolNodeNameUpdator(theargs.genesymbol),
+                         NodeAttributeRemover('PARTICIPANT_NAME'),
+                         GeneFamilyExpander(theargs.genesymbol)]
         updators = [NodeTypeUpdator(),
                     NodeAliasUpdator(),
                     EmptyCitationAttributeUpdator(),
                     RedundantEdgeAdjudicator(),
                     DirectedEdgeSetter(),
                     UniProtToGeneSymbolUpdater(searcher=searcher),
-                    CHEBINodeNameReplacer(),
-                    CHEBINodeRepresentsPrefixRemover(),
-                    GeneSymbolNodeNameUpdator(theargs.genesymbol),
-                    NodeAttributeRemover('PARTICIPANT_NAME'),
-                    GeneFamilyExpander(theargs.genesymbol)]
+                    FusedNodeUpdator(node_updators)]
 
         if theargs.skipproteinfamilycleanup is False:
             updators.append(ProteinFamilyNodeMemberRemover())
@@ -2795,7 +4936,10 @@ def main(args):
                                   netattribfac=nafac,
                                   networkupdators=updators)
         logger.info('Running network generation')
-        return loader.run()
+        try:
+            return loader.run()
+        finally:
+            searcher.save_cache()
     except Exception as e:
         logger.exception('Caught exception')
         return 2
@@ -242,16 +242,22 @@ class NetworkNode(object):
         """
         self._attributes = attributes
 
-    def remove_node_from_network(self, net_cx=None):
+    def remove_node_from_network(self, net_cx=None, edges=None):
         """
         Removes node and any attributes on that node
         from network as well as any edges and their
         attributes connected to that node
         :param net_cx:
+        :param edges: :py:class:`NetworkEdge` objects connected to
+                      this node. If ``None`` these are found by
+                      scanning all edges in **net_cx**
+        :type edges: list
         :return:
         """
-        edges = self._nef.get_all_edges_connected_to_node(net_cx=net_cx,
-                                                          node_id=self._node_id)
+        if edges is None:
+            edges = self._nef.\
+                get_all_edges_connected_to_node(net_cx=net_cx,
+                                                node_id=self._node_id)
         edge_cntr = 0
         if edges is not None:
             for edge in edges:
@@ -691,20 +697,30 @@ class NetworkEdge(object):
         if len(self._attributes) <= 1:
             return []
 
+        # attributes can only be identical if their names match
+        # so only compare attributes within the same name
+        attrs = self._attributes
+        name_to_indexes = {}
+        for index, attr in enumerate(attrs):
+            name_to_indexes.setdefault(attr.get_name(), []).append(index)
+
+        # an attribute is a duplicate if it matches one earlier in the list
+        duplicates = set()
+        for indexes in name_to_indexes.values():
+            for pos in range(1, len(indexes)):
+                me_attr = attrs[indexes[pos]]
+                for other_index in indexes[:pos]:
+                    if me_attr == attrs[other_index]:
+                        duplicates.add(indexes[pos])
+                        break
+
+        # walk backwards to keep same ordering as before
         new_attrs = []
-        me_attr = self._attributes.pop()
-        while me_attr is not None:
-            found_match = False
-            for other_attr in self._attributes:
-                if me_attr == other_attr:
-                    merges.append(me_attr)
-                    found_match = True
-                    break
-            if found_match is False:
-                new_attrs.append(me_attr)
-            if len(self._attributes) == 0:
-                break
-            me_attr = self._attributes.pop()
+        for index in range(len(attrs) - 1, -1, -1):
+            if index in duplicates:
+                merges.append(attrs[index])
+            else:
+                new_attrs.append(attrs[index])
 
         self._attributes = new_attrs
         return merges
@@ -732,7 +748,7 @@ class NetworkNodeFactory(object):
         :rtype: :py:class:`NetworkNode`
         """
         node_obj = net_cx.get_node(node_id)
-        if node_obj is None or node_obj is (None, None):
+        if node_obj is None or node_obj == (None, None):
             return None
 
         attributes = []
@@ -781,7 +797,7 @@ class NetworkEdgeFactory(object):
         :rtype: :py:class:`NetworkEdge`
         """
         edge_obj = net_cx.get_edge(edge_id)
-        if edge_obj is None or edge_obj is (None, None):
+        if edge_obj is None or edge_obj == (None, None):
             return None
 
         attributes = []
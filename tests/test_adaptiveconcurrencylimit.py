@@ -0,0 +1,88 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""Tests for `AdaptiveConcurrencyLimit` class."""
+
+import threading
+import unittest
+
+from ndexncipidloader.ndexloadncipid import AdaptiveConcurrencyLimit
+
+
+class FakeClock(object):
+    """
+    Clock whose time is set by the test
+    """
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+
+class TestAdaptiveConcurrencyLimit(unittest.TestCase):
+    """Tests for `AdaptiveConcurrencyLimit` class."""
+
+    def setUp(self):
+        """Set up test fixtures, if any."""
+
+    def tearDown(self):
+        """Tear down test fixtures, if any."""
+
+    def test_constructor_bounds(self):
+        limit = AdaptiveConcurrencyLimit(0, -1)
+        self.assertEqual(1, limit.get_limit())
+        limit = AdaptiveConcurrencyLimit(3, 6)
+        self.assertEqual(3, limit.get_limit())
+
+    def test_add_bytes_adjusts_limit(self):
+        clock = FakeClock()
+        limit = AdaptiveConcurrencyLimit(2, 4, interval=2.0, clock=clock)
+
+        # no adjustment until interval has passed
+        clock.now = 1.0
+        limit.add_bytes(100)
+        self.assertEqual(2, limit.get_limit())
+
+        # first measurement raises limit
+        clock.now = 2.0
+        limit.add_bytes(100)
+        self.assertEqual(3, limit.get_limit())
+
+        # rate went up so raise again
+        clock.now = 4.0
+        limit.add_bytes(400)
+        self.assertEqual(4, limit.get_limit())
+
+        # rate went up but limit is at maximum
+        clock.now = 6.0
+        limit.add_bytes(1000)
+        self.assertEqual(4, limit.get_limit())
+
+        # rate plateaued so back off
+        clock.now = 8.0
+        limit.add_bytes(1010)
+        self.assertEqual(3, limit.get_limit())
+
+        # rate dropped, back off but never below minimum
+        clock.now = 10.0
+        limit.add_bytes(10)
+        self.assertEqual(2, limit.get_limit())
+        clock.now = 12.0
+        limit.add_bytes(0)
+        self.assertEqual(2, limit.get_limit())
+
+    def test_slot_waits_for_limit(self):
+        limit = AdaptiveConcurrencyLimit(1, 2)
+        entered = threading.Event()
+
+        def other():
+            with limit.slot():
+                entered.set()
+
+        with limit.slot():
+            thread = threading.Thread(target=other)
+            thread.start()
+            self.assertFalse(entered.wait(0.2))
+        self.assertTrue(entered.wait(5))
+        thread.join()
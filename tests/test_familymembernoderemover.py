@@ -49,42 +49,57 @@ class TestProteinFamilyNodeMemberRemover(unittest.TestCase):
 
         # try with no attributes
         e_key, d_val = remover._get_edge_key(ne)
-        self.assertEqual('s=1, t=2, i=activates, directed=False', e_key)
-        self.assertEqual(False, d_val)
-        e_key, d_val = remover._get_edge_key(ne, flip_src_target=True)
-        self.assertEqual('s=2, t=1, i=activates, directed=False', e_key)
+        self.assertEqual((1, 2, 'activates', False), e_key)
         self.assertEqual(False, d_val)
 
+        # source and target are put in ascending order
+        flipped = NetworkEdge(source_node_id=2, target_node_id=1,
+                              interaction='activates')
+        e_key, d_val = remover._get_edge_key(flipped)
+        self.assertEqual((1, 2, 'activates', False), e_key)
+
+        # node ids are compared as numbers not as strings
+        flipped = NetworkEdge(source_node_id=10, target_node_id=9,
+                              interaction='activates')
+        e_key, d_val = remover._get_edge_key(flipped)
+        self.assertEqual((9, 10, 'activates', False), e_key)
+
         # try with attributes but no match
         ne.set_attributes([Attribute(name='foo', value='1')])
         e_key, d_val = remover._get_edge_key(ne)
-        self.assertEqual('s=1, t=2, i=activates, directed=False', e_key)
-        self.assertEqual(False, d_val)
-        e_key, d_val = remover._get_edge_key(ne, flip_src_target=True)
-        self.assertEqual('s=2, t=1, i=activates, directed=False', e_key)
+        self.assertEqual((1, 2, 'activates', False), e_key)
         self.assertEqual(False, d_val)
 
         # try with directed attribute True
         ne.set_attributes([Attribute(name='directed', value=True,
                                      data_type='boolean')])
         e_key, d_val = remover._get_edge_key(ne)
-        self.assertEqual('s=1, t=2, i=activates, directed=True', e_key)
-        self.assertEqual(True, d_val)
-        e_key, d_val = remover._get_edge_key(ne, flip_src_target=True)
-        self.assertEqual('s=2, t=1, i=activates, directed=True', e_key)
+        self.assertEqual((1, 2, 'activates', True), e_key)
         self.assertEqual(True, d_val)
 
         # try with directed attribute False
         ne.set_attributes([Attribute(name='directed', value=False,
                                      data_type='boolean')])
         e_key, d_val = remover._get_edge_key(ne)
-        self.assertEqual('s=1, t=2, i=activates, directed=False', e_key)
+        self.assertEqual((1, 2, 'activates', False), e_key)
         self.assertEqual(False, d_val)
-        e_key, d_val = remover._get_edge_key(ne, flip_src_target=True)
-        self.assertEqual('s=2, t=1, i=activates, directed=False', e_key)
+
+    def test_get_directed_value(self):
+        remover = ProteinFamilyNodeMemberRemover()
+        ne = NetworkEdge(source_node_id=1, target_node_id=2,
+                         interaction='activates')
+        self.assertEqual(False, remover._get_directed_value(ne))
+        ne.set_attributes([Attribute(name='foo', value='1'),
+                           Attribute(name='directed', value=True,
+                                     data_type='boolean')])
+        self.assertEqual(True, remover._get_directed_value(ne))
+
+        # precomputed directed value is used as is
+        e_key, d_val = remover._get_edge_key(ne, d_val=False)
+        self.assertEqual((1, 2, 'activates', False), e_key)
         self.assertEqual(False, d_val)
 
-    def test_get_edge_key(self):
+    def test_get_edge_dict(self):
         remover = ProteinFamilyNodeMemberRemover()
 
         # try with 1 edge no attributes
@@ -92,7 +107,7 @@ class TestProteinFamilyNodeMemberRemover(unittest.TestCase):
                          interaction='activates')
         res = remover._get_edge_dict([ne])
         self.assertEqual(1, len(res))
-        key = 's=3, t=2, i=activates, directed=False'
+        key = (2, 3, 'activates', False)
         self.assertTrue(key in res)
         self.assertEqual(1, len(res[key]))
         self.assertTrue(ne.get_source_node_id() ==
@@ -117,7 +132,7 @@ class TestProteinFamilyNodeMemberRemover(unittest.TestCase):
         self.assertEqual(1, len(res[key]))
         self.assertTrue(ne.get_source_node_id() ==
                         res[key][0].get_source_node_id())
-        mkey = 's=1, t=2, i=activates, directed=False'
+        mkey = (1, 2, 'activates', False)
         self.assertTrue(mkey in res)
         self.assertEqual(2, len(res[mkey]))
 
@@ -125,6 +140,39 @@ class TestProteinFamilyNodeMemberRemover(unittest.TestCase):
 
 
 
+    def test_get_merged_edges(self):
+        remover = ProteinFamilyNodeMemberRemover()
+        ne_one = NetworkEdge(source_node_id=1, target_node_id=2,
+                             interaction='activates')
+        ne_two = NetworkEdge(source_node_id=1, target_node_id=3,
+                             interaction='activates')
+
+        # nothing to merge
+        edges = [ne_one, ne_two]
+        res = remover._get_merged_edges(edges)
+        self.assertEqual(edges, res)
+        self.assertFalse(res is edges)
+
+        ne_three = NetworkEdge(source_node_id=2, target_node_id=1,
+                               interaction='activates')
+        res = remover._get_merged_edges([ne_one, ne_two, ne_three])
+        self.assertEqual([ne_one, ne_two], res)
+
+    def test_merge_edge_group(self):
+        remover = ProteinFamilyNodeMemberRemover()
+        ne_one = NetworkEdge(source_node_id=1, target_node_id=2,
+                             interaction='activates',
+                             attributes=[Attribute(name='foo', value='a')])
+        ne_two = NetworkEdge(source_node_id=2, target_node_id=1,
+                             interaction='activates',
+                             attributes=[Attribute(name='foo', value='b')])
+        res = remover._merge_edge_group([ne_one, ne_two])
+        self.assertTrue(res is ne_one)
+        self.assertEqual(1, res.get_source_node_id())
+        self.assertEqual(1, len(res.get_attributes()))
+        self.assertEqual(['a', 'b'],
+                         sorted(res.get_attributes()[0].get_value()))
+
     def test_update_no_family_members(self):
         net = NiceCXNetwork()
 
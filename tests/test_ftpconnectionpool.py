@@ -0,0 +1,115 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""Tests for `FtpConnectionPool` class."""
+
+import threading
+import unittest
+from mock import MagicMock
+
+from ndexncipidloader.ndexloadncipid import FtpConnectionPool
+
+
+class TestFtpConnectionPool(unittest.TestCase):
+    """Tests for `FtpConnectionPool` class."""
+
+    def setUp(self):
+        """Set up test fixtures, if any."""
+
+    def tearDown(self):
+        """Tear down test fixtures, if any."""
+
+    def test_item_reuses_connection(self):
+        factory = MagicMock()
+        pool = FtpConnectionPool('host', 'user', 'pass', timeout=5,
+                                 size=2, connection_factory=factory)
+        with pool.item() as conn:
+            first = conn
+        with pool.item() as conn:
+            self.assertTrue(conn is first)
+        factory.assert_called_once_with('host', 'user', 'pass', timeout=5)
+
+    def test_item_creates_up_to_size(self):
+        factory = MagicMock(side_effect=[MagicMock(), MagicMock(),
+                                         MagicMock()])
+        pool = FtpConnectionPool('host', 'user', 'pass', size=2,
+                                 connection_factory=factory)
+        self.assertEqual(2, pool.get_size())
+        with pool.item() as conn_one:
+            with pool.item() as conn_two:
+                self.assertFalse(conn_one is conn_two)
+        self.assertEqual(2, factory.call_count)
+
+    def test_item_factory_raises_exception(self):
+        factory = MagicMock(side_effect=[Exception('error'), MagicMock()])
+        pool = FtpConnectionPool('host', 'user', 'pass', size=1,
+                                 connection_factory=factory)
+        try:
+            with pool.item():
+                self.fail('Expected exception')
+        except Exception as e:
+            self.assertEqual('error', str(e))
+
+        # failed connection should not use up slot in pool
+        with pool.item() as conn:
+            self.assertIsNotNone(conn)
+
+    def test_item_exception_discards_connection(self):
+        broken = MagicMock()
+        broken.close = MagicMock(side_effect=Exception('already closed'))
+        fresh = MagicMock()
+        factory = MagicMock(side_effect=[broken, fresh])
+        pool = FtpConnectionPool('host', 'user', 'pass', size=1,
+                                 connection_factory=factory)
+        try:
+            with pool.item() as conn:
+                self.assertTrue(conn is broken)
+                raise IOError('transfer failed')
+        except IOError as e:
+            self.assertEqual('transfer failed', str(e))
+        broken.close.assert_called_once_with()
+
+        # broken connection is not reused, a new one is created
+        with pool.item() as conn:
+            self.assertTrue(conn is fresh)
+        with pool.item() as conn:
+            self.assertTrue(conn is fresh)
+        self.assertEqual(2, factory.call_count)
+
+    def test_item_exception_wakes_waiting_thread(self):
+        broken = MagicMock()
+        fresh = MagicMock()
+        factory = MagicMock(side_effect=[broken, fresh])
+        pool = FtpConnectionPool('host', 'user', 'pass', size=1,
+                                 connection_factory=factory)
+        waiting = threading.Event()
+        res = []
+
+        def get_item():
+            waiting.set()
+            with pool.item() as conn:
+                res.append(conn)
+
+        try:
+            with pool.item():
+                thread = threading.Thread(target=get_item)
+                thread.start()
+                waiting.wait(5)
+                raise IOError('transfer failed')
+        except IOError:
+            pass
+        thread.join(5)
+        self.assertFalse(thread.is_alive())
+        self.assertEqual([fresh], res)
+
+    def test_add_connection_and_close(self):
+        factory = MagicMock()
+        pool = FtpConnectionPool('host', 'user', 'pass', size=1,
+                                 connection_factory=factory)
+        altconn = MagicMock()
+        pool.add_connection(altconn)
+        with pool.item() as conn:
+            self.assertTrue(conn is altconn)
+        factory.assert_not_called()
+        pool.close()
+        altconn.close.assert_called_once_with()
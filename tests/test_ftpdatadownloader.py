@@ -0,0 +1,193 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""Tests for `FtpDataDownloader` class."""
+
+import os
+import gzip
+import hashlib
+import tempfile
+import shutil
+
+import unittest
+from mock import MagicMock
+
+from ndexncipidloader.ndexloadncipid import FtpDataDownloader
+from ndexncipidloader.ndexloadncipid import FtpConnectionPool
+
+
+class TestFtpDataDownloader(unittest.TestCase):
+    """Tests for `FtpDataDownloader` class."""
+
+    def setUp(self):
+        """Set up test fixtures, if any."""
+
+    def tearDown(self):
+        """Tear down test fixtures, if any."""
+
+    def test_download_data(self):
+        temp_dir = tempfile.mkdtemp()
+        try:
+            outdir = os.path.join(temp_dir, 'out')
+            os.makedirs(outdir)
+            with open(os.path.join(outdir, 'c.owl'), 'w') as f:
+                f.write('already here')
+            with open(os.path.join(outdir, 'c.owl.sha256'), 'w') as f:
+                f.write(hashlib.sha256(b'already here').hexdigest() +
+                        '  c.owl\n')
+
+            # no checksum file, so treated as a partial download
+            with open(os.path.join(outdir, 'd.owl'), 'w') as f:
+                f.write('trunc')
+
+            def fake_get(entry, f=None):
+                if entry.endswith('.gz'):
+                    f.write(gzip.compress(b'gzdata'))
+                    return
+                f.write(b'data')
+
+            altftp = MagicMock()
+            altftp.list = MagicMock(return_value=['dir/a.owl.gz',
+                                                  'dir/b.owl',
+                                                  'dir/c.owl',
+                                                  'dir/d.owl'])
+            altftp.get = MagicMock(side_effect=fake_get)
+            dloader = FtpDataDownloader(outdir, ftpdir='dir')
+            dloader.set_alternate_ftp(altftp)
+            dloader.connect_to_ftp()
+            callback = MagicMock()
+            dloader.download_data(callback=callback)
+            dloader.disconnect()
+
+            altftp.list.assert_called_once_with('dir')
+            self.assertEqual(3, altftp.get.call_count)
+            with open(os.path.join(outdir, 'a.owl'), 'rb') as f:
+                self.assertEqual(b'gzdata', f.read())
+            with open(os.path.join(outdir, 'b.owl'), 'rb') as f:
+                self.assertEqual(b'data', f.read())
+            with open(os.path.join(outdir, 'd.owl'), 'rb') as f:
+                self.assertEqual(b'data', f.read())
+            self.assertTrue(dloader._is_downloaded(os.path.join(outdir,
+                                                                'a.owl')))
+            self.assertTrue(dloader._is_downloaded(os.path.join(outdir,
+                                                                'd.owl')))
+            self.assertEqual(['a.owl', 'a.owl.sha256', 'b.owl',
+                              'b.owl.sha256', 'c.owl', 'c.owl.sha256',
+                              'd.owl', 'd.owl.sha256'],
+                             sorted(os.listdir(outdir)))
+            self.assertEqual(sorted([os.path.join(outdir, 'a.owl'),
+                                     os.path.join(outdir, 'b.owl'),
+                                     os.path.join(outdir, 'd.owl')]),
+                             sorted([c[0][0] for c in
+                                     callback.call_args_list]))
+            altftp.close.assert_called_once_with()
+        finally:
+            shutil.rmtree(temp_dir)
+
+    def test_download_data_no_files(self):
+        temp_dir = tempfile.mkdtemp()
+        try:
+            altftp = MagicMock()
+            altftp.list = MagicMock(return_value=None)
+            dloader = FtpDataDownloader(temp_dir)
+            dloader.set_alternate_ftp(altftp)
+            dloader.connect_to_ftp()
+            callback = MagicMock()
+            dloader.download_data(callback=callback)
+            callback.assert_not_called()
+            altftp.get.assert_not_called()
+        finally:
+            shutil.rmtree(temp_dir)
+
+    def test_download_data_adaptive(self):
+        temp_dir = tempfile.mkdtemp()
+        try:
+            def fake_get(entry, f=None):
+                f.write(b'data')
+
+            factory = MagicMock()
+            factory.return_value.list = MagicMock(return_value=['dir/a.owl',
+                                                                'dir/b.owl'])
+            factory.return_value.get = MagicMock(side_effect=fake_get)
+            dloader = FtpDataDownloader(temp_dir, ftpdir='dir', poolsize=1,
+                                        maxpoolsize=3)
+            dloader._pool = FtpConnectionPool('host', 'user', 'pass',
+                                              size=3,
+                                              connection_factory=factory)
+            dloader.download_data()
+            self.assertEqual(1, dloader._limit.get_limit())
+            for name in ['a.owl', 'b.owl']:
+                with open(os.path.join(temp_dir, name), 'rb') as f:
+                    self.assertEqual(b'data', f.read())
+        finally:
+            shutil.rmtree(temp_dir)
+
+    def test_download_file_with_pool_returns_bytes(self):
+        temp_dir = tempfile.mkdtemp()
+        try:
+            compressed = gzip.compress(b'gzdata')
+
+            def fake_get(entry, f=None):
+                f.write(compressed)
+
+            altftp = MagicMock()
+            altftp.get = MagicMock(side_effect=fake_get)
+            dloader = FtpDataDownloader(temp_dir)
+            dloader.set_alternate_ftp(altftp)
+            dloader.connect_to_ftp()
+            destfile = os.path.join(temp_dir, 'a.owl')
+            num_bytes = dloader._download_file_with_pool('a.owl.gz',
+                                                         destfile)
+            self.assertEqual(len(compressed), num_bytes)
+            with open(destfile, 'rb') as f:
+                self.assertEqual(b'gzdata', f.read())
+        finally:
+            shutil.rmtree(temp_dir)
+
+    def test_is_downloaded(self):
+        temp_dir = tempfile.mkdtemp()
+        try:
+            dloader = FtpDataDownloader(temp_dir)
+            destfile = os.path.join(temp_dir, 'a.owl')
+            self.assertFalse(dloader._is_downloaded(destfile))
+            with open(destfile, 'wb') as f:
+                f.write(b'data')
+            self.assertFalse(dloader._is_downloaded(destfile))
+
+            dloader._write_checksum_file(destfile,
+                                         hashlib.sha256(b'data').hexdigest())
+            self.assertTrue(dloader._is_downloaded(destfile))
+
+            # file changed since checksum was written
+            with open(destfile, 'wb') as f:
+                f.write(b'dat')
+            self.assertFalse(dloader._is_downloaded(destfile))
+
+            # empty checksum file
+            open(destfile + '.sha256', 'w').close()
+            self.assertFalse(dloader._is_downloaded(destfile))
+        finally:
+            shutil.rmtree(temp_dir)
+
+    def test_download_file_with_pool_failure_leaves_no_file(self):
+        temp_dir = tempfile.mkdtemp()
+        try:
+            def fake_get(entry, f=None):
+                f.write(b'part')
+                raise IOError('connection lost')
+
+            altftp = MagicMock()
+            altftp.get = MagicMock(side_effect=fake_get)
+            dloader = FtpDataDownloader(temp_dir)
+            dloader.set_alternate_ftp(altftp)
+            dloader.connect_to_ftp()
+            destfile = os.path.join(temp_dir, 'a.owl')
+            try:
+                dloader._download_file_with_pool('a.owl', destfile)
+                self.fail('Expected IOError')
+            except IOError:
+                pass
+            self.assertFalse(os.path.isfile(destfile))
+            self.assertFalse(dloader._is_downloaded(destfile))
+        finally:
+            shutil.rmtree(temp_dir)
@@ -0,0 +1,87 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""Tests for `FusedNodeUpdator` class."""
+
+import unittest
+from mock import MagicMock
+
+from ndexncipidloader.ndexloadncipid import FusedNodeUpdator
+from ndexncipidloader.ndexloadncipid import NodeUpdator
+from ndexncipidloader.ndexloadncipid import NetworkIssueReport
+
+
+class RecordingNodeUpdator(NodeUpdator):
+    """
+    Records the order nodes are seen in
+    """
+    def __init__(self, name, calls, begin_issues=None):
+        super(RecordingNodeUpdator, self).__init__()
+        self._name = name
+        self._calls = calls
+        self._begin_issues = begin_issues
+
+    def get_description(self):
+        return 'desc ' + self._name
+
+    def begin_update(self, network):
+        self._calls.append((self._name, 'begin'))
+        return self._begin_issues
+
+    def update_node(self, network, nodeid, node):
+        self._calls.append((self._name, nodeid))
+        if nodeid == 1:
+            return [self._name + ' issue']
+        return None
+
+
+class TestFusedNodeUpdator(unittest.TestCase):
+    """Tests for `FusedNodeUpdator` class."""
+
+    def setUp(self):
+        """Set up test fixtures, if any."""
+
+    def tearDown(self):
+        """Tear down test fixtures, if any."""
+
+    def _get_network(self):
+        net = MagicMock()
+        net.get_nodes = MagicMock(return_value=[(0, {'n': 'a'}),
+                                                (1, {'n': 'b'})])
+        return net
+
+    def test_get_description(self):
+        calls = []
+        fused = FusedNodeUpdator([RecordingNodeUpdator('a', calls),
+                                  RecordingNodeUpdator('b', calls)])
+        self.assertEqual('Runs in one pass over nodes: desc a, desc b',
+                         fused.get_description())
+
+    def test_update_single_pass(self):
+        calls = []
+        net = self._get_network()
+        fused = FusedNodeUpdator([RecordingNodeUpdator('a', calls),
+                                  RecordingNodeUpdator('b', calls,
+                                                       begin_issues=['x'])])
+        self.assertEqual(['a issue', 'x', 'b issue'], fused.update(net))
+        self.assertEqual([('a', 'begin'), ('b', 'begin'),
+                          ('a', 0), ('b', 0),
+                          ('a', 1), ('b', 1)], calls)
+        net.get_nodes.assert_called_once_with()
+
+    def test_update_with_report(self):
+        calls = []
+        net = self._get_network()
+        fused = FusedNodeUpdator([RecordingNodeUpdator('a', calls),
+                                  RecordingNodeUpdator('b', calls)])
+        report = NetworkIssueReport('foo')
+        fused.update_with_report(net, report)
+        self.assertEqual(['a issue'], report._issuemap['desc a'])
+        self.assertEqual(['b issue'], report._issuemap['desc b'])
+
+    def test_nodeupdator_update(self):
+        calls = []
+        net = self._get_network()
+        updator = RecordingNodeUpdator('a', calls, begin_issues=['x'])
+        self.assertEqual(['x', 'a issue'], updator.update(net))
+        self.assertEqual([('a', 'begin'), ('a', 0), ('a', 1)], calls)
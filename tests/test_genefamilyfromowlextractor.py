@@ -0,0 +1,210 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""Tests for `GeneFamilyFromOwlExtractor` class."""
+
+import os
+import io
+import tempfile
+import shutil
+import xml.etree.ElementTree as ET
+
+import unittest
+import mock
+from mock import MagicMock
+
+from ndexncipidloader import ndexloadncipid
+from ndexncipidloader.ndexloadncipid import GeneFamilyFromOwlExtractor
+
+
+OWL_DOC = """<?xml version="1.0" encoding="UTF-8"?>
+<rdf:RDF
+ xmlns:rdf="http://www.w3.org/1999/02/22-rdf-syntax-ns#"
+ xmlns:bp="http://www.biopax.org/release/biopax-level3.owl#"
+ xmlns:owl="http://www.w3.org/2002/07/owl#"
+ xml:base="http://pathwaycommons.org/pc2/">
+<bp:Protein rdf:ID="Protein_fam">
+ <bp:displayName>AKT family</bp:displayName>
+ <bp:memberPhysicalEntity rdf:resource="#Protein_2"/>
+ <bp:memberPhysicalEntity rdf:resource="#Protein_1"/>
+</bp:Protein>
+<bp:Protein rdf:ID="Protein_1">
+ <bp:displayName>AKT1</bp:displayName>
+ <bp:entityReference rdf:resource="http://identifiers.org/uniprot/P31749"/>
+</bp:Protein>
+<bp:Protein rdf:ID="Protein_2">
+ <bp:displayName>AKT2</bp:displayName>
+ <bp:entityReference rdf:resource="http://identifiers.org/uniprot/P31751"/>
+</bp:Protein>
+<bp:Protein rdf:ID="Protein_3">
+ <bp:displayName>TP53</bp:displayName>
+ <bp:entityReference rdf:resource="http://identifiers.org/uniprot/P04637"/>
+</bp:Protein>
+</rdf:RDF>
+"""
+
+
+def _get_mock_client():
+    """
+    Creates mock biothings client that maps the uniprot
+    ids in :py:const:`OWL_DOC` to gene symbols
+    """
+    bclient = MagicMock()
+    bclient.querymany = MagicMock(return_value=[{'query': 'P31749',
+                                                 'symbol': 'AKT1'},
+                                                {'query': 'P31751',
+                                                 'symbol': 'AKT2'}])
+    return bclient
+
+
+class TestGeneFamilyFromOwlExtractor(unittest.TestCase):
+    """Tests for `GeneFamilyFromOwlExtractor` class."""
+
+    def setUp(self):
+        """Set up test fixtures, if any."""
+
+    def tearDown(self):
+        """Tear down test fixtures, if any."""
+
+    def test_replace_uniprot_with_gene_symbols_empty_list(self):
+        bclient = MagicMock()
+        extractor = GeneFamilyFromOwlExtractor(bclient=bclient)
+        self.assertEqual([],
+                         extractor._replace_uniprot_with_gene_symbols([]))
+        bclient.querymany.assert_not_called()
+
+    def test_replace_uniprot_with_gene_symbols(self):
+        bclient = _get_mock_client()
+        extractor = GeneFamilyFromOwlExtractor(bclient=bclient)
+        res = extractor.\
+            _replace_uniprot_with_gene_symbols(['http://identifiers.org/'
+                                                'uniprot/P31751',
+                                                'http://identifiers.org/'
+                                                'uniprot/P31749',
+                                                'http://identifiers.org/'
+                                                'uniprot/XXXXXX'])
+        self.assertEqual(['AKT1', 'AKT2'], res)
+        self.assertEqual(1, bclient.querymany.call_count)
+
+    def test_extract_gene_family_mapping(self):
+        extractor = GeneFamilyFromOwlExtractor(bclient=_get_mock_client())
+        owl_stream = io.BytesIO(OWL_DOC.encode('utf-8'))
+        res = extractor.extract_gene_family_mapping(owl_stream)
+        self.assertEqual({'AKT family': ['AKT1', 'AKT2']}, res)
+
+    def test_get_gene_family_mapping_as_string(self):
+        temp_dir = tempfile.mkdtemp()
+        try:
+            with open(os.path.join(temp_dir, 'foo.owl'), 'w') as f:
+                f.write(OWL_DOC)
+            with open(os.path.join(temp_dir, 'foo.txt'), 'w') as f:
+                f.write('not an owl file')
+            extractor = GeneFamilyFromOwlExtractor(bclient=_get_mock_client())
+            res = extractor.get_gene_family_mapping_as_string(temp_dir)
+            self.assertEqual('"AKT family": "AKT1,AKT2",\n', res)
+        finally:
+            shutil.rmtree(temp_dir)
+
+    def test_get_gene_family_mapping_as_string_no_owl_files(self):
+        temp_dir = tempfile.mkdtemp()
+        try:
+            extractor = GeneFamilyFromOwlExtractor(bclient=MagicMock())
+            self.assertEqual('',
+                             extractor.
+                             get_gene_family_mapping_as_string(temp_dir))
+        finally:
+            shutil.rmtree(temp_dir)
+
+    def test_get_uniprot_urls_for_protein(self):
+        extractor = GeneFamilyFromOwlExtractor(bclient=MagicMock())
+        root = ET.fromstring(OWL_DOC)
+        proteins = root.findall('bp:Protein', extractor._ns)
+        self.assertEqual([],
+                         extractor._get_uniprot_urls_for_protein(proteins[0]))
+        self.assertEqual(['http://identifiers.org/uniprot/P31749'],
+                         extractor._get_uniprot_urls_for_protein(proteins[1]))
+
+    def test_get_gene_family_mapping_as_string_multiple_files(self):
+        temp_dir = tempfile.mkdtemp()
+        try:
+            for name in ['one.owl', 'two.owl']:
+                with open(os.path.join(temp_dir, name), 'w') as f:
+                    f.write(OWL_DOC)
+            extractor = GeneFamilyFromOwlExtractor(bclient=_get_mock_client())
+            res = extractor.get_gene_family_mapping_as_string(temp_dir,
+                                                              max_workers=2)
+            self.assertEqual('"AKT family": "AKT1,AKT2",\n', res)
+        finally:
+            shutil.rmtree(temp_dir)
+
+    def test_get_family_uniprot_urls(self):
+        extractor = GeneFamilyFromOwlExtractor(bclient=None)
+        owl_stream = io.BytesIO(OWL_DOC.encode('utf-8'))
+        res = extractor.get_family_uniprot_urls(owl_stream)
+        self.assertEqual([('AKT family',
+                           ['http://identifiers.org/uniprot/P31751',
+                            'http://identifiers.org/uniprot/P31749'])], res)
+
+    def test_get_family_uniprot_urls_removes_processed_elements(self):
+        iterparse = ndexloadncipid.ET.iterparse
+        still_attached = []
+
+        def tracking_iterparse(source, events=None):
+            root = None
+            depth = 0
+            for event, elem in iterparse(source, events=events):
+                if root is None:
+                    root = elem
+                depth += 1 if event == 'start' else -1
+                yield event, elem
+                if event == 'end' and depth == 1:
+                    still_attached.append(any(c is elem for c in root))
+
+        extractor = GeneFamilyFromOwlExtractor(bclient=MagicMock())
+        xmlstream = io.BytesIO(OWL_DOC.encode('utf-8'))
+        with mock.patch.object(ndexloadncipid.ET, 'iterparse',
+                               tracking_iterparse):
+            res = extractor.get_family_uniprot_urls(xmlstream)
+        self.assertEqual(1, len(res))
+
+        # each top level element is detached from root once processed
+        self.assertEqual([False, False, False, False], still_attached)
+
+    def test_replace_uniprot_with_gene_symbols_duplicate_urls(self):
+        bclient = _get_mock_client()
+        extractor = GeneFamilyFromOwlExtractor(bclient=bclient)
+        res = extractor.\
+            _replace_uniprot_with_gene_symbols(['http://identifiers.org/'
+                                                'uniprot/P31749',
+                                                'http://identifiers.org/'
+                                                'uniprot/P31749'])
+        self.assertEqual(['AKT1'], res)
+        self.assertEqual(['P31749'], bclient.querymany.call_args[0][0])
+
+    def test_get_family_uniprot_urls_multiple_displaynames(self):
+        doc = OWL_DOC.replace('<bp:displayName>AKT family</bp:displayName>',
+                              '<bp:displayName>AKT family</bp:displayName>\n'
+                              ' <bp:displayName>AKT</bp:displayName>\n'
+                              ' <bp:displayName/>')
+        extractor = GeneFamilyFromOwlExtractor(bclient=None)
+        res = extractor.get_family_uniprot_urls(io.BytesIO(doc.
+                                                           encode('utf-8')))
+        self.assertEqual(1, len(res))
+        self.assertEqual('AKT family', res[0][0])
+
+    def test_replace_uniprot_with_gene_symbols_uses_cache(self):
+        bclient = _get_mock_client()
+        extractor = GeneFamilyFromOwlExtractor(bclient=bclient)
+        urls = ['http://identifiers.org/uniprot/P31749',
+                'http://identifiers.org/uniprot/XXXXXX']
+        self.assertEqual(['AKT1'],
+                         extractor._replace_uniprot_with_gene_symbols(urls))
+        self.assertEqual(['AKT1'],
+                         extractor._replace_uniprot_with_gene_symbols(urls))
+        self.assertEqual(1, bclient.querymany.call_count)
+
+        # only ids not already looked up are queried
+        extractor._replace_uniprot_with_gene_symbols(
+            urls + ['http://identifiers.org/uniprot/P31751'])
+        self.assertEqual(2, bclient.querymany.call_count)
+        self.assertEqual(['P31751'], bclient.querymany.call_args[0][0])
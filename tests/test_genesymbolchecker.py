@@ -0,0 +1,53 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""Tests for `GeneSymbolChecker` class."""
+
+import unittest
+from mock import MagicMock
+
+from ndexncipidloader.ndexloadncipid import GeneSymbolChecker
+from ndex2.nice_cx_network import NiceCXNetwork
+
+
+class TestGeneSymbolChecker(unittest.TestCase):
+    """Tests for `GeneSymbolChecker` class."""
+
+    def setUp(self):
+        """Set up test fixtures, if any."""
+
+    def tearDown(self):
+        """Tear down test fixtures, if any."""
+
+    def test_get_description(self):
+        checker = GeneSymbolChecker(searcher=MagicMock())
+        self.assertTrue('Checks all gene' in checker.get_description())
+
+    def test_update_repeated_names_looked_up_once(self):
+        searcher = MagicMock()
+        searcher.get_symbol = MagicMock(side_effect=['AKT1', None])
+        checker = GeneSymbolChecker(searcher=searcher)
+        net = NiceCXNetwork()
+        for name in ['AKT1', 'AKT1', 'foo', 'foo']:
+            nodeid = net.create_node(name)
+            net.set_node_attribute(nodeid, 'type', 'protein')
+        nodeid = net.create_node('ATP')
+        net.set_node_attribute(nodeid, 'type', 'smallmolecule')
+
+        issues = checker.update(net)
+        self.assertEqual(['foo does not come back as gene symbol',
+                          'foo does not come back as gene symbol'],
+                         issues)
+        self.assertEqual(2, searcher.get_symbol.call_count)
+
+        # cache is kept across networks
+        self.assertEqual(2, len(checker.update(net)))
+        self.assertEqual(2, searcher.get_symbol.call_count)
+
+    def test_pop_new_symbols_and_add_symbols(self):
+        searcher = MagicMock()
+        searcher.pop_new_symbols = MagicMock(return_value={'p1': 'ABC'})
+        checker = GeneSymbolChecker(searcher=searcher)
+        self.assertEqual({'p1': 'ABC'}, checker.pop_new_symbols())
+        checker.add_symbols({'p2': 'DEF'})
+        searcher.add_symbols.assert_called_once_with({'p2': 'DEF'})
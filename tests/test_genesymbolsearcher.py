@@ -4,6 +4,7 @@
 """Tests for `GeneSymbolSearcher` class."""
 
 import os
+import pickle
 import tempfile
 import shutil
 
@@ -166,3 +167,124 @@ GN   Synonyms=atx {ECO:0000303|PubMed:8521962},
 GN   bonT {ECO:0000303|PubMed:8863443};
 OS   Clostridium botulinum.""")
             self.assertEqual('botA', searcher.get_symbol('haha'))
+
+    def test_query_uniprot_uses_session(self):
+        session = MagicMock()
+        session.get.return_value.text = 'GN   Name=ABC1; Synonyms=XYZ\n'
+        searcher = GeneSymbolSearcher(bclient=MagicMock(), session=session)
+        self.assertEqual('ABC1', searcher._query_uniprot('haha'))
+        self.assertEqual('https://www.uniprot.org/uniprot/HAHA.txt',
+                         session.get.call_args[0][0])
+
+    def test_query_uniprot_request_exception(self):
+        session = MagicMock()
+        session.get.side_effect = requests.exceptions.ConnectionError('error')
+        searcher = GeneSymbolSearcher(bclient=MagicMock(), session=session)
+        self.assertEqual(None, searcher._query_uniprot('haha'))
+
+    def test_save_and_load_cache(self):
+        temp_dir = tempfile.mkdtemp()
+        try:
+            cache_file = os.path.join(temp_dir, 'sub', 'cache.json')
+            searcher = GeneSymbolSearcher(bclient=MagicMock(),
+                                          cache_path=cache_file)
+            self.assertEqual({}, searcher._cache)
+            searcher._cache['haha'] = 'gee'
+            searcher._cache['foo'] = ''
+            searcher.save_cache()
+            self.assertTrue(os.path.isfile(cache_file))
+
+            mock = MagicMock()
+            searcher = GeneSymbolSearcher(bclient=mock,
+                                          cache_path=cache_file)
+            self.assertEqual('gee', searcher.get_symbol('haha'))
+            self.assertEqual(None, searcher.get_symbol('foo'))
+            mock.query.assert_not_called()
+        finally:
+            shutil.rmtree(temp_dir)
+
+    def test_pop_new_symbols_and_add_symbols(self):
+        bclient = MagicMock()
+        bclient.query = MagicMock(return_value={'total': 1,
+                                                'hits': [{'symbol': 'abc'}]})
+        searcher = GeneSymbolSearcher(bclient=bclient)
+        searcher._cache['foo'] = 'FOO'
+        self.assertEqual('FOO', searcher.get_symbol('foo'))
+        self.assertEqual('ABC', searcher.get_symbol('p1'))
+        self.assertEqual({'p1': 'ABC'}, searcher.pop_new_symbols())
+        self.assertEqual({}, searcher.pop_new_symbols())
+
+        searcher.add_symbols({'p2': 'DEF', 'p3': ''})
+        self.assertEqual('DEF', searcher.get_symbol('p2'))
+        self.assertEqual(None, searcher.get_symbol('p3'))
+        self.assertEqual({}, searcher.pop_new_symbols())
+        bclient.query.assert_called_once_with('p1')
+
+    def test_pickle(self):
+        temp_dir = tempfile.mkdtemp()
+        try:
+            cache_file = os.path.join(temp_dir, 'cache.json')
+            searcher = GeneSymbolSearcher(bclient=MagicMock(),
+                                          cache_path=cache_file)
+            searcher._cache['haha'] = 'gee'
+            searcher.save_cache()
+            searcher._cache['foo'] = 'FOO'
+            searcher._new_symbols['foo'] = 'FOO'
+
+            res = pickle.loads(pickle.dumps(searcher))
+            self.assertEqual(None, res._bclient)
+            self.assertTrue(isinstance(res._session, requests.Session))
+            self.assertEqual({'haha': 'gee'}, res._cache)
+            self.assertEqual({}, res._new_symbols)
+            self.assertEqual(cache_file, res._cache_path)
+
+            # original is unchanged
+            self.assertEqual('FOO', searcher._cache['foo'])
+            self.assertTrue(searcher._bclient is not None)
+        finally:
+            shutil.rmtree(temp_dir)
+
+    def test_save_cache_no_path(self):
+        searcher = GeneSymbolSearcher(bclient=MagicMock())
+        searcher._cache['haha'] = 'gee'
+        searcher.save_cache()
+
+    def test_prefetch_symbols(self):
+        mock = MagicMock()
+        mock.querymany = MagicMock(return_value=[{'query': 'p1',
+                                                  'symbol': 'abc'},
+                                                 {'query': 'p1',
+                                                  'symbol': 'def'},
+                                                 {'query': 'p2',
+                                                  'notfound': True}])
+        searcher = GeneSymbolSearcher(bclient=mock)
+        searcher._cache['p3'] = 'XYZ'
+        searcher.prefetch_symbols(['p1', 'p2', 'p3', None])
+        self.assertEqual(['p1', 'p2'],
+                         sorted(mock.querymany.call_args[0][0]))
+        self.assertEqual({'p1': 'ABC', 'p3': 'XYZ'}, searcher._cache)
+        self.assertEqual('ABC', searcher.get_symbol('p1'))
+        mock.query.assert_not_called()
+
+    def test_prefetch_symbols_request_error(self):
+        for error in [HTTPError('error'),
+                      requests.exceptions.ConnectionError('down'),
+                      requests.exceptions.Timeout('slow')]:
+            mock = MagicMock()
+            mock.querymany = MagicMock(side_effect=error)
+            mock.query = MagicMock(return_value={'total': 1,
+                                                 'hits': [{'symbol': 'abc'}]})
+            searcher = GeneSymbolSearcher(bclient=mock)
+            searcher.prefetch_symbols(['p1'])
+            self.assertEqual({}, searcher._cache)
+
+            # falls back to per symbol lookup
+            self.assertEqual('ABC', searcher.get_symbol('p1'))
+            mock.query.assert_called_once_with('p1')
+
+    def test_prefetch_symbols_nothing_to_query(self):
+        mock = MagicMock()
+        searcher = GeneSymbolSearcher(bclient=mock)
+        searcher.prefetch_symbols(None)
+        searcher.prefetch_symbols([])
+        mock.querymany.assert_not_called()
@@ -0,0 +1,57 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""Tests for `GunzipWriter` class."""
+
+import io
+import gzip
+import unittest
+
+from ndexncipidloader.ndexloadncipid import GunzipWriter
+
+
+class TestGunzipWriter(unittest.TestCase):
+    """Tests for `GunzipWriter` class."""
+
+    def setUp(self):
+        """Set up test fixtures, if any."""
+
+    def tearDown(self):
+        """Tear down test fixtures, if any."""
+
+    def _write_in_chunks(self, data, chunk_size):
+        out = io.BytesIO()
+        writer = GunzipWriter(out)
+        for i in range(0, len(data), chunk_size):
+            chunk = data[i:i + chunk_size]
+            self.assertEqual(len(chunk), writer.write(chunk))
+        writer.finish()
+        self.assertEqual(len(data), writer.get_compressed_bytes())
+        return out.getvalue()
+
+    def test_write(self):
+        raw = b'hello world\n' * 1000
+        data = gzip.compress(raw)
+        for chunk_size in [1, 7, 8192, len(data)]:
+            self.assertEqual(raw, self._write_in_chunks(data, chunk_size))
+
+    def test_write_multiple_members(self):
+        data = gzip.compress(b'one') + gzip.compress(b'two')
+        self.assertEqual(gzip.decompress(data),
+                         self._write_in_chunks(data, 5))
+
+    def test_write_empty(self):
+        self.assertEqual(b'', self._write_in_chunks(b'', 10))
+
+    def test_finish_truncated(self):
+        data = gzip.compress(b'hello world')
+        writer = GunzipWriter(io.BytesIO())
+        writer.write(data[:-4])
+        try:
+            writer.finish()
+            self.fail('Expected EOFError')
+        except EOFError as e:
+            self.assertTrue('end-of-stream' in str(e))
+
+    def test_is_iobase(self):
+        self.assertTrue(isinstance(GunzipWriter(io.BytesIO()), io.IOBase))
@@ -4,10 +4,15 @@
 """Tests for `ndexncipidloader` package."""
 
 import os
+import json
 import tempfile
 import shutil
+import subprocess
+import sys
 
 import unittest
+import mock
+from ndex2.nice_cx_network import NiceCXNetwork
 from ndexutil.config import NDExUtilConfig
 from ndexncipidloader import ndexloadncipid
 from ndexncipidloader.ndexloadncipid import NetworkAttributes
@@ -32,6 +37,9 @@ class TestNdexncipidloaderMain(unittest.TestCase):
         self.assertEqual(res.verbose, 0)
         self.assertEqual(res.logconf, None)
         self.assertEqual(res.conf, None)
+        self.assertEqual(res.numworkers, 1)
+        self.assertEqual(res.layoutcache, None)
+        self.assertEqual(res.ftpmaxpoolsize, None)
 
         someargs = ['-vv', '--conf', 'foo', '--logconf', 'hi',
                     '--loadplan', 'plan',
@@ -45,6 +53,25 @@ class TestNdexncipidloaderMain(unittest.TestCase):
         self.assertEqual(res.logconf, 'hi')
         self.assertEqual(res.conf, 'foo')
 
+    def test_default_cyrest_api_matches_ndexutil(self):
+        from ndexutil.cytoscape import DEFAULT_CYREST_API
+        self.assertEqual(DEFAULT_CYREST_API,
+                         ndexloadncipid.DEFAULT_CYREST_API)
+        res = ndexloadncipid._parse_arguments('hi', ['foo'])
+        self.assertEqual(DEFAULT_CYREST_API, res.cyresturl)
+
+    def test_import_does_not_load_heavy_modules(self):
+        code = ("import sys\n"
+                "import ndexncipidloader.ndexloadncipid\n"
+                "print(','.join(m for m in ('pandas', 'networkx', 'ndex2', "
+                "'py4cytoscape', 'biothings_client', 'ftpretty') "
+                "if m in sys.modules))\n")
+        srcdir = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+        res = subprocess.run([sys.executable, '-c', code], cwd=srcdir,
+                             stdout=subprocess.PIPE, check=True,
+                             universal_newlines=True)
+        self.assertEqual('', res.stdout.strip())
+
     def test_setup_logging(self):
         """ Tests logging setup"""
         try:
@@ -130,6 +157,28 @@ format=%(asctime)s %(name)-12s %(levelname)-8s %(message)s""")
         finally:
             shutil.rmtree(temp_dir)
 
+    def test_main_owl_conversion_error(self):
+        temp_dir = tempfile.mkdtemp()
+        try:
+            def fake_download(callback=None):
+                callback(os.path.join(temp_dir, 'foo.owl'))
+
+            with mock.patch('ndexncipidloader.ndexloadncipid.'
+                            'FtpDataDownloader') as mock_dloader:
+                with mock.patch('ndexncipidloader.ndexloadncipid.'
+                                'PaxtoolsRunner') as mock_paxy:
+                    dloader = mock_dloader.return_value
+                    dloader.download_data.side_effect = fake_download
+                    paxy = mock_paxy.return_value
+                    paxy.convert_owl_file.side_effect = OSError('no java')
+                    res = ndexloadncipid.main(['myprog.py', temp_dir])
+            self.assertEqual(2, res)
+            paxy.convert_owl_file.\
+                assert_called_once_with(os.path.join(temp_dir, 'foo.owl'))
+            paxy.run_paxtools.assert_not_called()
+        finally:
+            shutil.rmtree(temp_dir)
+
     def test_networkattributes(self):
         na = NetworkAttributes()
         self.assertEqual(na.get_author(None), None)
@@ -175,6 +224,21 @@ format=%(asctime)s %(name)-12s %(levelname)-8s %(message)s""")
         na.add_reviewers_entry('yoyo', 'hh')
         self.assertEqual(na.get_reviewers('yoyo'), 'hh')
 
+    def test_networkattributes_add_entries(self):
+        na = NetworkAttributes()
+        na.add_entries([])
+        self.assertEqual(na.get_author('boo'), None)
+
+        na.add_entries([('boo', 'bauthor', 'breviewer', 'blabel'),
+                        ('far', 'fauthor', 'freviewer', 'flabel'),
+                        ('boo', 'bauthor2', 'breviewer2', 'blabel2')])
+        self.assertEqual(na.get_author('boo'), 'bauthor2')
+        self.assertEqual(na.get_reviewers('boo'), 'breviewer2')
+        self.assertEqual(na.get_labels('boo'), 'blabel2')
+        self.assertEqual(na.get_author('far'), 'fauthor')
+        self.assertEqual(na.get_reviewers('far'), 'freviewer')
+        self.assertEqual(na.get_labels('far'), 'flabel')
+
     def test_networkattributesfromtsvfactory(self):
         try:
             fac = NetworkAttributesFromTSVFactory(None, delim=',')
@@ -192,3 +256,167 @@ format=%(asctime)s %(name)-12s %(levelname)-8s %(message)s""")
                              'Shiva Krupa')
         finally:
             shutil.rmtree(temp_dir)
+
+    def test_networkattributesfromtsvfactory_cached(self):
+        tsvfile = ndexloadncipid.get_networkattributes()
+        fac = NetworkAttributesFromTSVFactory(tsvfile, delim='\t')
+        na = fac.get_network_attributes_obj()
+        with mock.patch('ndexncipidloader.ndexloadncipid.'
+                        'NetworkAttributesFromTSVFactory.'
+                        '_parse_tsvfile') as mock_parse:
+            na_two = fac.get_network_attributes_obj()
+            mock_parse.assert_not_called()
+        self.assertFalse(na is na_two)
+        self.assertEqual(na.get_labels('a4b7 Integrin signaling'),
+                         na_two.get_labels('a4b7 Integrin signaling'))
+
+    def test_get_gene_client(self):
+        bclient = mock.MagicMock()
+        self.assertTrue(ndexloadncipid._get_gene_client(bclient) is bclient)
+        with mock.patch('biothings_client.get_client',
+                        return_value='client') as mock_get:
+            self.assertEqual('client',
+                             ndexloadncipid._get_gene_client(None))
+            mock_get.assert_called_once_with('gene')
+
+    def test_setup_biothings_caching(self):
+        temp_dir = tempfile.mkdtemp()
+        try:
+            cache_db = os.path.join(temp_dir, 'sub', 'cache')
+            bclient = mock.MagicMock()
+            self.assertTrue(ndexloadncipid.
+                            _setup_biothings_caching(bclient, cache_db))
+            bclient.set_caching.assert_called_once_with(cache_db=cache_db,
+                                                        verbose=False)
+            bclient.clear_cache.assert_not_called()
+            self.assertTrue(os.path.isdir(os.path.join(temp_dir, 'sub')))
+
+            bclient = mock.MagicMock()
+            self.assertTrue(ndexloadncipid.
+                            _setup_biothings_caching(bclient, cache_db,
+                                                     clear=True))
+            bclient.clear_cache.assert_called_once_with()
+
+            # requests-cache not installed
+            bclient = mock.MagicMock()
+            bclient.set_caching.side_effect = ImportError('no module')
+            self.assertFalse(ndexloadncipid.
+                             _setup_biothings_caching(bclient, cache_db,
+                                                      clear=True))
+            bclient.clear_cache.assert_not_called()
+        finally:
+            shutil.rmtree(temp_dir)
+
+    def test_index_node_attribute(self):
+        net = mock.MagicMock()
+        net.nodeAttributes = {0: [{'po': 0, 'n': 'foo', 'v': 'a'},
+                                  {'po': 0, 'n': 'bar', 'v': 'b'},
+                                  {'po': 0, 'n': 'bar', 'v': 'c'}],
+                              1: [{'po': 1, 'n': 'foo', 'v': 'd'}],
+                              2: [{'po': 2, 'n': 'bar', 'v': None}]}
+        self.assertEqual({0: 'b', 2: None},
+                         ndexloadncipid._index_node_attribute(net, 'bar'))
+        self.assertEqual({},
+                         ndexloadncipid._index_node_attribute(net, 'xx'))
+
+    def test_write_cx_to_file(self):
+        temp_dir = tempfile.mkdtemp()
+        try:
+            cx = [{'nodes': [{'@id': 0, 'n': 'a'}]},
+                  {'cartesianLayout': [{'node': 0, 'x': 1.5, 'y': -2.0}]}]
+            cx_file = os.path.join(temp_dir, 'foo.cx')
+            ndexloadncipid._write_cx_to_file(cx, cx_file)
+            with open(cx_file, 'r') as f:
+                self.assertEqual(cx, json.load(f))
+
+            # standard library fallback
+            with mock.patch.object(ndexloadncipid, 'orjson', None):
+                ndexloadncipid._write_cx_to_file(cx, cx_file)
+            with open(cx_file, 'r') as f:
+                self.assertEqual(cx, json.load(f))
+        finally:
+            shutil.rmtree(temp_dir)
+
+    def test_get_worker_loader(self):
+        loader = mock.MagicMock()
+        loader._worker_key = 'a'
+        try:
+            self.assertEqual(loader,
+                             ndexloadncipid._get_worker_loader(loader))
+            loader._load_network_attributes.assert_called_once_with()
+            loader._load_style_template.assert_called_once_with()
+
+            # same run so first loader is kept
+            same = mock.MagicMock()
+            same._worker_key = 'a'
+            self.assertEqual(loader,
+                             ndexloadncipid._get_worker_loader(same))
+            same._load_network_attributes.assert_not_called()
+
+            # new run replaces loader
+            other = mock.MagicMock()
+            other._worker_key = 'b'
+            self.assertEqual(other,
+                             ndexloadncipid._get_worker_loader(other))
+            other._load_style_template.assert_called_once_with()
+        finally:
+            ndexloadncipid._WORKER_LOADER = None
+
+    def test_build_network_in_worker(self):
+        loader = mock.MagicMock()
+        loader._worker_key = 'a'
+        loader._build_network = mock.MagicMock(return_value=('net',
+                                                             'report'))
+        loader._pop_new_symbols = mock.MagicMock(return_value=[{'x': 'y'}])
+        try:
+            self.assertEqual((('net', 'report'), [{'x': 'y'}]),
+                             ndexloadncipid.
+                             _build_network_in_worker(loader, 'foo.sif'))
+            loader._build_network.assert_called_once_with('foo.sif')
+        finally:
+            ndexloadncipid._WORKER_LOADER = None
+
+    def test_process_sif_in_worker(self):
+        loader = mock.MagicMock()
+        loader._worker_key = 'a'
+        loader._process_sif = mock.MagicMock(return_value='report')
+        loader._pop_new_symbols = mock.MagicMock(return_value=None)
+        try:
+            self.assertEqual(('report', None),
+                             ndexloadncipid.
+                             _process_sif_in_worker(loader, 'foo.sif'))
+            loader._create_ndex_connection.assert_called_once_with()
+            loader._process_sif.assert_called_once_with('foo.sif')
+        finally:
+            ndexloadncipid._WORKER_LOADER = None
+
+    def test_load_gene_symbol_map(self):
+        genesymbol = ndexloadncipid.get_gene_symbol_mapping()
+        res = ndexloadncipid._load_gene_symbol_map(genesymbol)
+        self.assertTrue(len(res) > 0)
+        with mock.patch('json.load') as mock_load:
+            self.assertTrue(res is
+                            ndexloadncipid._load_gene_symbol_map(genesymbol))
+            mock_load.assert_not_called()
+
+    def test_layout_needs_cytoscape(self):
+        p = mock.MagicMock()
+        loader = ndexloadncipid.NDExNciPidLoader(p)
+        for layout, expected in [(None, False), ('spring', False),
+                                 ('forceatlas2', False), ('-', True),
+                                 ('grid', True)]:
+            p.layout = layout
+            self.assertEqual(expected, loader._layout_needs_cytoscape())
+
+    def test_gene_symbol_map_shared_between_updators(self):
+        genesymbol = ndexloadncipid.get_gene_symbol_mapping()
+        namer = ndexloadncipid.GeneSymbolNodeNameUpdator(genesymbol)
+        expander = ndexloadncipid.GeneFamilyExpander(genesymbol)
+        net = NiceCXNetwork()
+        namer.begin_update(net)
+        with mock.patch('json.load') as mock_load:
+            expander.begin_update(net)
+            mock_load.assert_not_called()
+        self.assertTrue(namer._gene_symbol_map is
+                        expander._gene_symbol_map)
+        self.assertTrue(len(namer._gene_symbol_map) > 0)
@@ -4,18 +4,29 @@
 """Tests for `NDExNciPidLoader` class."""
 
 import os
+import io
+import re
+import copy
+import json
+import pickle
+import functools
+import multiprocessing
 import tempfile
 import shutil
 
 import unittest
 import mock
 from mock import MagicMock
+from concurrent.futures import ProcessPoolExecutor
 from ndex2.nice_cx_network import NiceCXNetwork
 
 import ndexncipidloader
 from ndexncipidloader.ndexloadncipid import NDExNciPidLoader
 from ndexncipidloader.ndexloadncipid import NetworkIssueReport
+from ndexncipidloader.ndexloadncipid import GeneSymbolSearcher
+from ndexncipidloader.ndexloadncipid import UniProtToGeneSymbolUpdater
 from ndexutil.config import NDExUtilConfig
+from ndexutil.ndex import NDExExtraUtils
 from ndexncipidloader import ndexloadncipid
 from ndexncipidloader.exceptions import NDExNciPidLoaderError
 
@@ -27,6 +38,50 @@ class Param(object):
     pass
 
 
+class PrefixSymbolSearcher(GeneSymbolSearcher):
+    """
+    Searcher that returns value passed in prefixed with
+    SYM instead of querying a service
+    """
+    def _query_mygene(self, val):
+        return 'SYM' + val
+
+
+class ParallelRunLoader(NDExNciPidLoader):
+    """
+    Loader that skips NDEx, config and sif parsing so :py:func:`run`
+    can be tested with worker processes. The NDEx client is a string
+    naming the process that created it
+    """
+    def _parse_config(self):
+        self._user = 'bob'
+
+    def _create_ndex_connection(self):
+        if self._ndex is None:
+            self._ndex = 'client-' + str(os.getpid())
+
+    def _load_network_summaries_for_user(self):
+        self._net_summaries = {}
+
+    def _parse_load_plan(self):
+        pass
+
+    def _load_network_attributes(self):
+        pass
+
+    def _load_style_template(self):
+        pass
+
+    def _build_network(self, file_name):
+        if self._networkupdators is not None:
+            self._networkupdators[0]._searcher.get_symbol(file_name)
+        return 'network', NetworkIssueReport(file_name)
+
+    def _save_network(self, network, report):
+        report.addissues('saved with', [str(self._ndex)])
+        return report
+
+
 class TestNDExNciPidLoader(unittest.TestCase):
     """Tests for `NDExNciPidLoader` class."""
 
@@ -66,6 +121,14 @@ class TestNDExNciPidLoader(unittest.TestCase):
         loader._parse_load_plan()
         self.assertTrue(isinstance(loader._loadplan, dict))
 
+    def test_parse_load_plan_already_loaded(self):
+        p = Param()
+        p.loadplan = '/this/file/does/not/exist.json'
+        loader = NDExNciPidLoader(p)
+        loader._loadplan = {'foo': 'bar'}
+        loader._parse_load_plan()
+        self.assertEqual({'foo': 'bar'}, loader._loadplan)
+
     def test_get_style_template(self):
         p = Param()
         p.style = ndexloadncipid.get_style()
@@ -96,6 +159,42 @@ class TestNDExNciPidLoader(unittest.TestCase):
                          loader._normalize_context_prefixes('UniProt:'
                                                             'yo'))
 
+    def test_get_pandas_dataframe(self):
+        temp_dir = tempfile.mkdtemp()
+        try:
+            with open(os.path.join(temp_dir, 'foo.sif'), 'w') as f:
+                f.write('PARTICIPANT_A\tINTERACTION_TYPE\tPARTICIPANT_B\t'
+                        'INTERACTION_PUBMED_ID\n'
+                        '[P1]\tcontrols\tCHEBI:1\t\n'
+                        'P1\tneighbor-of\tP2\t123\n'
+                        '\n'
+                        'PARTICIPANT\tPARTICIPANT_TYPE\tPARTICIPANT_NAME\n'
+                        'P1\tProteinReference\tuniprot knowledgebase:P1\n'
+                        'CHEBI:1\tSmallMoleculeReference\tNA\n')
+            p = MagicMock()
+            p.sifdir = temp_dir
+            loader = NDExNciPidLoader(p)
+            df = loader._get_pandas_dataframe('foo.sif')
+            self.assertEqual(2, len(df))
+            self.assertEqual(['P1', 'P1'], list(df['PARTICIPANT_A']))
+            self.assertEqual(['CHEBI:1', 'P2'], list(df['PARTICIPANT_B']))
+            self.assertEqual(['', '123'], list(df['INTERACTION_PUBMED_ID']))
+            self.assertEqual('uniprot:P1', df['PARTICIPANT_NAME_A'][1])
+            self.assertEqual('NA', df['PARTICIPANT_NAME_B'][0])
+        finally:
+            shutil.rmtree(temp_dir)
+
+    def test_get_pandas_dataframe_empty_file(self):
+        temp_dir = tempfile.mkdtemp()
+        try:
+            open(os.path.join(temp_dir, 'foo.sif'), 'w').close()
+            p = MagicMock()
+            p.sifdir = temp_dir
+            loader = NDExNciPidLoader(p)
+            self.assertEqual(None, loader._get_pandas_dataframe('foo.sif'))
+        finally:
+            shutil.rmtree(temp_dir)
+
     def test_set_wasderivedfrom(self):
         net = NiceCXNetwork()
         net.set_name('foo')
@@ -295,9 +394,78 @@ class TestNDExNciPidLoader(unittest.TestCase):
         self.assertEqual(100,
                          len(net.get_opaque_aspect('cartesianLayout')))
 
+    def test_get_node_scale(self):
+        loader = NDExNciPidLoader(None)
+        self.assertEqual(40, loader._get_node_scale(2))
+        self.assertEqual(150, loader._get_node_scale(10))
+        self.assertEqual(200, loader._get_node_scale(20))
+        self.assertEqual(500, loader._get_node_scale(100))
+
+    def test_apply_forceatlas2_layout_not_installed(self):
+        loader = NDExNciPidLoader(None)
+        with mock.patch.dict('sys.modules', {'fa2': None}):
+            try:
+                loader._apply_forceatlas2_layout(NiceCXNetwork())
+                self.fail('Expected NDExNciPidLoaderError')
+            except NDExNciPidLoaderError as e:
+                self.assertEqual('fa2 package must be installed to use '
+                                 'forceatlas2 layout', str(e))
+
+    def test_apply_forceatlas2_layout(self):
+        net = NiceCXNetwork()
+        for x in range(3):
+            net.create_node('node' + str(x))
+        fa2 = MagicMock()
+        mock_fa2 = MagicMock()
+        positions = {0: (1, 2), 1: (3, 4), 2: (5, 6)}
+        mock_fa2.forceatlas2_networkx_layout = \
+            MagicMock(return_value=positions)
+        fa2.ForceAtlas2 = MagicMock(return_value=mock_fa2)
+        loader = NDExNciPidLoader(None)
+        with mock.patch.dict('sys.modules', {'fa2': fa2}):
+            loader._apply_forceatlas2_layout(net, iterations=5)
+        fa2.ForceAtlas2.assert_called_once_with(barnesHutOptimize=True,
+                                                scalingRatio=60,
+                                                verbose=False)
+        self.assertEqual(5, mock_fa2.forceatlas2_networkx_layout.
+                         call_args[1]['iterations'])
+        self.assertEqual([{'node': 0, 'x': 1.0, 'y': 2.0},
+                          {'node': 1, 'x': 3.0, 'y': 4.0},
+                          {'node': 2, 'x': 5.0, 'y': 6.0}],
+                         net.get_opaque_aspect('cartesianLayout'))
+
+    def test_get_spring_layout_method(self):
+        loader = NDExNciPidLoader(None)
+
+        def new_layout(G, k=None, iterations=50, method='auto'):
+            pass
+
+        def old_layout(G, k=None, iterations=50):
+            pass
+
+        new_nx = MagicMock()
+        new_nx.drawing.spring_layout = new_layout
+        old_nx = MagicMock()
+        old_nx.drawing.spring_layout = old_layout
+
+        min_nodes = ndexloadncipid.ENERGY_SPRING_LAYOUT_MIN_NODES
+        self.assertIsNone(loader._get_spring_layout_method(new_nx,
+                                                           min_nodes - 1))
+        self.assertIsNone(loader._get_spring_layout_method(old_nx,
+                                                           min_nodes))
+        with mock.patch('importlib.util.find_spec', return_value=None):
+            self.assertIsNone(loader._get_spring_layout_method(new_nx,
+                                                               min_nodes))
+        with mock.patch('importlib.util.find_spec',
+                        return_value=MagicMock()):
+            self.assertEqual('energy',
+                             loader._get_spring_layout_method(new_nx,
+                                                              min_nodes))
+
     def test_apply_cytoscape_layout_ping_failed(self):
         p = MagicMock()
         p.layout = 'grid'
+        p.layoutcache = None
         mockpy4 = MagicMock()
         mockpy4.cytoscape_ping = MagicMock(side_effect=Exception('error'))
         loader = NDExNciPidLoader(p, py4cyto=mockpy4)
@@ -309,11 +477,33 @@ class TestNDExNciPidLoader(unittest.TestCase):
             self.assertEqual('Cytoscape needs to be running '
                              'to run layout: grid', str(e))
 
+    def test_get_cx_with_node_id_attribute(self):
+        temp_dir = tempfile.mkdtemp()
+        try:
+            loader = NDExNciPidLoader(None)
+            net = NiceCXNetwork()
+            for x in range(3):
+                net.create_node('node' + str(x))
+            net.set_node_attribute(1, 'foo', 'bar')
+            orig_attrs = copy.deepcopy(net.nodeAttributes)
+            cx_file = os.path.join(temp_dir, 'foo.cx')
+            with open(cx_file, 'w') as f:
+                json.dump(loader._get_cx_with_node_id_attribute(net), f)
+
+            # network passed in is left unchanged
+            self.assertEqual(orig_attrs, net.nodeAttributes)
+            res = NDExExtraUtils().\
+                get_node_id_mapping_from_node_attribute(cxfile=cx_file)
+            self.assertEqual({0: 0, 1: 1, 2: 2}, res)
+        finally:
+            shutil.rmtree(temp_dir)
+
     def test_apply_cytoscape_layout_networks_not_in_dict(self):
         temp_dir = tempfile.mkdtemp()
         try:
             p = MagicMock()
             p.layout = 'grid'
+            p.layoutcache = None
             p.sifdir = temp_dir
             mockpy4 = MagicMock()
             mockpy4.import_network_from_file = MagicMock(return_value={})
@@ -334,12 +524,14 @@ class TestNDExNciPidLoader(unittest.TestCase):
         try:
             p = MagicMock()
             p.layout = 'grid'
+            p.layoutcache = None
             p.sifdir = temp_dir
             mockpy4 = MagicMock()
             imp_res = {'networks': ['netid']}
             mockpy4.import_network_from_file = MagicMock(return_value=imp_res)
             mockpy4.export_network = MagicMock(return_value='')
-            loader = NDExNciPidLoader(p, py4cyto=mockpy4)
+            loader = NDExNciPidLoader(p, py4cyto=mockpy4,
+                                      ndexextra=MagicMock())
             loader._ndexextra.extract_layout_aspect_from_cx = MagicMock(return_value={'cartesianLayout': []})
             net = NiceCXNetwork()
             for x in range(10):
@@ -350,5 +542,312 @@ class TestNDExNciPidLoader(unittest.TestCase):
         finally:
             shutil.rmtree(temp_dir)
 
+    def test_apply_cytoscape_layout_uses_cache(self):
+        temp_dir = tempfile.mkdtemp()
+        try:
+            p = MagicMock()
+            p.layout = 'grid'
+            p.layoutcache = os.path.join(temp_dir, 'cache')
+            p.sifdir = temp_dir
+            mockpy4 = MagicMock()
+            imp_res = {'networks': ['netid']}
+            mockpy4.import_network_from_file = MagicMock(return_value=imp_res)
+            mockpy4.export_network = MagicMock(return_value='')
+            loader = NDExNciPidLoader(p, py4cyto=mockpy4,
+                                      ndexextra=MagicMock())
+            layout = [{'node': 0, 'x': 1.0, 'y': 2.0}]
+            loader._ndexextra.extract_layout_aspect_from_cx = \
+                MagicMock(return_value=layout)
+            net = NiceCXNetwork()
+            net.create_edge(net.create_node('a'), net.create_node('b'))
+            loader._apply_cytoscape_layout(net)
+            self.assertEqual(layout, net.get_opaque_aspect('cartesianLayout'))
+            self.assertTrue(os.path.isfile(loader._get_layout_cache_file(net)))
+            self.assertEqual(1, mockpy4.layout_network.call_count)
+
+            # same topology reuses layout without calling Cytoscape
+            mockpy4.cytoscape_ping = MagicMock(side_effect=Exception('no'))
+            othernet = NiceCXNetwork()
+            othernet.create_edge(othernet.create_node('a'),
+                                 othernet.create_node('b'))
+            loader._apply_cytoscape_layout(othernet)
+            self.assertEqual(layout,
+                             othernet.get_opaque_aspect('cartesianLayout'))
+            self.assertEqual(1, mockpy4.layout_network.call_count)
+        finally:
+            shutil.rmtree(temp_dir)
+
+    def test_apply_cytoscape_layout_corrupt_cache(self):
+        temp_dir = tempfile.mkdtemp()
+        try:
+            p = MagicMock()
+            p.layout = 'grid'
+            p.layoutcache = os.path.join(temp_dir, 'cache')
+            p.sifdir = temp_dir
+            mockpy4 = MagicMock()
+            imp_res = {'networks': ['netid']}
+            mockpy4.import_network_from_file = MagicMock(return_value=imp_res)
+            mockpy4.export_network = MagicMock(return_value='')
+            loader = NDExNciPidLoader(p, py4cyto=mockpy4,
+                                      ndexextra=MagicMock())
+            layout = [{'node': 0, 'x': 1.0, 'y': 2.0}]
+            loader._ndexextra.extract_layout_aspect_from_cx = \
+                MagicMock(return_value=layout)
+            net = NiceCXNetwork()
+            net.create_edge(net.create_node('a'), net.create_node('b'))
+            cache_file = loader._get_layout_cache_file(net)
+            os.makedirs(p.layoutcache)
+            with open(cache_file, 'w') as f:
+                f.write('[{"node": 0, "x"')
 
+            # truncated cache is treated as a miss and overwritten
+            loader._apply_cytoscape_layout(net)
+            self.assertEqual(layout, net.get_opaque_aspect('cartesianLayout'))
+            self.assertEqual(1, mockpy4.layout_network.call_count)
+            with open(cache_file, 'r') as f:
+                self.assertEqual(layout, json.load(f))
+            self.assertEqual([os.path.basename(cache_file)],
+                             os.listdir(p.layoutcache))
+        finally:
+            shutil.rmtree(temp_dir)
 
+    def test_get_layout_cache_file(self):
+        p = MagicMock()
+        p.layout = 'grid'
+        p.layoutcache = None
+        loader = NDExNciPidLoader(p)
+        net = NiceCXNetwork()
+        net.create_edge(net.create_node('a'), net.create_node('b'))
+        self.assertIsNone(loader._get_layout_cache_file(net))
+
+        p.layoutcache = '/foo'
+        cache_file = loader._get_layout_cache_file(net)
+        self.assertTrue(cache_file.startswith('/foo/'))
+        self.assertTrue(cache_file.endswith('.json'))
+
+        # different layout or topology gives a different file
+        p.layout = 'circular'
+        self.assertNotEqual(cache_file, loader._get_layout_cache_file(net))
+        p.layout = 'grid'
+        net.create_edge(0, 0)
+        self.assertNotEqual(cache_file, loader._get_layout_cache_file(net))
+
+    def _run_parallel(self, layout, networkupdators=None):
+        temp_dir = tempfile.mkdtemp()
+        try:
+            for name in ['a.sif', 'b.sif', 'c.sif']:
+                open(os.path.join(temp_dir, name), 'w').close()
+            p = Param()
+            p.sifdir = temp_dir
+            p.singlefile = None
+            p.numworkers = 2
+            p.layout = layout
+            loader = ParallelRunLoader(p, networkupdators=networkupdators)
+            with mock.patch('sys.stdout', new_callable=io.StringIO) as out:
+                self.assertEqual(0, loader.run())
+            return loader, out.getvalue()
+        finally:
+            shutil.rmtree(temp_dir)
+
+    def _run_parallel_spawn(self, layout):
+        if 'spawn' not in multiprocessing.get_all_start_methods():
+            self.skipTest('requires spawn start method')
+        ctx = multiprocessing.get_context('spawn')
+        try:
+            ProcessPoolExecutor(max_workers=1, mp_context=ctx).shutdown()
+        except TypeError:
+            self.skipTest('mp_context requires python 3.7 or later')
+        with mock.patch.object(ndexloadncipid, 'ProcessPoolExecutor',
+                               functools.partial(ProcessPoolExecutor,
+                                                 mp_context=ctx)):
+            return self._run_parallel(layout)
+
+    def test_run_numworkers_saves_in_workers(self):
+        loader, out = self._run_parallel('spring')
+        for name in ['a.sif', 'b.sif', 'c.sif']:
+            self.assertTrue(name in out)
+        clients = set(re.findall(r'client-[0-9]+', out))
+        self.assertTrue(len(clients) >= 1)
+
+        # workers did not reuse NDEx client of this process
+        self.assertEqual('client-' + str(os.getpid()), loader._ndex)
+        self.assertFalse(loader._ndex in clients)
+
+    def test_run_numworkers_cytoscape_layout_saves_here(self):
+        loader, out = self._run_parallel('grid')
+        for name in ['a.sif', 'b.sif', 'c.sif']:
+            self.assertTrue(name in out)
+
+        # networks are built in workers but saved with this process client
+        self.assertEqual({'client-' + str(os.getpid())},
+                         set(re.findall(r'client-[0-9]+', out)))
+
+    def test_run_numworkers_spawn_saves_in_workers(self):
+        loader, out = self._run_parallel_spawn('spring')
+        for name in ['a.sif', 'b.sif', 'c.sif']:
+            self.assertTrue(name in out)
+        clients = set(re.findall(r'client-[0-9]+', out))
+        self.assertTrue(len(clients) >= 1)
+        self.assertFalse(loader._ndex in clients)
+
+    def test_run_numworkers_cytoscape_layout_spawn(self):
+        loader, out = self._run_parallel_spawn('grid')
+        for name in ['a.sif', 'b.sif', 'c.sif']:
+            self.assertTrue(name in out)
+        self.assertEqual({'client-' + str(os.getpid())},
+                         set(re.findall(r'client-[0-9]+', out)))
+
+    def test_run_numworkers_merges_gene_symbols_from_workers(self):
+        for layout in ['spring', 'grid']:
+            searcher = PrefixSymbolSearcher(bclient=MagicMock())
+            updator = UniProtToGeneSymbolUpdater(searcher=searcher)
+            loader, out = self._run_parallel(layout,
+                                             networkupdators=[updator])
+            self.assertEqual({'a.sif': 'SYMa.sif',
+                              'b.sif': 'SYMb.sif',
+                              'c.sif': 'SYMc.sif'}, searcher._cache)
+
+            # symbols were looked up in workers, not here
+            self.assertEqual({}, searcher.pop_new_symbols())
+
+    def test_getstate(self):
+        p = Param()
+        p.numworkers = 2
+        loader = ParallelRunLoader(p, ndexextra=MagicMock())
+        loader._ndex = 'client'
+        loader._template = {'template': 'big'}
+        loader._netattrib = {'attrib': 'big'}
+        loader._user = 'bob'
+        res = pickle.loads(pickle.dumps(loader))
+        self.assertEqual(None, res._ndex)
+        self.assertEqual(None, res._ndexextra)
+        self.assertEqual(None, res._py4)
+        self.assertEqual(None, res._template)
+        self.assertEqual(None, res._netattrib)
+        self.assertEqual('bob', res._user)
+        self.assertEqual(2, res._args.numworkers)
+
+        # original is unchanged
+        self.assertEqual('client', loader._ndex)
+        self.assertEqual({'template': 'big'}, loader._template)
+
+    def test_pop_new_symbols_and_add_symbols(self):
+        loader = NDExNciPidLoader(None)
+        self.assertEqual(None, loader._pop_new_symbols())
+        loader._add_symbols([{'p1': 'ABC'}])
+
+        one = MagicMock()
+        one.pop_new_symbols = MagicMock(return_value={'p1': 'ABC'})
+        two = MagicMock()
+        two.pop_new_symbols = MagicMock(return_value=None)
+        loader = NDExNciPidLoader(None, networkupdators=[one, two])
+        self.assertEqual([{'p1': 'ABC'}, None], loader._pop_new_symbols())
+        loader._add_symbols(None)
+        loader._add_symbols([{'p2': 'DEF'}, None])
+        one.add_symbols.assert_called_once_with({'p2': 'DEF'})
+        two.add_symbols.assert_not_called()
+
+    def test_load_network_summaries_for_user(self):
+        loader = NDExNciPidLoader(None)
+        loader._user = 'bob'
+        loader._ndex = MagicMock()
+        summaries = [{'name': 'Foo', 'externalId': '1'},
+                     {'externalId': '2'},
+                     {'name': None, 'externalId': '3'},
+                     {'name': 'foo', 'externalId': '4'},
+                     {'name': 'Bar', 'externalId': '5'}]
+        get_summaries = MagicMock(return_value=summaries)
+        loader._ndex.get_network_summaries_for_user = get_summaries
+        loader._load_network_summaries_for_user()
+        self.assertEqual({'FOO': '4', 'BAR': '5'}, loader._net_summaries)
+        get_summaries.assert_called_once_with('bob')
+
+    def test_merge_node_attributes(self):
+        loader = NDExNciPidLoader(None)
+        net = NiceCXNetwork()
+        n_one = net.create_node('one')
+        net.set_node_attribute(n_one, 'x', 'keep')
+        net.set_node_attribute(n_one, 'PARTICIPANT_TYPE_B', 'ProteinReference',
+                               type='string')
+        n_two = net.create_node('two')
+        net.set_node_attribute(n_two, 'PARTICIPANT_TYPE_A', 'Complex',
+                               type='string')
+        net.set_node_attribute(n_two, 'PARTICIPANT_TYPE_B', 'Protein',
+                               type='string')
+        n_three = net.create_node('three')
+
+        issues = loader._merge_node_attributes(net, 'PARTICIPANT_TYPE_A',
+                                               'PARTICIPANT_TYPE_B', 'type')
+        self.assertEqual(['both attributes have valuesPARTICIPANT_TYPE_A => '
+                          'Complex and PARTICIPANT_TYPE_B => Protein'],
+                         issues)
+        self.assertEqual(['x', 'type'],
+                         [a['n'] for a in net.get_node_attributes(n_one)])
+        self.assertEqual('ProteinReference',
+                         net.get_node_attribute(n_one, 'type')['v'])
+        self.assertEqual(['type'],
+                         [a['n'] for a in net.get_node_attributes(n_two)])
+        self.assertEqual('Complex',
+                         net.get_node_attribute(n_two, 'type')['v'])
+        self.assertEqual(None, net.get_node_attributes(n_three))
+
+    def test_merge_node_attributes_passed_nodes(self):
+        loader = NDExNciPidLoader(None)
+        net = NiceCXNetwork()
+        n_one = net.create_node('one')
+        net.set_node_attribute(n_one, 'a', 'x', type='string')
+        n_two = net.create_node('two')
+        net.set_node_attribute(n_two, 'a', 'y', type='string')
+
+        # only nodes passed in are merged
+        nodes = [(n_two, net.get_node(n_two))]
+        self.assertEqual([], loader._merge_node_attributes(net, 'a', 'b',
+                                                           'c', nodes=nodes))
+        self.assertEqual('x', net.get_node_attribute(n_one, 'a')['v'])
+        self.assertEqual(None, net.get_node_attribute(n_two, 'a'))
+        self.assertEqual('y', net.get_node_attribute(n_two, 'c')['v'])
+
+    def test_merge_node_attribute_pairs(self):
+        loader = NDExNciPidLoader(None)
+        net = NiceCXNetwork()
+        n_one = net.create_node('one')
+        net.set_node_attribute(n_one, 'alias_b', ['x'],
+                               type='list_of_string')
+        net.set_node_attribute(n_one, 'PARTICIPANT_TYPE_A', 'Complex',
+                               type='string')
+        net.set_node_attribute(n_one, 'PARTICIPANT_TYPE_B', 'Protein',
+                               type='string')
+        n_two = net.create_node('two')
+        net.set_node_attribute(n_two, 'x', 'keep')
+
+        merges = [('alias_a', 'alias_b', 'alias'),
+                  ('PARTICIPANT_TYPE_A', 'PARTICIPANT_TYPE_B', 'type')]
+        res = loader._merge_node_attribute_pairs(net, merges)
+        self.assertEqual([[],
+                          ['both attributes have valuesPARTICIPANT_TYPE_A => '
+                           'Complex and PARTICIPANT_TYPE_B => Protein']], res)
+        self.assertEqual(['alias', 'type'],
+                         [a['n'] for a in net.get_node_attributes(n_one)])
+        self.assertEqual(['x'], net.get_node_attribute(n_one, 'alias')['v'])
+        self.assertEqual('Complex',
+                         net.get_node_attribute(n_one, 'type')['v'])
+        self.assertEqual(['x'],
+                         [a['n'] for a in net.get_node_attributes(n_two)])
+
+    def test_merge_node_attributes_replaces_target(self):
+        loader = NDExNciPidLoader(None)
+        net = NiceCXNetwork()
+        n_one = net.create_node('one')
+        net.set_node_attribute(n_one, 'type', 'old', type='string')
+        net.set_node_attribute(n_one, 'x', 'keep')
+        net.set_node_attribute(n_one, 'PARTICIPANT_TYPE_A', 'Complex',
+                               type='string')
+        self.assertEqual([],
+                         loader._merge_node_attributes(net,
+                                                       'PARTICIPANT_TYPE_A',
+                                                       'PARTICIPANT_TYPE_B',
+                                                       'type'))
+        self.assertEqual([{'po': n_one, 'n': 'x', 'v': 'keep'},
+                          {'po': n_one, 'n': 'type', 'v': 'Complex',
+                           'd': 'string'}],
+                         net.get_node_attributes(n_one))
@@ -0,0 +1,107 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""Tests for `PaxtoolsRunner` class."""
+
+import os
+import tempfile
+import shutil
+import subprocess
+
+import unittest
+import mock
+from mock import MagicMock
+
+from ndexncipidloader.ndexloadncipid import PaxtoolsRunner
+
+
+class TestPaxtoolsRunner(unittest.TestCase):
+    """Tests for `PaxtoolsRunner` class."""
+
+    def setUp(self):
+        """Set up test fixtures, if any."""
+
+    def tearDown(self):
+        """Tear down test fixtures, if any."""
+
+    def test_run_paxtool_success(self):
+        paxy = PaxtoolsRunner('ftpdir', 'outdir', 'paxtools.jar')
+        proc = MagicMock()
+        proc.returncode = 0
+        with mock.patch('subprocess.run',
+                        return_value=proc) as mock_run:
+            paxy._run_paxtool('foo.owl', 'foo.sif')
+            cmd = mock_run.call_args[0][0]
+            self.assertEqual(['java', '-jar', 'paxtools.jar', 'toSIF',
+                              'foo.owl', 'foo.sif'], cmd[:6])
+            self.assertEqual(subprocess.DEVNULL,
+                             mock_run.call_args[1]['stdout'])
+            self.assertEqual(subprocess.PIPE,
+                             mock_run.call_args[1]['stderr'])
+
+    def test_run_paxtool_nonzero_exit(self):
+        paxy = PaxtoolsRunner('ftpdir', 'outdir', 'paxtools.jar')
+        proc = MagicMock()
+        proc.returncode = 1
+        proc.stderr = b'some error'
+        with mock.patch('subprocess.run', return_value=proc):
+            with mock.patch('ndexncipidloader.ndexloadncipid.'
+                            'logger') as mock_logger:
+                paxy._run_paxtool('foo.owl', 'foo.sif')
+                self.assertTrue('some error' in
+                                mock_logger.error.call_args[0][0])
+
+    def test_run_paxtool_nonzero_exit_removes_partial_sif(self):
+        temp_dir = tempfile.mkdtemp()
+        try:
+            paxy = PaxtoolsRunner(temp_dir, temp_dir, 'paxtools.jar')
+            siffile = os.path.join(temp_dir, 'foo.sif')
+            with open(siffile, 'w') as f:
+                f.write('A\tneighbor-of\n')
+            proc = MagicMock()
+            proc.returncode = 1
+            proc.stderr = b'some error'
+            with mock.patch('subprocess.run', return_value=proc):
+                paxy._run_paxtool(os.path.join(temp_dir, 'foo.owl'),
+                                  siffile)
+            self.assertFalse(os.path.isfile(siffile))
+        finally:
+            shutil.rmtree(temp_dir)
+
+    def test_run_paxtools_skips_existing_sif(self):
+        temp_dir = tempfile.mkdtemp()
+        try:
+            open(os.path.join(temp_dir, 'a.owl'), 'w').close()
+            open(os.path.join(temp_dir, 'a.sif'), 'w').close()
+            open(os.path.join(temp_dir, 'b.owl'), 'w').close()
+            open(os.path.join(temp_dir, 'c.txt'), 'w').close()
+            paxy = PaxtoolsRunner(temp_dir, temp_dir, 'paxtools.jar')
+            paxy._run_paxtool = MagicMock()
+            paxy.run_paxtools()
+            paxy._run_paxtool.assert_called_once_with(
+                os.path.join(temp_dir, 'b.owl'),
+                os.path.join(temp_dir, 'b.sif'))
+        finally:
+            shutil.rmtree(temp_dir)
+
+    def test_convert_owl_file(self):
+        temp_dir = tempfile.mkdtemp()
+        try:
+            paxy = PaxtoolsRunner(temp_dir, temp_dir, 'paxtools.jar')
+            paxy._run_paxtool = MagicMock()
+
+            # not an owl file
+            self.assertFalse(paxy.convert_owl_file(os.path.join(temp_dir,
+                                                                'a.txt')))
+            # sif file already exists
+            open(os.path.join(temp_dir, 'a.sif'), 'w').close()
+            self.assertFalse(paxy.convert_owl_file(os.path.join(temp_dir,
+                                                                'a.owl')))
+            paxy._run_paxtool.assert_not_called()
+
+            owlfile = os.path.join(temp_dir, 'b.owl')
+            self.assertTrue(paxy.convert_owl_file(owlfile))
+            paxy._run_paxtool.assert_called_once_with(
+                owlfile, os.path.join(temp_dir, 'b.sif'))
+        finally:
+            shutil.rmtree(temp_dir)
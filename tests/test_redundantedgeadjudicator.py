@@ -74,5 +74,120 @@ class TestRedundantEdgeAdjudicator(unittest.TestCase):
         adjud = RedundantEdgeAdjudicator()
         self.assertEqual(['Network passed in is None'], adjud.update(None))
 
+    def test_remove_if_redundant(self):
+        net = NiceCXNetwork()
+        adjud = RedundantEdgeAdjudicator()
+        # subsumed by controls-expression-of edge
+        cscid = net.create_edge(edge_source=0, edge_target=1,
+                                edge_interaction='controls-state-change-of')
+        ceid = net.create_edge(edge_source=0, edge_target=1,
+                               edge_interaction='controls-expression-of')
+        # different direction so not subsumed
+        otherid = net.create_edge(edge_source=1, edge_target=0,
+                                  edge_interaction='controls-state-change-of')
+        # not a control interaction so does not subsume
+        nid = net.create_edge(edge_source=1, edge_target=0,
+                              edge_interaction='neighbor-of')
+        adjud._remove_if_redundant(net)
+        self.assertEqual(None, net.get_edge(cscid))
+        self.assertEqual('controls-expression-of', net.get_edge(ceid)['i'])
+        self.assertEqual('controls-state-change-of',
+                         net.get_edge(otherid)['i'])
+        self.assertEqual('neighbor-of', net.get_edge(nid)['i'])
+
+    def test_build_pair_index(self):
+        net = NiceCXNetwork()
+        adjud = RedundantEdgeAdjudicator()
+        net.create_edge(edge_source=0, edge_target=1,
+                        edge_interaction='controls-state-change-of')
+        net.create_edge(edge_source=0, edge_target=1,
+                        edge_interaction='controls-transport-of')
+        net.create_edge(edge_source=2, edge_target=3,
+                        edge_interaction='controls-state-change-of')
+        net.create_edge(edge_source=2, edge_target=3,
+                        edge_interaction='neighbor-of')
+        edge_map, candidate_keys = adjud._build_pair_index(net)
+        self.assertEqual(2, len(edge_map['0_1']))
+        self.assertEqual(2, len(edge_map['2_3']))
+        self.assertEqual(set(['0_1']), candidate_keys)
+
+    def test_remove_orphan_nodes(self):
+        net = NiceCXNetwork()
+        adjud = RedundantEdgeAdjudicator()
+        src = net.create_node('src')
+        tgt = net.create_node('tgt')
+        orphan = net.create_node('orphan')
+        net.set_node_attribute(orphan, 'foo', 'bar')
+        net.create_edge(edge_source=src, edge_target=tgt,
+                        edge_interaction='foo')
+        adjud._remove_orphan_nodes(net)
+        self.assertEqual(None, net.get_node(orphan))
+        self.assertEqual('src', net.get_node(src)['n'])
+        self.assertEqual('tgt', net.get_node(tgt)['n'])
+        self.assertTrue(orphan not in net.nodeAttributes)
+
+    def test_remove_node_edges(self):
+        net = NiceCXNetwork()
+        adjud = RedundantEdgeAdjudicator()
+        one = net.create_edge(edge_source=0, edge_target=1,
+                              edge_interaction='foo')
+        two = net.create_edge(edge_source=2, edge_target=0,
+                              edge_interaction='foo')
+        three = net.create_edge(edge_source=1, edge_target=2,
+                                edge_interaction='foo')
+        index = adjud._build_node_edge_index(net)
+        self.assertEqual(set([one, two]), index[0])
+        self.assertEqual(set([one, three]), index[1])
+
+        adjud._remove_node_edges(net, 0, index=index)
+        self.assertEqual(None, net.get_edge(one))
+        self.assertEqual(None, net.get_edge(two))
+        self.assertEqual('foo', net.get_edge(three)['i'])
+        self.assertTrue(0 not in index)
+        self.assertEqual(set([three]), index[1])
+        self.assertEqual(set([three]), index[2])
+
+        # no index passed in
+        adjud._remove_node_edges(net, 2)
+        self.assertEqual(None, net.get_edge(three))
+
+    def test_remove_node(self):
+        net = NiceCXNetwork()
+        adjud = RedundantEdgeAdjudicator()
+        nodeid = net.create_node('foo')
+        # node without attributes
+        adjud._remove_node(net, nodeid)
+        self.assertEqual(None, net.get_node(nodeid))
+
+        nodeid = net.create_node('bar')
+        net.set_node_attribute(nodeid, 'attr1', 'someval')
+        adjud._remove_node(net, nodeid)
+        self.assertEqual(None, net.get_node(nodeid))
+        self.assertTrue(nodeid not in net.nodeAttributes)
 
+        # nonexistant node
+        adjud._remove_node(net, 12345)
 
+    def test_remove_edges(self):
+        net = NiceCXNetwork()
+        adjud = RedundantEdgeAdjudicator()
+        one = net.create_edge(edge_source=0, edge_target=1,
+                              edge_interaction='foo')
+        net.set_edge_attribute(one, 'attr1', 'someval')
+        two = net.create_edge(edge_source=1, edge_target=2,
+                              edge_interaction='foo')
+        self.assertEqual(1, adjud._remove_edges(net, [one, 12345]))
+        self.assertEqual(None, net.get_edge(one))
+        self.assertEqual((None, None), net.get_edge_attribute(one, 'attr1'))
+        self.assertEqual('foo', net.get_edge(two)['i'])
+        self.assertEqual(0, adjud._remove_edges(net, []))
+
+    def test_edge_map_not_shared_or_kept(self):
+        adjud = RedundantEdgeAdjudicator()
+        other = RedundantEdgeAdjudicator()
+        self.assertFalse(adjud._edge_map is other._edge_map)
+        net = NiceCXNetwork()
+        net.create_edge(edge_source=0, edge_target=1,
+                        edge_interaction='foo')
+        adjud._remove_if_redundant(net)
+        self.assertEqual({}, adjud._edge_map)
@@ -88,3 +88,11 @@ class TestUniProtToGeneSymbolUpdater(unittest.TestCase):
         self.assertEqual('uniprot:bob', net.get_node(nodeone)['r'])
 
         mock.get_symbol.assert_called_with('bob')
+
+    def test_pop_new_symbols_and_add_symbols(self):
+        searcher = MagicMock()
+        searcher.pop_new_symbols = MagicMock(return_value={'p1': 'ABC'})
+        updater = UniProtToGeneSymbolUpdater(searcher=searcher)
+        self.assertEqual({'p1': 'ABC'}, updater.pop_new_symbols())
+        updater.add_symbols({'p2': 'DEF'})
+        searcher.add_symbols.assert_called_once_with({'p2': 'DEF'})